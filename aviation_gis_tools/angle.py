@@ -1,15 +1,120 @@
+import functools
 import math
 import re
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
 
 # Angle types
 AT_LONGITUDE = 'AT_LONGITUDE '
 AT_LATITUDE = 'AT_LATITUDE'
+AT_BEARING = 'AT_BEARING'
 
 # Angle formats
 AF_DMSH_SPACE_SEP = 'AF_DMSH_SPACE_SEP'  # e.g.: 55 22 43.47N
 AF_DMSH_HYPHEN_SEP = 'AF_DMSH_HYPHEN_SEP'  # e.g.: 55-2-43.47N
 AF_HDMS_SPACE_SEP = 'AF_HDMS_SPACE_SEP'  # e.g.: N55 22 43.47
 AF_HDMS_HYPHEN_SEP = 'AF_HDMS_HYPHEN_SEP'  # e.g.: N55-22-43.47
+AF_DMSH_COMPACTED = 'AF_DMSH_COMPACTED'  # e.g.: 552243.47N
+AF_HDMS_COMPACTED = 'AF_HDMS_COMPACTED'  # e.g.: N552243.47
+
+# Error codes of the bulk parsing
+PARSE_OK = 0
+PARSE_ERR_REQUIRED = 1  # Empty value
+PARSE_ERR_FORMAT = 2  # Not supported format
+PARSE_ERR_RANGE = 3  # Supported format, value out of range
+
+# Result of the bulk parsing: dd - float64 array (NaN if error), err_code and fmt (format code) - int8 arrays
+parsed_angles = namedtuple('ParsedAngles', ['dd', 'err_code', 'fmt'])
+
+cache_info = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class AngleCache:
+    """ Thread safe LRU cache of parsed angles, keyed by angle type and source (not normalized) value. """
+
+    def __init__(self, maxsize=0):
+        """
+        :param maxsize: int, maximum number of cached angles, 0 - cache disabled
+        """
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def configure(self, maxsize):
+        """ Set maximum size of the cache, the least recently used angles over the maxsize are evicted.
+        :param maxsize: int, maximum number of cached angles, 0 - cache disabled
+        """
+        if maxsize < 0:
+            raise ValueError('Cache size can not be negative.')
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._cache) > maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """ Remove all cached angles and reset statistics. """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """ Return cache statistics.
+        :return: cache_info
+        """
+        with self._lock:
+            return cache_info(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def get_or_parse(self, ang_src, ang_type, parse_func):
+        """ Return cached result of the parse_func for given angle, parse and cache angle if not cached.
+        :param ang_src: str, angle source value
+        :param ang_type: str, angle type, e.g. AT_LONGITUDE, AT_BEARING
+        :param parse_func: function that takes normalized angle and returns result to cache
+        :return: result of the parse_func
+        """
+        if not self._maxsize:
+            return parse_func(Angle.normalize_angle(ang_src))
+
+        key = (ang_type, ang_src)
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self._misses += 1
+
+        result = parse_func(Angle.normalize_angle(ang_src))
+        with self._lock:
+            if self._maxsize:
+                self._cache[key] = result
+                if len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+        return result
+
+
+# Process wide cache of the parsed angles, disabled by default, see enable_angle_cache
+angle_cache = AngleCache()
+
+
+def enable_angle_cache(maxsize=100000):
+    """ Enable process wide cache of the parsed coordinates and bearings.
+    :param maxsize: int, maximum number of cached angles
+    """
+    angle_cache.configure(maxsize)
+
+
+def disable_angle_cache():
+    """ Disable and clear process wide cache of the parsed coordinates and bearings. """
+    angle_cache.configure(0)
+    angle_cache.clear()
+
 
 # Angle string representation formats
 ANGLE_FORMAT_PATTERNS = {
@@ -18,16 +123,34 @@ ANGLE_FORMAT_PATTERNS = {
         AF_DMSH_HYPHEN_SEP: '{d:03d}-{m:02d}-{s:0{sec_length}.{sec_prec}f}{hem}',
         AF_HDMS_SPACE_SEP: '{hem}{d:03d} {m:02d} {s:0{sec_length}.{sec_prec}f}',
         AF_HDMS_HYPHEN_SEP: '{hem}{d:03d}-{m:02d}-{s:0{sec_length}.{sec_prec}f}',
+        AF_DMSH_COMPACTED: '{d:03d}{m:02d}{s:0{sec_length}.{sec_prec}f}{hem}',
+        AF_HDMS_COMPACTED: '{hem}{d:03d}{m:02d}{s:0{sec_length}.{sec_prec}f}',
     },
     AT_LATITUDE: {
         AF_DMSH_SPACE_SEP: '{d:02d} {m:02d} {s:0{sec_length}.{sec_prec}f}{hem}',
         AF_DMSH_HYPHEN_SEP: '{d:02d}-{m:02d}-{s:0{sec_length}.{sec_prec}f}{hem}',
         AF_HDMS_SPACE_SEP: '{hem}{d:02d} {m:02d} {s:0{sec_length}.{sec_prec}f}',
         AF_HDMS_HYPHEN_SEP: '{hem}{d:02d}-{m:02d}-{s:0{sec_length}.{sec_prec}f}',
+        AF_DMSH_COMPACTED: '{d:02d}{m:02d}{s:0{sec_length}.{sec_prec}f}{hem}',
+        AF_HDMS_COMPACTED: '{hem}{d:02d}{m:02d}{s:0{sec_length}.{sec_prec}f}',
     }
 }
 
 
+@functools.lru_cache(maxsize=None)
+def get_dms_template(ang_type, dms_format, prec):
+    """ Return DMS format pattern with resolved seconds length and precision, e.g. '{d:03d} {m:02d} {s:06.3f}{hem}',
+    computed once per angle type, format and precision.
+    :param ang_type: str, angle type
+    :param dms_format: str, format of angle in DMS format
+    :param prec: int, positive number of decimal point of seconds
+    :return: str
+    """
+    sec_length = prec + 3 if prec > 0 else 2
+    return ANGLE_FORMAT_PATTERNS[ang_type][dms_format].replace('{sec_length}', str(sec_length)).replace(
+        '{sec_prec}', str(prec))
+
+
 class Angle:
 
     def __init__(self): pass
@@ -53,7 +176,7 @@ class Angle:
             minutes += 1
             # Ensure that minutes are not >= 60
             if minutes >= 60:
-                minutes += 0
+                minutes = 0
                 degrees += 1
 
         return degrees, minutes, seconds
@@ -88,14 +211,36 @@ class Angle:
         def sign(a_dd): return 1 if a_dd >= 0 else -1
         d, m, s = Angle.get_dms_parts(ang_dd, prec)
         hem = Angle.get_hemisphere_character(sign(ang_dd), ang_type)
+        return get_dms_template(ang_type, dms_format, prec).format(d=d, m=m, s=s, hem=hem)
 
-        if prec > 0:
-            sec_length = prec + 3
-        else:
-            sec_length = 2
+    @staticmethod
+    def format_many(values, ang_type, dms_format=AF_DMSH_SPACE_SEP, prec=3, sep=None):
+        """ Convert sequence of angles from DD format into DMS format.
+        Seconds are rounded once, as integer number of 10^-prec seconds, so carry into minutes and degrees
+        is exact.
+        :param values: iterable of floats, angles in DD
+        :param ang_type: str, angle type
+        :param dms_format: str, desired format of angle in DMS format
+        :param prec: int, positive number of decimal point of seconds
+        :param sep: str, if given angles are joined with separator into one string
+        :return: list of str or str (sep given): angles in DMS format
+        """
+        template = get_dms_template(ang_type, dms_format, prec).format
+        hem_positive = Angle.get_hemisphere_character(1, ang_type)
+        hem_negative = Angle.get_hemisphere_character(-1, ang_type)
+        scale = 10 ** prec
+        sec_units_per_degree = 3600 * scale
+        sec_units_per_minute = 60 * scale
 
-        dms_format_pattern = ANGLE_FORMAT_PATTERNS[ang_type][dms_format]
-        return dms_format_pattern.format(d=d, m=m, s=s, sec_length=sec_length, sec_prec=prec, hem=hem)
+        result = []
+        for ang_dd in values:
+            d, sec_units = divmod(round(math.fabs(ang_dd) * sec_units_per_degree), sec_units_per_degree)
+            m, sec_units = divmod(sec_units, sec_units_per_minute)
+            result.append(template(d=d, m=m, s=sec_units / scale, hem=hem_positive if ang_dd >= 0 else hem_negative))
+
+        if sep is not None:
+            return sep.join(result)
+        return result
 
     @staticmethod
     def normalize_angle(ang_src):
@@ -106,6 +251,34 @@ class Angle:
         norm_ang = re.sub(r'\s+', ' ', norm_ang)
         return norm_ang
 
+    @staticmethod
+    def parse_many_with(values, ang_type, parse_func, formats):
+        """ Parse sequence of angles without creating angle object for each value.
+        :param values: iterable of str, angle source values, None is considered as empty value
+        :param ang_type: str, angle type, e.g. AT_LONGITUDE, AT_BEARING
+        :param parse_func: function that takes normalized angle and returns tuple of dd (float or None)
+                           and detected format (str or None)
+        :param formats: tuple of str, supported formats, format code is index of format in formats + 1,
+                        0 - format not detected
+        :return: parsed_angles
+        """
+        format_codes = {ang_format: code for code, ang_format in enumerate(formats, 1)}
+        result = parsed_angles(array('d'), array('b'), array('b'))
+        for value in values:
+            if value is None or not value.strip():
+                dd, err_code, format_code = math.nan, PARSE_ERR_REQUIRED, 0
+            else:
+                dd, ang_format = angle_cache.get_or_parse(value, ang_type, parse_func)
+                format_code = format_codes.get(ang_format, 0)
+                if dd is not None:
+                    err_code = PARSE_OK
+                else:
+                    dd, err_code = math.nan, PARSE_ERR_RANGE if format_code else PARSE_ERR_FORMAT
+            result.dd.append(dd)
+            result.err_code.append(err_code)
+            result.fmt.append(format_code)
+        return result
+
     @staticmethod
     def dmsh_parts_to_dd(dmsh_parts):
         """ Convert coordinates parts into degrees minutes format.
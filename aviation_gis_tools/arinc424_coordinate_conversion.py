@@ -1,8 +1,24 @@
 """
 Support for conversion among full degrees coordinates and ARINC424 "shorthand system".
 """
-
+import functools
+import math
 import re
+from array import array
+from collections import namedtuple
+
+from aviation_gis_tools.angle import PARSE_OK, PARSE_ERR_REQUIRED, PARSE_ERR_FORMAT, PARSE_ERR_RANGE
+
+# Lookup tables for conversion, built at first use:
+# longitudes: full degrees longitude, e.g. '160W' -> (two last digits, hemisphere, True if >= 100)
+# latitudes: full degrees latitude, e.g. '50N' -> (two digits, hemisphere)
+# lon_parts: (longitude part of code, True if code for longitude >= 100) -> longitude degrees
+# lat_parts: latitude part of code -> latitude degrees
+lookup_tables = namedtuple('Arinc424LookupTables', ['longitudes', 'latitudes', 'lon_parts', 'lat_parts'])
+
+# Results of bulk conversions, err_code - int8 array of PARSE_* codes
+arinc424_codes = namedtuple('Arinc424Codes', ['codes', 'err_code'])
+arinc424_coordinates = namedtuple('Arinc424Coordinates', ['coordinates', 'lon', 'lat', 'err_code'])
 
 
 class Arinc424CoordinatesConversion:
@@ -41,6 +57,30 @@ class Arinc424CoordinatesConversion:
                                                       ''', re.VERBOSE)
     }
 
+    # Memoized conversions of valid coordinates and ARINC424 codes, see encode_arinc424, decode_arinc424
+    _encoded_coordinates = {}
+    _decoded_codes = {}
+
+    # Format only patterns, used to tell out of range values from not supported formats
+    REGEX_COORD_PAIR_FORMAT = re.compile(r'^\d{3}[EW]\d{2}[NS]$')
+    REGEX_ARINC424_FORMAT = re.compile(r'^\d{2}(?:\d{2}[NSEW]|[NSEW]\d{2})$')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_lookup_tables():
+        """ Return lookup tables for conversion in both directions, built once.
+        :return: lookup_tables
+        """
+        longitudes = {}
+        for lon in range(181):
+            for hem in 'EW':
+                longitudes['{:03d}{}'.format(lon, hem)] = ('{:03d}'.format(lon)[1:], hem, lon >= 100)
+        latitudes = {'{:02d}{}'.format(lat, hem): ('{:02d}'.format(lat), hem) for lat in range(91) for hem in 'NS'}
+        lon_parts = {('{:02d}'.format(lon), False): lon for lon in range(100)}
+        lon_parts.update({('{:02d}'.format(lon), True): 100 + lon for lon in range(81)})
+        lat_parts = {'{:02d}'.format(lat): lat for lat in range(91)}
+        return lookup_tables(longitudes, latitudes, lon_parts, lat_parts)
+
     @staticmethod
     def is_longitude_full_dh(lon):
         """ Check if longitude is in full DH format.
@@ -80,6 +120,36 @@ class Arinc424CoordinatesConversion:
         else:
             return Arinc424CoordinatesConversion.PATTERN_LONGITUDE_EQUAL_GRATER_HUNDRED
 
+    @staticmethod
+    def encode_arinc424(lon, lat):
+        """ Convert full degrees coordinates to ARINC424 format, using lookup tables.
+        Conversions of valid coordinates are memoized, there are 131404 of them at most.
+        :param lon: str, longitude in DH format
+        :param lat: str, latitude in DH format
+        :return: tuple(str, int): coordinates in ARINC424 format (None if conversion failed), PARSE_* error code
+        """
+        encoded = Arinc424CoordinatesConversion._encoded_coordinates.get((lon, lat))
+        if encoded is not None:
+            return encoded
+        if not lon or not lat:
+            return None, PARSE_ERR_REQUIRED
+        tables = Arinc424CoordinatesConversion.get_lookup_tables()
+        lon_parts = tables.longitudes.get(lon)
+        lat_parts = tables.latitudes.get(lat)
+        if lon_parts is None or lat_parts is None:
+            if Arinc424CoordinatesConversion.REGEX_COORD_PAIR_FORMAT.match(lon + lat):
+                return None, PARSE_ERR_RANGE
+            return None, PARSE_ERR_FORMAT
+        lon_digits, lon_hem, hundreds = lon_parts
+        lat_digits, lat_hem = lat_parts
+        letter = Arinc424CoordinatesConversion.ARINC424_LETTERS[lat_hem + lon_hem]
+        if hundreds:
+            encoded = lat_digits + letter + lon_digits, PARSE_OK
+        else:
+            encoded = lat_digits + lon_digits + letter, PARSE_OK
+        Arinc424CoordinatesConversion._encoded_coordinates[(lon, lat)] = encoded
+        return encoded
+
     @staticmethod
     def coord_to_arinc424(lon, lat):
         """ Convert full degrees coordinates to ARINC424 format.
@@ -87,14 +157,20 @@ class Arinc424CoordinatesConversion:
         :param lat: str, latitude in DMH format
         :return: str: full degrees coordinates in ARINC424 format
         """
-        if Arinc424CoordinatesConversion.is_longitude_full_dh(lon) and \
-           Arinc424CoordinatesConversion.is_latitude_full_dh(lat):
-            hems = Arinc424CoordinatesConversion.get_hemispheres_from_coord_pair(lon, lat)
-            arinc424_letter = Arinc424CoordinatesConversion.ARINC424_LETTERS[hems]
-            arinc424_format = Arinc424CoordinatesConversion.get_arinc424_format_pattern(lon)
-            lon = lon[1:3]
-            lat = lat[:2]
-            return arinc424_format.format(lat=lat, lon=lon, letter=arinc424_letter)
+        return Arinc424CoordinatesConversion.encode_arinc424(lon, lat)[0]
+
+    @staticmethod
+    def coords_to_arinc424_many(coord_pairs):
+        """ Convert sequence of full degrees coordinates pairs into ARINC424 format.
+        :param coord_pairs: iterable of tuples (lon, lat), coordinates in DH format
+        :return: arinc424_codes: codes - list of str (None if conversion failed), err_code - array of PARSE_* codes
+        """
+        result = arinc424_codes([], array('b'))
+        for lon, lat in coord_pairs:
+            code, err_code = Arinc424CoordinatesConversion.encode_arinc424(lon, lat)
+            result.codes.append(code)
+            result.err_code.append(err_code)
+        return result
 
     @staticmethod
     def is_lon_lat_arinc424_code_within_range(lon, lat):
@@ -103,21 +179,45 @@ class Arinc424CoordinatesConversion:
         :param lat: str, latitude part from ARINC424 code
         :return: bool:
         """
-        msg = ''
-        is_within_range = True
-
-        if int(lon) > 80:
-            is_within_range = False
-            msg = 'Longitude part can\'t be grater the 80. '
+        return int(lon) <= 80 and int(lat) <= 90
 
-        if int(lat) > 90:
-            is_within_range = False
-            msg += 'Latitude part can\'t be grater the 90.'
+    @staticmethod
+    def decode_arinc424(arinc424):
+        """ Convert from ARINC424 shorthand format to full degrees, using lookup tables.
+        Conversions of valid codes are memoized, there are 65884 of them at most.
+        :param arinc424: str, coordinates in ARINC424 shorthand code
+        :return: tuple(str, float, float, int): coordinates in DMH format, e.g.: 16000W 5000N, longitude and
+                 latitude in DD format (None, nan, nan if conversion failed), PARSE_* error code
+        """
+        decoded = Arinc424CoordinatesConversion._decoded_codes.get(arinc424)
+        if decoded is not None:
+            return decoded
+        if not arinc424:
+            return None, math.nan, math.nan, PARSE_ERR_REQUIRED
 
-        if not is_within_range:
-            print(msg)
+        tables = Arinc424CoordinatesConversion.get_lookup_tables()
+        hemispheres = Arinc424CoordinatesConversion.HEMISPHERES
+        lon = lat = letter = None
+        if len(arinc424) == 5:
+            if arinc424[4] in hemispheres:
+                lon = tables.lon_parts.get((arinc424[2:4], False))
+                letter = arinc424[4]
+            elif arinc424[2] in hemispheres:
+                lon = tables.lon_parts.get((arinc424[3:5], True))
+                letter = arinc424[2]
+            lat = tables.lat_parts.get(arinc424[:2])
+        if lon is None or lat is None:
+            if Arinc424CoordinatesConversion.REGEX_ARINC424_FORMAT.match(arinc424):
+                return None, math.nan, math.nan, PARSE_ERR_RANGE
+            return None, math.nan, math.nan, PARSE_ERR_FORMAT
 
-        return is_within_range
+        lon_hem, lat_hem = hemispheres[letter]
+        decoded = ('{:03d}00{} {:02d}00{}'.format(lon, lon_hem, lat, lat_hem),
+                   float(-lon if lon_hem == 'W' else lon),
+                   float(-lat if lat_hem == 'S' else lat),
+                   PARSE_OK)
+        Arinc424CoordinatesConversion._decoded_codes[arinc424] = decoded
+        return decoded
 
     @staticmethod
     def arinc424_to_coordinates(arinc424):
@@ -125,16 +225,36 @@ class Arinc424CoordinatesConversion:
         :param arinc424: str, coordinates in ARINC424 shorthand code
         :return: str, coordinates in DMH format, e.g.: 16000W 5000N
         """
-        for regex in Arinc424CoordinatesConversion.REGEXES_ARINC424:
-            if Arinc424CoordinatesConversion.REGEXES_ARINC424.get(regex).match(arinc424):
-                groups = Arinc424CoordinatesConversion.REGEXES_ARINC424.get(regex).search(arinc424)
-                letter = groups.group('letter')
-                lat = groups.group('lat')
-                lon = groups.group('lon')
-
-                if Arinc424CoordinatesConversion.is_lon_lat_arinc424_code_within_range(lon, lat):
-                    lon_hem, lat_hem = Arinc424CoordinatesConversion.HEMISPHERES[letter]
-                    if regex == 'LONGITUDE_LESS_HUNDRED':
-                        return '0{}00{} {}00{}'.format(lon, lon_hem, lat, lat_hem)
-                    elif regex == 'LONGITUDE_EQUAL_GRATER_HUNDRED':
-                        return '1{}00{} {}00{}'.format(lon, lon_hem, lat, lat_hem)
+        return Arinc424CoordinatesConversion.decode_arinc424(arinc424)[0]
+
+    @staticmethod
+    def arinc424_to_coordinates_many(codes):
+        """ Convert sequence of ARINC424 shorthand codes into coordinates.
+        :param codes: iterable of str, coordinates in ARINC424 shorthand code
+        :return: arinc424_coordinates: coordinates - list of str in DMH format, e.g.: 16000W 5000N,
+                 lon, lat - arrays of floats, coordinates in DD format, err_code - array of PARSE_* codes.
+                 None, nan respectively if conversion failed.
+        """
+        result = arinc424_coordinates([], array('d'), array('d'), array('b'))
+        decode = Arinc424CoordinatesConversion.decode_arinc424
+        for code in codes:
+            coordinates, lon, lat, err_code = decode(code)
+            result.coordinates.append(coordinates)
+            result.lon.append(lon)
+            result.lat.append(lat)
+            result.err_code.append(err_code)
+        return result
+
+    @staticmethod
+    def get_err_msg(err_code):
+        """ Return error message for conversion error code.
+        :param err_code: int, PARSE_* error code
+        :return: str, empty if err_code is PARSE_OK
+        """
+        if err_code == PARSE_OK:
+            return ''
+        if err_code == PARSE_ERR_REQUIRED:
+            return 'Coordinates are required.'
+        if err_code == PARSE_ERR_RANGE:
+            return 'Longitude or latitude out of range.'
+        return 'Not supported format.'
@@ -0,0 +1,171 @@
+"""
+Streaming reader of ARINC 424 fixed width (132 columns) navigation data records: enroute waypoints,
+VHF and NDB navaids, airport reference points and terminal waypoints.
+"""
+from array import array
+from collections import namedtuple
+
+from aviation_gis_tools.coordinate import *
+
+# Record types: section code and subsection code
+RT_ENROUTE_WAYPOINT = 'EA'
+RT_VHF_NAVAID = 'D'
+RT_NDB_NAVAID = 'DB'
+RT_AIRPORT = 'PA'
+RT_TERMINAL_WAYPOINT = 'PC'
+
+RECORD_TYPES = (RT_ENROUTE_WAYPOINT, RT_VHF_NAVAID, RT_NDB_NAVAID, RT_AIRPORT, RT_TERMINAL_WAYPOINT)
+
+# Record type by section code (column 5) and subsection code: column 6 for enroute and navaid sections,
+# column 13 for airport section
+RECORD_TYPES_BY_SECTION = {
+    ('E', 'A'): RT_ENROUTE_WAYPOINT,
+    ('D', ' '): RT_VHF_NAVAID,
+    ('D', 'B'): RT_NDB_NAVAID,
+    ('P', 'A'): RT_AIRPORT,
+    ('P', 'C'): RT_TERMINAL_WAYPOINT
+}
+SECTIONS_WITH_SUBSECTION_IN_COLUMN_13 = ('P',)
+
+# Minimum record length, up to the end of longitude field
+RECORD_MIN_LENGTH = 51
+
+# Latitude and longitude fields, e.g. N47265700, E008330900
+LAT_FIELD = slice(32, 41)
+LON_FIELD = slice(41, 51)
+
+# Fields common for all supported records, as slices of record line (columns are numbered from 1 in the standard)
+COMMON_FIELDS = {
+    'record_type': slice(0, 1),  # S - standard, T - tailored
+    'area': slice(1, 4),
+    'icao_code': slice(10, 12),
+    'continuation': slice(21, 22),
+    'lat': LAT_FIELD,
+    'lon': LON_FIELD,
+    'file_record_number': slice(123, 128),
+    'cycle': slice(128, 132)
+}
+
+RECORD_FIELDS = {
+    RT_ENROUTE_WAYPOINT: dict(COMMON_FIELDS, region=slice(6, 10), ident=slice(13, 18), icao_code=slice(19, 21),
+                              waypoint_type=slice(26, 29), name=slice(98, 123)),
+    RT_VHF_NAVAID: dict(COMMON_FIELDS, airport=slice(6, 10), ident=slice(13, 17), icao_code=slice(19, 21),
+                        frequency=slice(22, 27), navaid_class=slice(27, 32), name=slice(93, 123)),
+    RT_NDB_NAVAID: dict(COMMON_FIELDS, airport=slice(6, 10), ident=slice(13, 17), icao_code=slice(19, 21),
+                        frequency=slice(22, 27), navaid_class=slice(27, 32), name=slice(93, 123)),
+    RT_AIRPORT: dict(COMMON_FIELDS, ident=slice(6, 10), iata=slice(13, 16), name=slice(93, 123)),
+    RT_TERMINAL_WAYPOINT: dict(COMMON_FIELDS, airport=slice(6, 10), ident=slice(13, 18), icao_code=slice(19, 21),
+                               waypoint_type=slice(26, 29), name=slice(98, 123))
+}
+
+# Columnar output of reader, fields - dictionary: field name -> list of field values
+record_columns = namedtuple('RecordColumns', ['record_type', 'fields', 'lon', 'lat'])
+
+
+def get_record_type(line):
+    """ Return record type of ARINC 424 record.
+    :param line: str, record
+    :return: str: record type, e.g. RT_ENROUTE_WAYPOINT, None if record type not supported
+    """
+    if len(line) < RECORD_MIN_LENGTH:
+        return None
+    section = line[4]
+    if section in SECTIONS_WITH_SUBSECTION_IN_COLUMN_13:
+        return RECORD_TYPES_BY_SECTION.get((section, line[12]))
+    return RECORD_TYPES_BY_SECTION.get((section, line[5]))
+
+
+def is_primary_record(line):
+    """ Check if record is primary record, continuation record number is 0 or 1 for primary records.
+    :param line: str, record
+    :return: bool
+    """
+    return line[21] in '01'
+
+
+class Arinc424Record:
+    """ ARINC 424 record, fields are decoded only when requested. """
+
+    __slots__ = ('record_type', 'line')
+
+    def __init__(self, record_type, line):
+        """
+        :param record_type: str, e.g. RT_ENROUTE_WAYPOINT
+        :param line: str, record
+        """
+        self.record_type = record_type
+        self.line = line
+
+    def __repr__(self):
+        return 'Arinc424Record({!r}, {!r})'.format(self.record_type, self.line)
+
+    def get_field(self, field_name):
+        """ Return field value, without trailing and leading spaces.
+        :param field_name: str, field name, key of RECORD_FIELDS[record_type]
+        :return: str
+        """
+        return self.line[RECORD_FIELDS[self.record_type][field_name]].strip()
+
+    @property
+    def ident(self):
+        return self.get_field('ident')
+
+    @property
+    def name(self):
+        return self.get_field('name')
+
+    @property
+    def lon(self):
+        """ Return longitude in DD format, None if field empty or invalid. """
+        return Coordinate.convert_arinc424_to_dd(self.line[LON_FIELD], AT_LONGITUDE)
+
+    @property
+    def lat(self):
+        """ Return latitude in DD format, None if field empty or invalid. """
+        return Coordinate.convert_arinc424_to_dd(self.line[LAT_FIELD], AT_LATITUDE)
+
+
+def read_records(file_obj, record_types=RECORD_TYPES, primary_only=True):
+    """ Yield records of given types from ARINC 424 file, reading it line by line.
+    :param file_obj: text file object
+    :param record_types: iterable of str, record types to read, e.g. (RT_ENROUTE_WAYPOINT, RT_VHF_NAVAID)
+    :param primary_only: bool, True - skip continuation records
+    :return: generator of Arinc424Record
+    """
+    record_types = frozenset(record_types)
+    for line in file_obj:
+        record_type = get_record_type(line)
+        if record_type in record_types and (not primary_only or is_primary_record(line)):
+            yield Arinc424Record(record_type, line.rstrip('\r\n'))
+
+
+def read_columns(file_obj, record_types=RECORD_TYPES, fields=('ident',), primary_only=True):
+    """ Read records of given types from ARINC 424 file into columns.
+    :param file_obj: text file object
+    :param record_types: iterable of str, record types to read
+    :param fields: iterable of str, names of fields to read, coordinates are always read
+    :param primary_only: bool, True - skip continuation records
+    :return: record_columns: record_type - list of record types, fields - dictionary: field name -> list
+             of field values ('' if record type has no such field), lon, lat - array('d') of coordinates
+             in DD format, nan if invalid
+    """
+    result = record_columns([], {field_name: [] for field_name in fields}, array('d'), array('d'))
+    record_types = frozenset(record_types)
+    # Slices of requested fields by record type, None if record type has no such field
+    field_slices = {record_type: [RECORD_FIELDS[record_type].get(field_name) for field_name in fields]
+                    for record_type in record_types}
+    columns = [result.fields[field_name] for field_name in fields]
+    to_dd = Coordinate.convert_arinc424_to_dd
+    nan = float('nan')
+    for line in file_obj:
+        record_type = get_record_type(line)
+        if record_type not in record_types or (primary_only and not is_primary_record(line)):
+            continue
+        result.record_type.append(record_type)
+        for column, field_slice in zip(columns, field_slices[record_type]):
+            column.append(line[field_slice].strip() if field_slice else '')
+        lon = to_dd(line[LON_FIELD], AT_LONGITUDE)
+        lat = to_dd(line[LAT_FIELD], AT_LATITUDE)
+        result.lon.append(nan if lon is None else lon)
+        result.lat.append(nan if lat is None else lat)
+    return result
@@ -2,16 +2,26 @@ from aviation_gis_tools.angle import *
 
 
 BEARING_COMPACTED = {
-    "DMS_COMPACTED": re.compile(r'''(?P<deg>^360|^[0-2]\d{2}|^0\d{2})  # Degrees
+    "DMS_COMPACTED": re.compile(r'''(?P<deg>^360|^3[0-5]\d|^[0-2]\d{2})  # Degrees
                                     (?P<min>[0-5]\d)  # Minutes
                                     (?P<sec>[0-5]\d\.\d+$|[0-5]\d$)  # Seconds
                                  ''', re.VERBOSE),
-    "DM_COMPACTED": re.compile(r'''(?P<deg>^360|^[0-2]\d{2}|^0\d{2})  # Degrees
+    "DM_COMPACTED": re.compile(r'''(?P<deg>^360|^3[0-5]\d|^[0-2]\d{2})  # Degrees
                                    (?P<min>[0-5]\d\.\d+$|[0-5]\d$)  # Minutes
                              ''', re.VERBOSE),
 }
 
 
+# Compacted bearing formats, format code in bulk parsing is index + 1
+BEARING_FORMATS = ('DMS_COMPACTED', 'DM_COMPACTED')
+
+# Candidate compacted format by number of digits before decimal point
+BEARING_COMPACTED_DISPATCH = {
+    7: 'DMS_COMPACTED',
+    5: 'DM_COMPACTED'
+}
+
+
 class Bearing(Angle):
 
     def __init__(self, brng_src, brng_label="Bearing"):
@@ -35,8 +45,8 @@ class Bearing(Angle):
 
     @staticmethod
     def convert_compacted_dms_to_dd(brng_src, pattern):
-        if pattern.match(brng_src):
-            dms_parts = pattern.search(brng_src)
+        dms_parts = pattern.match(brng_src)
+        if dms_parts:
             d = int(dms_parts.group('deg'))
             m = int(dms_parts.group('min'))
             s = float(dms_parts.group('sec'))
@@ -46,32 +56,70 @@ class Bearing(Angle):
 
     @staticmethod
     def convert_compacted_dm_to_dd(brng_src, pattern):
-        if pattern.match(brng_src):
-            dms_parts = pattern.search(brng_src)
+        dms_parts = pattern.match(brng_src)
+        if dms_parts:
             d = int(dms_parts.group('deg'))
             m = float(dms_parts.group('min'))
             dd = d + m / 60
             if Bearing.is_within_range(dd):
                 return dd
 
+    @staticmethod
+    def parse_compacted(brng_src):
+        """ Converts DMS or DM format into DD format and returns detected format.
+        Candidate format is chosen by number of digits before decimal point, so exactly one regular expression
+        match is done for each bearing.
+        :param brng_src: str, normalized bearing
+        :return: tuple(float, str): bearing in decimal degrees format (None if conversion failed)
+                 and detected format (None if format not supported)
+        """
+        int_length = brng_src.find('.')
+        brng_format = BEARING_COMPACTED_DISPATCH.get(len(brng_src) if int_length == -1 else int_length)
+        if brng_format is None:
+            return None, None
+        parts = BEARING_COMPACTED[brng_format].match(brng_src)
+        if parts is None:
+            return None, None
+        if brng_format == 'DMS_COMPACTED':
+            d, m, s = parts.group('deg', 'min', 'sec')
+            dd = int(d) + int(m) / 60 + float(s) / 3600
+        else:
+            d, m = parts.group('deg', 'min')
+            dd = int(d) + float(m) / 60
+        return (dd if Bearing.is_within_range(dd) else None), brng_format
+
     @staticmethod
     def convert_brng_to_dd(brng_src):
-        dd = Bearing.convert_compacted_dms_to_dd(brng_src, BEARING_COMPACTED["DMS_COMPACTED"])
+        return Bearing.parse_compacted(brng_src)[0]
 
-        if dd is None:
-            dd = Bearing.convert_compacted_dm_to_dd(brng_src, BEARING_COMPACTED["DM_COMPACTED"])
-        return dd
+    @staticmethod
+    def parse_many(values):
+        """ Parse sequence (e.g. CSV column) of bearings without creating Bearing object for each value.
+        :param values: iterable of str, bearings source values
+        :return: parsed_angles: dd - array.array('d') (NaN if error), err_code - array.array('b') (PARSE_OK etc.),
+                 fmt - array.array('b') (index of format in BEARING_FORMATS + 1, 0 if format not detected)
+        """
+        return Angle.parse_many_with(values, AT_BEARING, Bearing.parse_compacted, BEARING_FORMATS)
 
-    def validate_brng(self):
-        err_required = '{label} is required.'
-        err_value = '{label} value error or format not supported.'
+    @staticmethod
+    def get_err_msg(err_code, brng_label="Bearing"):
+        """ Return error message for parse error code.
+        :param err_code: int, parse error code, e.g. PARSE_ERR_REQUIRED
+        :param brng_label: str, label of the bearing used in message
+        :return: str, empty if err_code is PARSE_OK
+        """
+        if err_code == PARSE_OK:
+            return ""
+        if err_code == PARSE_ERR_REQUIRED:
+            return '{label} is required.'.format(label=brng_label)
+        return '{label} value error or format not supported.'.format(label=brng_label)
 
+    def validate_brng(self):
         if self.brng_src.strip() == "":
-            self.err_msg += err_required.format(label=self.brng_label)
+            self.err_msg += Bearing.get_err_msg(PARSE_ERR_REQUIRED, self.brng_label)
         else:
-            brng_norm = Bearing.normalize_angle(self.brng_src)
-            dd = self.convert_brng_to_dd(brng_norm)
+            dd, _ = angle_cache.get_or_parse(self.brng_src, AT_BEARING, Bearing.parse_compacted)
             if dd is None:
-                self.err_msg += err_value.format(label=self.brng_label)
+                self.err_msg += Bearing.get_err_msg(PARSE_ERR_FORMAT, self.brng_label)
             else:
                 self.brng_dd = dd
@@ -45,6 +45,33 @@ COORDINATE_COMPACTED = {
 }
 
 
+# Compacted coordinate formats, format code in bulk parsing is index + 1
+COORDINATE_FORMATS = ('DMSH_COMPACTED', 'HDMS_COMPACTED', 'DMH_COMPACTED', 'HDM_COMPACTED')
+
+# Candidate compacted format by: is hemisphere letter leading, number of digits before decimal point
+COORDINATE_COMPACTED_DISPATCH = {
+    AT_LONGITUDE: {
+        (False, 7): 'DMSH_COMPACTED',
+        (True, 7): 'HDMS_COMPACTED',
+        (False, 5): 'DMH_COMPACTED',
+        (True, 5): 'HDM_COMPACTED'
+    },
+    AT_LATITUDE: {
+        (False, 6): 'DMSH_COMPACTED',
+        (True, 6): 'HDMS_COMPACTED',
+        (False, 4): 'DMH_COMPACTED',
+        (True, 4): 'HDM_COMPACTED'
+    }
+}
+
+# Coordinate in ARINC 424 record: hemisphere, degrees, minutes, seconds and hundredths of seconds,
+# e.g. N47265700, E008330900. Allowed hemisphere characters, number of digits and maximum value by angle type.
+ARINC424_COORDINATE = {
+    AT_LONGITUDE: ('EW', 10, 180),
+    AT_LATITUDE: ('NS', 9, 90)
+}
+
+
 class Coordinate(Angle):
 
     def __init__(self, ang_src, ang_type, ang_label=None):
@@ -71,6 +98,72 @@ class Coordinate(Angle):
         elif ang_type == AT_LATITUDE:
             return bool(-90 <= coord_dd <= 90)
 
+    @staticmethod
+    def get_compacted_format_candidate(ang, ang_type):
+        """ Return the only compacted format the angle can be in, based on the position of hemisphere letter
+        and number of digits before decimal point, without running regular expressions.
+        :param ang: str, normalized angle
+        :param ang_type: str
+        :return: str: format, e.g. 'DMSH_COMPACTED', None if angle can not be in any compacted format
+        """
+        if not ang:
+            return None
+        if ang[0] in 'NSEW':
+            hem_leading, body = True, ang[1:]
+        elif ang[-1] in 'NSEW':
+            hem_leading, body = False, ang[:-1]
+        else:
+            return None
+        int_length = body.find('.')
+        if int_length == -1:
+            int_length = len(body)
+        return COORDINATE_COMPACTED_DISPATCH[ang_type].get((hem_leading, int_length))
+
+    @staticmethod
+    def parse_compacted(ang, ang_type):
+        """ Converts DMSH or HDMS format into DD format and returns detected format.
+        Candidate format is chosen first, so exactly one regular expression match is done for each angle.
+        :param ang: str, normalized angle
+        :param ang_type: str
+        :return: tuple(float, str): angle in decimal degrees format (None if conversion failed)
+                 and detected format (None if format not supported)
+        """
+        ang_format = Coordinate.get_compacted_format_candidate(ang, ang_type)
+        if ang_format is None:
+            return None, None
+        parts = COORDINATE_COMPACTED[ang_type][ang_format].match(ang)
+        if parts is None:
+            return None, None
+
+        if ang_format in ['DMSH_COMPACTED', 'HDMS_COMPACTED']:
+            d, m, s, h = parts.group('deg', 'min', 'sec', 'hem')
+            dd = Coordinate.dmsh_parts_to_dd((int(d), int(m), float(s), h))
+        else:
+            d, m, h = parts.group('deg', 'min', 'hem')
+            dd = Coordinate.dmh_parts_to_dd((int(d), float(m), h))
+
+        if dd is not None and Coordinate.is_coordinate_within_range(dd, ang_type):
+            return dd, ang_format
+        return None, ang_format
+
+    @staticmethod
+    def convert_arinc424_to_dd(ang, ang_type):
+        """ Converts coordinate from ARINC 424 record, e.g. N47265700, E008330900, into DD format.
+        Fields have fixed width, so they are sliced without regular expressions.
+        :param ang: str
+        :param ang_type: str
+        :return: float: angle in decimal degrees format, None if conversion failed
+        """
+        hemispheres, length, max_dd = ARINC424_COORDINATE[ang_type]
+        if len(ang) != length or ang[0] not in hemispheres or not ang[1:].isdecimal():
+            return None
+        # Degrees, minutes, seconds hundredths from one integer, e.g. 8330900 -> 8, 33, 900
+        d, m_cs = divmod(int(ang[1:]), 1000000)
+        m, cs = divmod(m_cs, 10000)
+        dd = Coordinate.dmsh_parts_to_dd((d, m, cs / 100, ang[0]))
+        if dd is not None and -max_dd <= dd <= max_dd:
+            return dd
+
     @staticmethod
     def convert_compacted_to_dd(ang, ang_type):
         """ Converts DMSH or HDMS format into DD format.
@@ -79,44 +172,41 @@ class Coordinate(Angle):
         :return: float: angle in decimal degrees format, if conversion failed (not supported format,
                  error in angle example minutes >= 60, incorrect type - returns None)
         """
-        dd = None
-        for coord_type, pattern in COORDINATE_COMPACTED[ang_type].items():
-            if pattern.match(ang):
-                if coord_type in ['DMSH_COMPACTED', 'HDMS_COMPACTED']:
-                    dmsh_parts = pattern.search(ang)
-                    d = int(dmsh_parts.group('deg'))
-                    m = int(dmsh_parts.group('min'))
-                    s = float(dmsh_parts.group('sec'))
-                    h = dmsh_parts.group('hem')
-                    dd = Coordinate.dmsh_parts_to_dd((d, m, s, h))
-                elif coord_type in ['DMH_COMPACTED', 'HDM_COMPACTED']:
-                    dmh_parts = pattern.search(ang)
-                    d = int(dmh_parts.group('deg'))
-                    m = float(dmh_parts.group('min'))
-                    h = dmh_parts.group('hem')
-                    dd = Coordinate.dmh_parts_to_dd((d, m, h))
-        if dd:
-            if Coordinate.is_coordinate_within_range(dd, ang_type):
-                return dd
+        return Coordinate.parse_compacted(ang, ang_type)[0]
+
+    @staticmethod
+    def parse_many(values, ang_type):
+        """ Parse sequence (e.g. CSV column) of coordinates without creating Coordinate object for each value.
+        :param values: iterable of str, coordinates source values
+        :param ang_type: str, angle type
+        :return: parsed_angles: dd - array.array('d') (NaN if error), err_code - array.array('b') (PARSE_OK etc.),
+                 fmt - array.array('b') (index of format in COORDINATE_FORMATS + 1, 0 if format not detected)
+        """
+        return Angle.parse_many_with(values, ang_type, lambda ang: Coordinate.parse_compacted(ang, ang_type),
+                                     COORDINATE_FORMATS)
+
+    @staticmethod
+    def get_err_msg(err_code, ang_type, ang_label=None):
+        """ Return error message for parse error code.
+        :param err_code: int, parse error code, e.g. PARSE_ERR_REQUIRED
+        :param ang_type: str, angle type
+        :param ang_label: str, label of the coordinate used in message
+        :return: str, empty if err_code is PARSE_OK
+        """
+        if err_code == PARSE_OK:
+            return ""
+        if not ang_label:
+            ang_label = {AT_LONGITUDE: "Longitude", AT_LATITUDE: "Latitude"}.get(ang_type)
+        if err_code == PARSE_ERR_REQUIRED:
+            return "{} is required!".format(ang_label)
+        return "{} error or not supported format!".format(ang_label)
 
     def validate_coordinate(self):
         if not self.ang_src.strip():
             self.ang_dd = None
-            if self.ang_label:
-                self.err_msg = "{} is required!".format(self.ang_label)
-            else:
-                if self.ang_type == AT_LONGITUDE:
-                    self.err_msg = "Longitude is required!"
-                elif self.ang_type == AT_LATITUDE:
-                    self.err_msg = "Latitude is required!"
+            self.err_msg = Coordinate.get_err_msg(PARSE_ERR_REQUIRED, self.ang_type, self.ang_label)
         else:
-            ang_norm = Coordinate.normalize_angle(self.ang_src)
-            self.ang_dd = Coordinate.convert_compacted_to_dd(ang_norm, self.ang_type)
+            self.ang_dd, _ = angle_cache.get_or_parse(self.ang_src, self.ang_type,
+                                                      lambda ang: Coordinate.parse_compacted(ang, self.ang_type))
             if self.ang_dd is None:
-                if self.ang_label:
-                    self.err_msg = "{} error or not supported format!".format(self.ang_label)
-                else:
-                    if self.ang_type == AT_LONGITUDE:
-                        self.err_msg = "Longitude error or not supported format!"
-                    elif self.ang_type == AT_LATITUDE:
-                        self.err_msg = "Latitude error or not supported format!"
+                self.err_msg = Coordinate.get_err_msg(PARSE_ERR_FORMAT, self.ang_type, self.ang_label)
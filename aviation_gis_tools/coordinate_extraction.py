@@ -2,8 +2,16 @@
 coordinate_extraction.py module provides functionality to extracts coordinates from plain text.
 """
 # -*- coding: utf-8 -*-
+import math
+import mmap
+import os
 import re
-from collections import namedtuple
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, namedtuple
 
 # Longitude, latitude sequence
 SEQUENCE_LON_LAT = 'SEQUENCE_LON_LAT'
@@ -22,22 +30,106 @@ COORD_PAIR_SEP_HYPHEN = r'-'
 COORD_PAIR_SEP_SLASH = r'/'
 COORD_PAIR_SEP_BACKSLASH = '\\'
 
+# Invalid coordinates flags of coordinates extracted into DD format
+EXTRACTED_LON_INVALID = 1
+EXTRACTED_LAT_INVALID = 2
+
+# Streaming extraction settings
+EXTRACTION_CHUNK_SIZE = 1024 * 1024  # Number of characters read from file at once
+
+# Maximum number of seconds decimal places. All quantifiers in coordinate patterns are bounded,
+# so length of match is bounded and each match attempt takes constant time - scanning is linear in text length.
+SEC_DECIMALS_MAX = 12
+# Coordinates starting with digit cannot start inside longer number, coordinates ending with digit or separator
+# cannot be followed by number, so bounded quantifiers never match part of longer digit run.
+# Lookarounds need up to NUMBER_CONTEXT_LENGTH characters before and after match.
+NOT_AFTER_NUMBER = r'(?<!\d)(?<!\d\.)'
+NOT_BEFORE_NUMBER = r'(?!\.?\d)'
+NUMBER_CONTEXT_LENGTH = 2
+
+# Non-word characters outside ASCII used around coordinates: no-break space, degree sign, acute accent,
+# en and em dash, quotation marks, prime, double prime
+MULTIBYTE_NON_WORD = '\u00a0\u00b0\u00b4\u2013\u2014\u2018\u2019\u201c\u201d\u2032\u2033'
+
+# Bytes equivalent of str regex \W for UTF-8 encoded text: ASCII non-word byte or one of MULTIBYTE_NON_WORD
+# characters. Other multibyte characters, e.g. letters, are not matched, so bytes regex never matches
+# text not matched by str regex.
+BYTES_NON_WORD = rb'(?:[^0-9A-Za-z_\x80-\xff]|' + \
+                 b'|'.join(re.escape(char.encode('utf-8')) for char in MULTIBYTE_NON_WORD) + b')'
+
 _coord_pair = namedtuple('coord_pair', 'lon lat')
+coord_pair_match = namedtuple('CoordPairMatch', ['start', 'end', 'pair'])
 _sample_coordinate = namedtuple('sample_coordinate', 'deg min sec hem')
+extraction_settings = namedtuple('ExtractionSettings', ['coord_sequence', 'coord_format', 'coord_sep'])
+tagged_coord_pair = namedtuple('TaggedCoordPair', ['settings', 'pair'])
+extracted_coordinates_dd = namedtuple('ExtractedCoordinatesDD', ['lon', 'lat', 'invalid', 'offset'])
+# Type name equal to variable name, results are pickled by worker processes
+file_extraction_result = namedtuple('file_extraction_result',
+                                    ['path', 'coordinate_pairs', 'size', 'elapsed', 'err_msg'])
 
 example_latitude = _sample_coordinate(deg='74', min='56', sec='32.55', hem='N')
 example_longitude = _sample_coordinate(deg='013', min='37', sec='38.21', hem='E')
 
+# All supported extraction settings. Separators that are characters go before COORD_PAIR_SEP_NONE,
+# when more settings match at the same position of text the one listed first is used.
+ALL_EXTRACTION_SETTINGS = tuple(
+    extraction_settings(coord_sequence, coord_format, coord_sep)
+    for coord_format in (DMSH_COMP, HDMS_COMP, DMSH_SEP, HDMS_SEP)
+    for coord_sequence in (SEQUENCE_LON_LAT, SEQUENCE_LAT_LON)
+    for coord_sep in (COORD_PAIR_SEP_SLASH, COORD_PAIR_SEP_BACKSLASH, COORD_PAIR_SEP_HYPHEN,
+                      COORD_PAIR_SEP_SPACE, COORD_PAIR_SEP_NONE)
+)
+
+
+def remove_capturing_groups(pattern):
+    """ Return regular expression with capturing groups replaced by non-capturing groups.
+    :param pattern: str, regular expression without escaped parentheses
+    :return: str
+    """
+    return re.sub(r'\((?!\?)', '(?:', pattern)
+
 
 class CoordinatePairExtraction:
 
-    COORD_PAIR_PATTERNS = {
-        DMSH_COMP: _coord_pair(r'\d{7}\.\d+[EW]|\d{7}[EW]', r'\d{6}\.\d+[NS]|\d{6}[NS]'),
-        HDMS_COMP: _coord_pair(r'[EW]\d{7}\.\d+|[EW]\d{7}', r'[NS]\d{6}\.\d+|[NS]\d{6}'),
-        DMSH_SEP: _coord_pair(r'''\d{1,3}\W\d{1,2}\W\d{1,2}\.\d+\W{1,2}[EW]|\d{1,3}\W\d{1,2}\W\d{1,2}\W{1,2}[EW]''',
-                              r'''\d{1,2}\W\d{2}\W\d{1,2}\.\d+\W{1,2}[NS]|\d{1,2}\W\d{1,2}\W\d{1,2}\W{1,2}[NS]'''),
-        HDMS_SEP: _coord_pair(r'''[EW]\d{1,3}\W\d{1,2}\W\d{1,2}\.\d+\W{1,2}|[EW]\d{1,3}\W\d{1,2}\W\d{1,2}\{1,2}W''',
-                              r'''[NS]\d{1,2}\W\d{2}\W\d{1,2}\.\d+\W{1,2}|[NS]\d{1,2}\W\d{1,2}\W\d{1,2}\W{1,2}''')
+    # Maximum length of coordinates matched by COORD_PAIR_PATTERNS
+    COORD_MAX_LENGTHS = {
+        DMSH_COMP: _coord_pair(9 + SEC_DECIMALS_MAX, 8 + SEC_DECIMALS_MAX),
+        HDMS_COMP: _coord_pair(9 + SEC_DECIMALS_MAX, 8 + SEC_DECIMALS_MAX),
+        DMSH_SEP: _coord_pair(13 + SEC_DECIMALS_MAX, 12 + SEC_DECIMALS_MAX),
+        HDMS_SEP: _coord_pair(13 + SEC_DECIMALS_MAX, 12 + SEC_DECIMALS_MAX)
+    }
+
+    # Patterns capturing degrees, minutes, seconds and hemisphere character of coordinate, each alternative
+    # of pattern captures them in its own groups. Patterns without capturing groups, COORD_PAIR_PATTERNS,
+    # are built from the same strings, so both of them match the same coordinates.
+    COORD_PAIR_DMS_PATTERNS = {
+        DMSH_COMP: _coord_pair(NOT_AFTER_NUMBER + r'(?:(\d{3})(\d{2})(\d{2}\.\d{1,12})([EW])|'
+                                                  r'(\d{3})(\d{2})(\d{2})([EW]))',
+                               NOT_AFTER_NUMBER + r'(?:(\d{2})(\d{2})(\d{2}\.\d{1,12})([NS])|'
+                                                  r'(\d{2})(\d{2})(\d{2})([NS]))'),
+        HDMS_COMP: _coord_pair(r'(?:([EW])(\d{3})(\d{2})(\d{2}\.\d{1,12})|'
+                               r'([EW])(\d{3})(\d{2})(\d{2}))' + NOT_BEFORE_NUMBER,
+                               r'(?:([NS])(\d{2})(\d{2})(\d{2}\.\d{1,12})|'
+                               r'([NS])(\d{2})(\d{2})(\d{2}))' + NOT_BEFORE_NUMBER),
+        DMSH_SEP: _coord_pair(NOT_AFTER_NUMBER + r'''(?:(\d{1,3})\W(\d{1,2})\W(\d{1,2}\.\d{1,12})\W{1,2}([EW])|'''
+                                                 r'''(\d{1,3})\W(\d{1,2})\W(\d{1,2})\W{1,2}([EW]))''',
+                              NOT_AFTER_NUMBER + r'''(?:(\d{1,2})\W(\d{2})\W(\d{1,2}\.\d{1,12})\W{1,2}([NS])|'''
+                                                 r'''(\d{1,2})\W(\d{1,2})\W(\d{1,2})\W{1,2}([NS]))'''),
+        HDMS_SEP: _coord_pair(r'''(?:([EW])(\d{1,3})\W(\d{1,2})\W(\d{1,2}\.\d{1,12})\W{1,2}|'''
+                              r'''([EW])(\d{1,3})\W(\d{1,2})\W(\d{1,2})\W{1,2})''' + NOT_BEFORE_NUMBER,
+                              r'''(?:([NS])(\d{1,2})\W(\d{2})\W(\d{1,2}\.\d{1,12})\W{1,2}|'''
+                              r'''([NS])(\d{1,2})\W(\d{1,2})\W(\d{1,2})\W{1,2})''' + NOT_BEFORE_NUMBER)
+    }
+
+    COORD_PAIR_PATTERNS = {coord_format: _coord_pair(*(remove_capturing_groups(pattern) for pattern in patterns))
+                           for coord_format, patterns in COORD_PAIR_DMS_PATTERNS.items()}
+
+    # Indexes of degrees, minutes, seconds, hemisphere groups within alternative of COORD_PAIR_DMS_PATTERNS pattern
+    DMS_GROUP_ORDER = {
+        DMSH_COMP: (0, 1, 2, 3),
+        HDMS_COMP: (1, 2, 3, 0),
+        DMSH_SEP: (0, 1, 2, 3),
+        HDMS_SEP: (1, 2, 3, 0)
     }
 
     def __init__(self, coord_sequence, coord_format, coord_sep):
@@ -51,6 +143,8 @@ class CoordinatePairExtraction:
         self.coord_format = coord_format
         self.coord_sep = coord_sep
         self.coordinates_pair_regex = None
+        self.coordinates_pair_bytes_regex = None
+        self.coordinates_pair_dms_regex = None
         self.set_coordinates_pair_regex()
 
     def get_coordinate_example(self, sample_coordinate):
@@ -83,22 +177,64 @@ class CoordinatePairExtraction:
             example = '{lat}{sep}{lon}'.format(lon=lon, sep=self.coord_sep, lat=lat)
         return example
 
-    def set_coordinates_pair_regex(self):
-        """ Creates regular expression string based coordinates order, coordinates format and separator
-        between longitude and latitude. """
+    @staticmethod
+    def get_coordinates_pair_regex_str(coord_sequence, coord_format, coord_sep, named_groups=True):
+        """ Return regular expression string based coordinates order, coordinates format and separator
+        between longitude and latitude.
+        :param coord_sequence: str, constant that defines longitude and latitude sequence in coordinate pair
+        :param coord_format: str, constant that defines format of coordinate
+        :param coord_sep: str, defines separator between longitude and latitude
+        :param named_groups: bool, True - coordinates captured by 'lon', 'lat' named groups,
+                             False - by unnamed groups, in coord_sequence order
+        :return: str: regular expression, empty if coord_sequence or coord_format not supported
+        """
         regex_str = ''
-        lon_pattern, lat_pattern = CoordinatePairExtraction.COORD_PAIR_PATTERNS.get(self.coord_format)
+        lon_lat_patterns = CoordinatePairExtraction.COORD_PAIR_PATTERNS.get(coord_format)
+        if lon_lat_patterns is None:
+            return regex_str
+        lon_pattern, lat_pattern = lon_lat_patterns
+        lon_group = '(?P<lon>' if named_groups else '('
+        lat_group = '(?P<lat>' if named_groups else '('
 
-        if self.coord_sequence == SEQUENCE_LON_LAT:
-            regex_str = r'(?P<lon>' + lon_pattern + ')' + \
-                        re.escape(self.coord_sep) + \
-                        '(?P<lat>' + lat_pattern + ')'
-        elif self.coord_sequence == SEQUENCE_LAT_LON:
-            regex_str = r'(?P<lat>' + lat_pattern + ')' +\
-                        re.escape(self.coord_sep) +\
-                        '(?P<lon>' + lon_pattern + ')'
+        if coord_sequence == SEQUENCE_LON_LAT:
+            regex_str = lon_group + lon_pattern + ')' + \
+                        re.escape(coord_sep) + \
+                        lat_group + lat_pattern + ')'
+        elif coord_sequence == SEQUENCE_LAT_LON:
+            regex_str = lat_group + lat_pattern + ')' +\
+                        re.escape(coord_sep) +\
+                        lon_group + lon_pattern + ')'
+        return regex_str
+
+    def set_coordinates_pair_regex(self):
+        """ Creates regular expression string based coordinates order, coordinates format and separator
+        between longitude and latitude. Bytes regular expression, used to scan memory mapped files,
+        is compiled from the same string. """
+        regex_str = self.get_coordinates_pair_regex_str(self.coord_sequence, self.coord_format, self.coord_sep)
         if regex_str:
             self.coordinates_pair_regex = re.compile(regex_str)
+            self.coordinates_pair_bytes_regex = re.compile(
+                regex_str.encode('ascii').replace(rb'\W', BYTES_NON_WORD))
+            lon_pattern, lat_pattern = CoordinatePairExtraction.COORD_PAIR_DMS_PATTERNS[self.coord_format]
+            if self.coord_sequence == SEQUENCE_LON_LAT:
+                dms_regex_str = lon_pattern + re.escape(self.coord_sep) + lat_pattern
+            else:
+                dms_regex_str = lat_pattern + re.escape(self.coord_sep) + lon_pattern
+            self.coordinates_pair_dms_regex = re.compile(dms_regex_str)
+
+    def get_max_pair_length(self):
+        """ Return maximum length of coordinates pair matched by coordinates_pair_regex.
+        :return: int
+        """
+        lon_length, lat_length = CoordinatePairExtraction.COORD_MAX_LENGTHS[self.coord_format]
+        return lon_length + len(self.coord_sep) + lat_length
+
+    def get_min_margin(self):
+        """ Return minimum number of trailing characters of buffer not searched in streaming extraction:
+        the longest coordinates pair and characters after it read by lookahead of pattern.
+        :return: int
+        """
+        return self.get_max_pair_length() + NUMBER_CONTEXT_LENGTH
 
     @staticmethod
     def remove_new_line_character(plain_text):
@@ -107,10 +243,7 @@ class CoordinatePairExtraction:
         :param plain_text: str, text from which coordinates are extracted.
         :return: shape_str: str, string without new line character
         """
-        normalized = ''
-        for line in plain_text:
-            normalized += line.strip('\n')
-        return normalized
+        return plain_text.replace('\n', '')
 
     def extract_coordinates(self, plain_text):
         """ Get list of coordinate pairs from plain text.
@@ -121,3 +254,460 @@ class CoordinatePairExtraction:
         normalized_text = self.remove_new_line_character(plain_text)
         coordinate_pairs = re.findall(self.coordinates_pair_regex, normalized_text)
         return coordinate_pairs
+
+    def _find_pair_spans(self, plain_text, pos=0, endpos=None):
+        """ Yield coordinate pairs with their spans from plain_text[pos:endpos].
+        :param plain_text: str, text from which coordinates are extracted
+        :param pos: int, position in plain_text where search starts
+        :param endpos: int, position in plain_text where search ends, None - end of plain_text
+        :return: generator of coord_pair_match, start and end are positions in plain_text
+        """
+        if endpos is None:
+            endpos = len(plain_text)
+        # Characters around searched text are needed by lookarounds of patterns
+        context_start = self.skip_characters(plain_text, pos, NUMBER_CONTEXT_LENGTH, forward=False)
+        context_end = self.skip_characters(plain_text, endpos, NUMBER_CONTEXT_LENGTH)
+        normalized_text, new_line_positions = self.remove_new_line_with_positions(
+            plain_text[context_start:context_end])
+        search_start = pos - context_start - plain_text.count('\n', context_start, pos)
+        search_end = endpos - context_start - plain_text.count('\n', context_start, endpos)
+        for match in self.coordinates_pair_regex.finditer(normalized_text, search_start):
+            if match.end() > search_end:
+                break
+            yield coord_pair_match(
+                start=context_start + match.start() + bisect_right(new_line_positions, match.start()),
+                end=context_start + match.end() + bisect_right(new_line_positions, match.end() - 1),
+                pair=match.groups())
+
+    def extract_coordinates_spans(self, plain_text):
+        """ Get list of coordinate pairs with their spans from plain text.
+        :param plain_text: str, text from which coordinates are extracted.
+        :return: list of coord_pair_match: start, end - span of pair in plain_text (pair might contain new line
+                 characters), pair - tuple with coordinates in the same sequence as in self.coord_sequence attribute.
+        """
+        return list(self._find_pair_spans(plain_text))
+
+    def extract_coordinates_iter(self, file_obj, chunk_size=EXTRACTION_CHUNK_SIZE, margin=None):
+        """ Yield coordinate pairs from text file object, read in chunks, so memory usage does not depend on file size.
+        Pairs broken by chunk boundary or new line character are extracted as in extract_coordinates.
+        :param file_obj: text file object, e.g. returned by open(path) or io.StringIO
+        :param chunk_size: int, number of characters read at once
+        :param margin: int, number of trailing characters of buffer not searched until next chunk is read,
+                       not less than get_min_margin(), None - get_min_margin()
+        :return: generator of tuples with extracted coordinate pairs.
+                Note: longitude latitude sequence is the same as in self.coord_sequence attribute.
+        :raise ValueError: if margin is less than get_min_margin()
+        """
+        if margin is None:
+            margin = self.get_min_margin()
+        elif margin < self.get_min_margin():
+            raise ValueError(f'Margin has to be at least {self.get_min_margin()} characters.')
+        buffer = ''
+        search_pos = 0  # Characters before it are kept only as context of lookarounds
+        while True:
+            chunk = file_obj.read(chunk_size)
+            if not chunk:
+                break
+            buffer += self.remove_new_line_character(chunk)
+            safe_length = len(buffer) - margin
+            if safe_length <= search_pos:
+                continue
+
+            keep_from = safe_length
+            for match in self.coordinates_pair_regex.finditer(buffer, search_pos):
+                if match.start() >= safe_length:
+                    break
+                yield match.groups()
+                keep_from = max(match.end(), safe_length)
+            search_pos = min(keep_from, NUMBER_CONTEXT_LENGTH)
+            buffer = buffer[keep_from - search_pos:]
+
+        for match in self.coordinates_pair_regex.finditer(buffer, search_pos):
+            yield match.groups()
+
+    def extract_coordinates_dd(self, plain_text):
+        """ Get coordinate pairs from plain text converted into DD format during extraction, coordinates parts
+        captured by regular expression are converted directly, without parsing them again by Coordinate class.
+        :param plain_text: str, text from which coordinates are extracted.
+        :return: extracted_coordinates_dd: lon, lat - array('d') of coordinates in DD format (nan if invalid),
+                 invalid - array('b') of EXTRACTED_LON_INVALID, EXTRACTED_LAT_INVALID flags (minutes or seconds
+                 >= 60, coordinate out of range), offset - array('l') of pair start positions in plain_text
+        """
+        normalized_text, new_line_positions = self.remove_new_line_with_positions(plain_text)
+        deg_idx, min_idx, sec_idx, hem_idx = CoordinatePairExtraction.DMS_GROUP_ORDER[self.coord_format]
+        lon_pattern, lat_pattern = CoordinatePairExtraction.COORD_PAIR_DMS_PATTERNS[self.coord_format]
+        if self.coord_sequence == SEQUENCE_LON_LAT:
+            lon_base, lat_base = 0, re.compile(lon_pattern).groups
+        else:
+            lon_base, lat_base = re.compile(lat_pattern).groups, 0
+        nan = math.nan
+
+        def to_dd(groups, base, max_dd):
+            # Groups of the alternative which matched, 4 groups per alternative
+            while groups[base + hem_idx] is None:
+                base += 4
+            m = int(groups[base + min_idx])
+            s = float(groups[base + sec_idx])
+            if m < 60 and s < 60:
+                dd = int(groups[base + deg_idx]) + m / 60 + s / 3600
+                if dd <= max_dd:
+                    return -dd if groups[base + hem_idx] in 'WS' else dd
+            return nan
+
+        lon_dd = array('d')
+        lat_dd = array('d')
+        invalid = array('b')
+        offset = array('l')
+        for match in self.coordinates_pair_dms_regex.finditer(normalized_text):
+            groups = match.groups()
+            lon = to_dd(groups, lon_base, 180)
+            lat = to_dd(groups, lat_base, 90)
+            lon_dd.append(lon)
+            lat_dd.append(lat)
+            invalid.append((EXTRACTED_LON_INVALID if lon != lon else 0) | (EXTRACTED_LAT_INVALID if lat != lat else 0))
+            start = match.start()
+            offset.append(start + bisect_right(new_line_positions, start))
+        return extracted_coordinates_dd(lon_dd, lat_dd, invalid, offset)
+
+    def extract_coordinates_from_file(self, path, chunk_size=EXTRACTION_CHUNK_SIZE, encoding='utf-8'):
+        """ Get coordinate pairs from text file, with file statistics.
+        :param path: str, path to text file
+        :param chunk_size: int, number of characters read at once
+        :param encoding: str, text file encoding
+        :return: file_extraction_result: path, coordinate_pairs - list of tuples with extracted coordinate pairs,
+                 size - file size in bytes, elapsed - extraction time in seconds,
+                 err_msg - empty if file read, error description otherwise
+        """
+        start = time.perf_counter()
+        try:
+            with open(path, encoding=encoding) as f:
+                coordinate_pairs = list(self.extract_coordinates_iter(f, chunk_size))
+                size = os.fstat(f.fileno()).st_size
+        except (OSError, UnicodeDecodeError) as e:
+            return file_extraction_result(path, [], 0, time.perf_counter() - start, str(e))
+        return file_extraction_result(path, coordinate_pairs, size, time.perf_counter() - start, '')
+
+    def extract_coordinates_from_files(self, paths, max_workers=None, chunk_size=EXTRACTION_CHUNK_SIZE,
+                                       encoding='utf-8'):
+        """ Yield extraction results of files, files are processed in parallel by process pool.
+        Results are yielded in the same order as paths, as soon as they are available.
+        Worker processes build their own extractor once from settings, compiled regular expressions
+        are not sent with tasks.
+        :param paths: iterable of str, paths to text files
+        :param max_workers: int, number of worker processes, None - number of processors, 1 - files are processed
+                            in current process
+        :param chunk_size: int, number of characters read at once
+        :param encoding: str, text files encoding
+        :return: generator of file_extraction_result, see extract_coordinates_from_file
+        """
+        if max_workers == 1:
+            for path in paths:
+                yield self.extract_coordinates_from_file(path, chunk_size, encoding)
+            return
+
+        settings = (self.coord_sequence, self.coord_format, self.coord_sep)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_extraction_worker,
+                                 initargs=(settings, chunk_size, encoding)) as executor:
+            for result in executor.map(_extract_coordinates_from_file, paths):
+                yield result
+
+    @staticmethod
+    def skip_characters(plain_text, pos, count, forward=True):
+        """ Return position in text after skipping given number of characters other than new line.
+        :param plain_text: str
+        :param pos: int, start position
+        :param count: int, number of characters to skip
+        :param forward: bool, True - skip towards end of text, False - towards beginning
+        :return: int: position, limited to text bounds
+        """
+        if forward:
+            while count > 0 and pos < len(plain_text):
+                if plain_text[pos] != '\n':
+                    count -= 1
+                pos += 1
+        else:
+            while count > 0 and pos > 0:
+                pos -= 1
+                if plain_text[pos] != '\n':
+                    count -= 1
+        return pos
+
+    @staticmethod
+    def remove_new_line_with_positions(text):
+        """ Remove new line characters from text, keep positions of removed characters.
+        :param text: str or bytes, text from which coordinates are extracted
+        :return: tuple(str or bytes, list): text without new line characters, positions in returned text
+                 at which new line characters were removed
+        """
+        new_line = b'\n' if isinstance(text, bytes) else '\n'
+        new_line_positions = []
+        pos = text.find(new_line)
+        while pos != -1:
+            new_line_positions.append(pos - len(new_line_positions))
+            pos = text.find(new_line, pos + 1)
+        return text.replace(new_line, new_line[:0]), new_line_positions
+
+    def extract_coordinates_from_path(self, path, chunk_size=EXTRACTION_CHUNK_SIZE, margin=None, encoding='utf-8'):
+        """ Yield coordinate pairs with their byte offsets from file, scanned as memory mapped bytes,
+        so the file content is never decoded as a whole. New line characters are removed as in extract_coordinates.
+        :param path: str, path to UTF-8 (or any ASCII compatible encoding) text file
+        :param chunk_size: int, number of bytes scanned at once
+        :param margin: int, number of trailing bytes of scanned window not searched until next window,
+                       not less than the longest coordinate pair in bytes and characters after it read
+                       by lookahead of pattern, None - enough for UTF-8 characters up to 4 bytes long
+        :param encoding: str, encoding used to decode extracted coordinates
+        :return: generator of coord_pair_match: start, end - byte offsets of pair in file, end is exclusive
+                 (pair might contain new line characters between start and end), pair - tuple of str with
+                 coordinates in the same sequence as in self.coord_sequence attribute.
+        :raise ValueError: if margin is less than get_min_margin()
+        """
+        if margin is None:
+            margin = 4 * self.get_max_pair_length() + NUMBER_CONTEXT_LENGTH
+        elif margin < self.get_min_margin():
+            raise ValueError(f'Margin has to be at least {self.get_min_margin()} bytes.')
+        with open(path, 'rb') as f:
+            file_size = f.seek(0, 2)
+            if file_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                window_start = 0
+                while window_start < file_size:
+                    # Bytes before window are needed by lookarounds of patterns
+                    context_start = window_start
+                    search_pos = 0
+                    while context_start > 0 and search_pos < NUMBER_CONTEXT_LENGTH:
+                        context_start -= 1
+                        if mm[context_start] != ord('\n'):
+                            search_pos += 1
+                    window_end = min(window_start + chunk_size + margin, file_size)
+                    while True:
+                        window, new_line_positions = self.remove_new_line_with_positions(
+                            mm[context_start:window_end])
+                        # Window has to be longer than margin after new lines removal, grow it otherwise
+                        if window_end == file_size or len(window) - search_pos > margin:
+                            break
+                        window_end = min(window_end + chunk_size, file_size)
+
+                    def raw_offset(pos):
+                        return context_start + pos + bisect_right(new_line_positions, pos)
+
+                    safe_length = len(window) - margin if window_end < file_size else len(window)
+                    keep_from = safe_length
+                    for match in self.coordinates_pair_bytes_regex.finditer(window, search_pos):
+                        if match.start() >= safe_length:
+                            break
+                        yield coord_pair_match(start=raw_offset(match.start()),
+                                               end=raw_offset(match.end() - 1) + 1,
+                                               pair=tuple(group.decode(encoding) for group in match.groups()))
+                        keep_from = max(match.end(), safe_length)
+
+                    if window_end == file_size:
+                        break
+                    window_start = raw_offset(keep_from) if keep_from < len(window) else window_end
+
+
+class IncrementalCoordinatePairExtraction(CoordinatePairExtraction):
+    """ Keeps coordinate pairs extracted from text which is edited, e.g. in text editor. After each edit
+    only the neighbourhood of the edit is searched again, until search is synchronized with previous result.
+    Pairs are kept in gap buffer at the last edit position, pairs after the gap are shifted lazily,
+    so cost of edit does not depend on number of pairs in text. """
+
+    def __init__(self, coord_sequence, coord_format, coord_sep, plain_text=''):
+        """
+        :param coord_sequence: str, constant that defines longitude and latitude sequence in coordinate pair
+        :param coord_format: str, constant that defines format of coordinate
+        :param coord_sep: str, defines separator between longitude and latitude
+        :param plain_text: str, initial text
+        """
+        super().__init__(coord_sequence, coord_format, coord_sep)
+        self.plain_text = ''
+        self._left = []  # Pairs before gap
+        self._right = []  # Pairs after gap in reversed order, positions to be shifted by self._delta
+        self._delta = 0
+        self.set_text(plain_text)
+
+    @property
+    def matches(self):
+        """ Return all extracted pairs.
+        :return: list of coord_pair_match, see extract_coordinates_spans
+        """
+        delta = self._delta
+        return self._left + [coord_pair_match(m.start + delta, m.end + delta, m.pair) for m in reversed(self._right)]
+
+    def set_text(self, plain_text):
+        """ Replace text and extract all coordinate pairs from it.
+        :param plain_text: str
+        """
+        self.plain_text = plain_text
+        self._left = self.extract_coordinates_spans(plain_text)
+        self._right = []
+        self._delta = 0
+
+    def _pop_right(self):
+        """ Remove first pair after gap and return it with shifted positions. """
+        m = self._right.pop()
+        return coord_pair_match(m.start + self._delta, m.end + self._delta, m.pair)
+
+    def _push_right(self, m):
+        """ Insert pair, with current text positions, as the first pair after gap. """
+        self._right.append(coord_pair_match(m.start - self._delta, m.end - self._delta, m.pair))
+
+    def apply_edit(self, offset, removed_length, inserted_text):
+        """ Apply text edit and update extracted coordinate pairs.
+        :param offset: int, position of edit in current text
+        :param removed_length: int, number of characters removed at offset
+        :param inserted_text: str, text inserted at offset
+        :return: tuple(list, list): pairs no longer valid (positions before edit), pairs found by search around edit
+                 (positions after edit), both lists of coord_pair_match
+        """
+        old_text = self.plain_text
+        if not 0 <= offset <= offset + removed_length <= len(old_text):
+            raise ValueError('Edit out of text bounds!')
+        left, right = self._left, self._right
+        max_pair_length = self.get_max_pair_length()
+
+        # Pairs ending at least max_pair_length characters, and characters read by lookahead after pair,
+        # before edit do not depend on it, move gap there. Search starts where previous search was idle.
+        scan_pos = self.skip_characters(old_text, offset, max_pair_length + NUMBER_CONTEXT_LENGTH, forward=False)
+        while left and left[-1].end > scan_pos:
+            self._push_right(left.pop())
+        while right and right[-1].start + self._delta < scan_pos:
+            m = self._pop_right()
+            if m.end > scan_pos:
+                self._push_right(m)
+                scan_pos = m.start
+                break
+            left.append(m)
+
+        # Previous pairs before end of removed text are searched again
+        removed = []
+        while right and right[-1].end + self._delta <= offset + removed_length:
+            removed.append(self._pop_right())
+
+        self.plain_text = plain_text = old_text[:offset] + inserted_text + old_text[offset + removed_length:]
+        self._delta += len(inserted_text) - removed_length
+
+        # Search until both new and previous search are idle at the same position after edit,
+        # pairs starting right after edit depend on it through lookbehind
+        added = []
+        sync_pos = self.skip_characters(plain_text, offset + len(inserted_text), NUMBER_CONTEXT_LENGTH)
+        while True:
+            endpos = self.skip_characters(plain_text, sync_pos, max_pair_length)
+            for match in self._find_pair_spans(plain_text, scan_pos, endpos):
+                if match.start >= sync_pos:
+                    break
+                added.append(match)
+            new_cover = max(sync_pos, added[-1].end) if added else sync_pos
+            old_cover = sync_pos
+            while right and right[-1].start + self._delta < sync_pos:
+                m = self._pop_right()
+                removed.append(coord_pair_match(m.start - len(inserted_text) + removed_length,
+                                                m.end - len(inserted_text) + removed_length, m.pair))
+                old_cover = max(old_cover, m.end)
+            if new_cover == old_cover == sync_pos:
+                break
+            scan_pos = new_cover
+            sync_pos = max(new_cover, old_cover)
+
+        left.extend(added)
+        return removed, added
+
+
+# Extractor of worker process, created once per process by _init_extraction_worker
+_worker_extraction = None
+
+
+def _init_extraction_worker(settings, chunk_size, encoding):
+    """ Create extractor used by worker process for all its tasks.
+    :param settings: tuple(str, str, str): coord_sequence, coord_format, coord_sep
+    :param chunk_size: int, number of characters read at once
+    :param encoding: str, text files encoding
+    """
+    global _worker_extraction
+    _worker_extraction = (CoordinatePairExtraction(*settings), chunk_size, encoding)
+
+
+def _extract_coordinates_from_file(path):
+    """ Extract coordinate pairs from file in worker process.
+    :param path: str, path to text file
+    :return: file_extraction_result
+    """
+    extractor, chunk_size, encoding = _worker_extraction
+    return extractor.extract_coordinates_from_file(path, chunk_size, encoding)
+
+
+class MultiFormatCoordinatePairExtraction:
+    """ Extracts coordinate pairs of several sequence, format, separator settings at once, text is scanned once
+    with one regular expression. Each extracted pair is tagged with the settings that matched it. """
+
+    _regex_cache = {}
+    _regex_cache_lock = threading.Lock()
+
+    def __init__(self, settings=ALL_EXTRACTION_SETTINGS):
+        """
+        :param settings: sequence of extraction_settings (or tuples: coord_sequence, coord_format, coord_sep),
+                         when more settings match at the same position of text the one listed first is used.
+        """
+        self.settings = tuple(extraction_settings(*s) for s in settings)
+        if not self.settings:
+            raise ValueError('At least one extraction settings required!')
+        self.coordinates_pair_regex = self.get_combined_regex(self.settings)
+        # Index of group with first coordinate in pair for each settings, by outer group name
+        self._group_settings = {'c{}'.format(idx): (self.coordinates_pair_regex.groupindex['c{}'.format(idx)] + 1, s)
+                                for idx, s in enumerate(self.settings)}
+        self.settings_counts = Counter()
+
+    @classmethod
+    def get_combined_regex(cls, settings):
+        """ Return compiled regular expression matching any of settings, compiled once per settings sequence
+        and shared between instances. Pair of settings settings[idx] is captured by 'c{idx}' group, its coordinates
+        by two groups following it.
+        :param settings: tuple of extraction_settings
+        :return: compiled regular expression
+        """
+        with cls._regex_cache_lock:
+            regex = cls._regex_cache.get(settings)
+            if regex is None:
+                alternatives = []
+                for idx, s in enumerate(settings):
+                    regex_str = CoordinatePairExtraction.get_coordinates_pair_regex_str(*s, named_groups=False)
+                    if not regex_str:
+                        raise ValueError('Not supported extraction settings: {}!'.format(s))
+                    alternatives.append('(?P<c{idx}>{regex_str})'.format(idx=idx, regex_str=regex_str))
+                # Lookahead skips positions which cannot start any coordinate without trying all alternatives
+                regex = re.compile('(?=[0-9NSEW])(?:' + '|'.join(alternatives) + ')')
+                cls._regex_cache[settings] = regex
+            return regex
+
+    def extract_coordinates(self, plain_text):
+        """ Get list of coordinate pairs, tagged with settings which matched them, from plain text.
+        Counts of pairs per settings are accumulated in settings_counts attribute.
+        :param plain_text: str, text from which coordinates are extracted.
+        :return: list of tagged_coord_pair: settings - extraction_settings, pair - tuple of coordinates in
+                 settings.coord_sequence order.
+        """
+        normalized_text = CoordinatePairExtraction.remove_new_line_character(plain_text)
+        tagged_pairs = []
+        for match in self.coordinates_pair_regex.finditer(normalized_text):
+            group_idx, settings = self._group_settings[match.lastgroup]
+            tagged_pairs.append(tagged_coord_pair(settings, match.group(group_idx, group_idx + 1)))
+        self.settings_counts.update(tagged_pair.settings for tagged_pair in tagged_pairs)
+        return tagged_pairs
+
+    def get_dominant_settings(self):
+        """ Return settings which extracted the most coordinate pairs so far, e.g. to use them in
+        CoordinatePairExtraction for next documents from the same source.
+        :return: tuple(extraction_settings, int): settings and number of pairs, None if no pairs extracted
+        """
+        most_common = self.settings_counts.most_common(1)
+        return most_common[0] if most_common else None
+
+    def get_dominant_extractor(self):
+        """ Return single settings extractor using dominant settings.
+        :return: CoordinatePairExtraction, None if no pairs extracted
+        """
+        dominant = self.get_dominant_settings()
+        if dominant is None:
+            return None
+        return CoordinatePairExtraction(*dominant[0])
@@ -4,6 +4,8 @@ coordinate point based on the coordinate initial point and distance and bearing,
 distance between to points.
 """
 import math
+import sys
+from array import array
 from collections import namedtuple
 
 ellipsoid = namedtuple('Ellipsoid', ['a', 'b', 'f'])
@@ -11,24 +13,42 @@ ellipsoid = namedtuple('Ellipsoid', ['a', 'b', 'f'])
 ellipsoids = {'WGS84': ellipsoid(a=6378137.0, b=6356752.3141, f=1 / 298.25722210088),
               'WGS72': ellipsoid(a=6378135.0, b=6356750.52, f=1 / 298.26000000000)}
 
+inverse_solution = namedtuple('InverseSolution', ['distance', 'azimuth_fwd', 'azimuth_back', 'converged'])
 
-def vincenty_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
-    """ Computes the latitude and longitude of the second point based on latitude, longitude,
-    of the first point and distance and azimuth from first point to second point.
-    Uses the algorithm by Thaddeus Vincenty for direct geodetic problem.
-    For more information refer to: http://www.ngs.noaa.gov/PUBS_LIB/inverse.pdf
-    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+VINCENTY_INVERSE_MAX_ITERATIONS = 200
+
+
+def _broadcast(*args):
+    """ Broadcast scalars and sequences to lists of the common length.
+    :param args: float or sequence of floats
+    :return: tuple(int, list): common length and list of broadcast values for each argument
+    """
+    sizes = {len(arg) for arg in args if hasattr(arg, '__len__')} - {1}
+    if len(sizes) > 1:
+        raise ValueError(f'Arguments cannot be broadcast together, lengths: {sorted(sizes)}.')
+    size = sizes.pop() if sizes else 1
+
+    values = []
+    for arg in args:
+        if not hasattr(arg, '__len__'):
+            values.append([float(arg)] * size)
+        elif len(arg) == 1:
+            values.append([float(arg[0])] * size)
+        else:
+            values.append([float(v) for v in arg])
+    return size, values
+
+
+def _direct_azimuth_terms(lat_initial, azimuth_initial, ellipsoid_params):
+    """ Computes terms of the Vincenty direct solution that depend only on the latitude of the initial point
+    and the initial azimuth.
     :param lat_initial: float, latitude of the initial point in decimal degrees format
-    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
-    :param distance: float, distance from first point to second point; meters
-    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
-    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    :param azimuth_initial: float, azimuth from the initial point in decimal degrees format
+    :param ellipsoid_params: Ellipsoid, parameters of the ellipsoid
+    :return: tuple: sin_alpha1, cos_alpha1, sin_u1, cos_u1, sigma1, sin_alpha, cos_sq_alpha, A, B
     """
-    # Unpack parameters of ellipsoid
-    a, b, f = ellipsoids[ellipsoid_name]
+    a, b, f = ellipsoid_params
 
-    # Convert latitude, longitude, azimuth of the initial point to radians
-    lon1 = math.radians(lon_initial)
     lat1 = math.radians(lat_initial)
     alpha1 = math.radians(azimuth_initial)
 
@@ -50,19 +70,27 @@ def vincenty_direct_solution(lon_initial, lat_initial, azimuth_initial, distance
     A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
     B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
 
-    sigma = distance / (b * A)
-    sigmap = 1
-    sin_sigma, cos_sigma, cos2sigma_m = None, None, None
+    return sin_alpha1, cos_alpha1, sin_u1, cos_u1, sigma1, sin_alpha, cos_sq_alpha, A, B
 
-    while math.fabs(sigma - sigmap) > 1e-12:
-        cos2sigma_m = math.cos(2 * sigma1 + sigma)
-        sin_sigma = math.sin(sigma)
-        cos_sigma = math.cos(sigma)
-        d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
-                    cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
-                        -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
-        sigmap = sigma
-        sigma = distance / (b * A) + d_sigma
+
+def _direct_sigma_step(sigma, sigma1, B):
+    """ Single iteration of the Vincenty direct solution sigma loop.
+    :return: tuple: sin_sigma, cos_sigma, cos2sigma_m, d_sigma
+    """
+    cos2sigma_m = math.cos(2 * sigma1 + sigma)
+    sin_sigma = math.sin(sigma)
+    cos_sigma = math.cos(sigma)
+    d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
+                cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
+                    -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
+    return sin_sigma, cos_sigma, cos2sigma_m, d_sigma
+
+
+def _direct_end_point(lon_initial, azimuth_terms, sigma, sin_sigma, cos_sigma, cos2sigma_m, f):
+    """ Computes longitude and latitude of the end point of the Vincenty direct solution when sigma converged.
+    :return: tuple(float, float): longitude and latitude of the end point in decimal degrees format
+    """
+    sin_alpha1, cos_alpha1, sin_u1, cos_u1, sigma1, sin_alpha, cos_sq_alpha, A, B = azimuth_terms
 
     var_aux = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1  # Auxiliary variable
 
@@ -75,10 +103,648 @@ def vincenty_direct_solution(lon_initial, lat_initial, azimuth_initial, distance
     L = lamb - (1 - C) * f * sin_alpha * (
                 sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)))
     # Longitude of the end point in radians
-    lon2 = (lon1 + L + 3 * math.pi) % (2 * math.pi) - math.pi
+    lon2 = (math.radians(lon_initial) + L + 3 * math.pi) % (2 * math.pi) - math.pi
 
     # Convert to decimal degrees
-    lon_end = math.degrees(lon2)
-    lat_end = math.degrees(lat2)
+    return math.degrees(lon2), math.degrees(lat2)
+
+
+def _direct_from_azimuth_terms(lon_initial, azimuth_terms, distance, ellipsoid_params):
+    """ Computes longitude and latitude of the end point of the Vincenty direct solution
+    based on precomputed azimuth terms (see _direct_azimuth_terms).
+    :return: tuple(float, float): longitude and latitude of the end point in decimal degrees format
+    """
+    b, f = ellipsoid_params.b, ellipsoid_params.f
+    sigma1, A, B = azimuth_terms[4], azimuth_terms[7], azimuth_terms[8]
+
+    sigma = distance / (b * A)
+    sigmap = 1
+    sin_sigma, cos_sigma, cos2sigma_m = None, None, None
+
+    while math.fabs(sigma - sigmap) > 1e-12:
+        sin_sigma, cos_sigma, cos2sigma_m, d_sigma = _direct_sigma_step(sigma, sigma1, B)
+        sigmap = sigma
+        sigma = distance / (b * A) + d_sigma
+
+    return _direct_end_point(lon_initial, azimuth_terms, sigma, sin_sigma, cos_sigma, cos2sigma_m, f)
+
+
+def vincenty_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
+    """ Computes the latitude and longitude of the second point based on latitude, longitude,
+    of the first point and distance and azimuth from first point to second point.
+    Uses the algorithm by Thaddeus Vincenty for direct geodetic problem.
+    For more information refer to: http://www.ngs.noaa.gov/PUBS_LIB/inverse.pdf
+    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
+    :param distance: float, distance from first point to second point; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    """
+    ellipsoid_params = ellipsoids[ellipsoid_name]
+    azimuth_terms = _direct_azimuth_terms(lat_initial, azimuth_initial, ellipsoid_params)
+    return _direct_from_azimuth_terms(lon_initial, azimuth_terms, distance, ellipsoid_params)
+
+
+def vincenty_direct_solution_batch(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
+    """ Batch version of the vincenty_direct_solution. Each argument can be either scalar or sequence
+    (list, tuple, array.array, numpy.ndarray etc.); scalars and sequences of length 1 are broadcast
+    to the length of the other sequences.
+    The sigma loop is iterated for all the points at once, points that already converged are masked out
+    from the next iterations.
+    :param lon_initial: float or sequence of floats, longitude of the initial points in decimal degrees format
+    :param lat_initial: float or sequence of floats, latitude of the initial points in decimal degrees format
+    :param azimuth_initial: float or sequence of floats, azimuth from the initial points to the end points
+                            in decimal degrees format
+    :param distance: float or sequence of floats, distance from initial points to end points; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return lon_end, lat_end: array.array('d'), array.array('d'): longitudes and latitudes of the end points
+            in decimal degrees format. Arrays support buffer protocol, e.g. numpy.frombuffer(lon_end) does not copy.
+    """
+    ellipsoid_params = ellipsoids[ellipsoid_name]
+    b, f = ellipsoid_params.b, ellipsoid_params.f
+    size, (lons, lats, azimuths, distances) = _broadcast(lon_initial, lat_initial, azimuth_initial, distance)
+
+    terms = [_direct_azimuth_terms(lat, azm, ellipsoid_params) for lat, azm in zip(lats, azimuths)]
+    sigma0 = [dist / (b * t[7]) for dist, t in zip(distances, terms)]
+    sigma = sigma0[:]
+    sigmap = [1.0] * size
+    sin_sigma, cos_sigma, cos2sigma_m = [None] * size, [None] * size, [None] * size
+
+    active = [i for i in range(size) if math.fabs(sigma[i] - sigmap[i]) > 1e-12]
+    while active:
+        for i in active:
+            sin_sigma[i], cos_sigma[i], cos2sigma_m[i], d_sigma = _direct_sigma_step(sigma[i], terms[i][4],
+                                                                                      terms[i][8])
+            sigmap[i] = sigma[i]
+            sigma[i] = sigma0[i] + d_sigma
+        active = [i for i in active if math.fabs(sigma[i] - sigmap[i]) > 1e-12]
+
+    lon_end, lat_end = array('d'), array('d')
+    for i in range(size):
+        lon, lat = _direct_end_point(lons[i], terms[i], sigma[i], sin_sigma[i], cos_sigma[i], cos2sigma_m[i], f)
+        lon_end.append(lon)
+        lat_end.append(lat)
 
     return lon_end, lat_end
+
+
+def _inverse_solve(lon_diff, sin_u1, cos_u1, sin_u2, cos_u2, ellipsoid_params):
+    """ Solves inverse geodetic problem for the points given by the reduced latitude terms.
+    :param lon_diff: float, difference of the longitudes of the end and initial point in radians
+    :param sin_u1, cos_u1: float, float, sine and cosine of the reduced latitude of the initial point
+    :param sin_u2, cos_u2: float, float, sine and cosine of the reduced latitude of the end point
+    :param ellipsoid_params: Ellipsoid, parameters of the ellipsoid
+    :return: tuple(float, float, float): distance (meters), forward azimuth and back azimuth (decimal degrees)
+             or None if solution does not converge (nearly antipodal points)
+    """
+    a, b, f = ellipsoid_params
+
+    lamb = lon_diff
+    for _ in range(VINCENTY_INVERSE_MAX_ITERATIONS):
+        sin_lamb = math.sin(lamb)
+        cos_lamb = math.cos(lamb)
+        sin_sigma = math.sqrt((cos_u2 * sin_lamb) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lamb) ** 2)
+        if sin_sigma == 0:
+            return 0.0, 0.0, 0.0  # Coincident points
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lamb
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lamb / sin_sigma
+        cos_sq_alpha = 1 - sin_alpha * sin_alpha
+        # Geodesic along the equator: cos_sq_alpha = 0
+        cos2sigma_m = cos_sigma - 2 * sin_u1 * sin_u2 / cos_sq_alpha if cos_sq_alpha != 0 else 0.0
+        C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+        lambp = lamb
+        lamb = lon_diff + (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)))
+        if math.fabs(lamb) > math.pi:
+            return None
+        if math.fabs(lamb - lambp) <= 1e-12:
+            break
+    else:
+        return None
+
+    u_sq = cos_sq_alpha * (a * a - b * b) / (b * b)
+    A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
+            cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
+                -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
+    distance = b * A * (sigma - d_sigma)
+
+    alpha1 = math.atan2(cos_u2 * sin_lamb, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lamb)
+    alpha2 = math.atan2(cos_u1 * sin_lamb, -sin_u1 * cos_u2 + cos_u1 * sin_u2 * cos_lamb)
+
+    azimuth_fwd = math.degrees(alpha1) % 360
+    azimuth_back = (math.degrees(alpha2) + 180) % 360
+    return distance, azimuth_fwd, azimuth_back
+
+
+def _longitude_difference(lon_initial, lon_end):
+    """ Return difference of the longitudes normalized to <-pi, pi) in radians. """
+    return math.radians((lon_end - lon_initial + 180) % 360 - 180)
+
+
+def _reduced_latitude_terms(lat, f):
+    """ Return sine and cosine of the reduced latitude.
+    :param lat: float, latitude in decimal degrees format
+    :param f: float, flattening of the ellipsoid
+    :return: tuple(float, float)
+    """
+    tan_u = (1 - f) * math.tan(math.radians(lat))
+    cos_u = 1 / math.sqrt(1 + tan_u * tan_u)
+    return tan_u * cos_u, cos_u
+
+
+def vincenty_inverse_solution(lon_initial, lat_initial, lon_end, lat_end, ellipsoid_name="WGS84"):
+    """ Computes the distance, forward and back azimuth between two points.
+    Uses the algorithm by Thaddeus Vincenty for inverse geodetic problem.
+    For more information refer to: http://www.ngs.noaa.gov/PUBS_LIB/inverse.pdf
+    :param lon_initial: float, longitude of the initial point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param lon_end: float, longitude of the end point in decimal degrees format
+    :param lat_end: float, latitude of the end point in decimal degrees format
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return distance, azimuth_fwd, azimuth_back: float, float, float: distance in meters,
+            azimuth from the initial to the end point and azimuth from the end point to the initial point,
+            both in decimal degrees format <0, 360)
+    :raise ValueError: if solution does not converge, which happens for nearly antipodal points
+    """
+    ellipsoid_params = ellipsoids[ellipsoid_name]
+    sin_u1, cos_u1 = _reduced_latitude_terms(lat_initial, ellipsoid_params.f)
+    sin_u2, cos_u2 = _reduced_latitude_terms(lat_end, ellipsoid_params.f)
+
+    result = _inverse_solve(_longitude_difference(lon_initial, lon_end), sin_u1, cos_u1, sin_u2, cos_u2,
+                            ellipsoid_params)
+    if result is None:
+        raise ValueError(f'Vincenty inverse solution failed to converge for nearly antipodal points: '
+                         f'{lon_initial} {lat_initial}, {lon_end} {lat_end}.')
+    return result
+
+
+def _inverse_solution_arrays(pairs, ellipsoid_params):
+    """ Solve inverse geodetic problem for each pair of points given by longitude difference and reduced latitude
+    terms of both points.
+    :return: inverse_solution, solution with NaN values and converged flag 0 for not converged pairs
+    """
+    solution = inverse_solution(array('d'), array('d'), array('d'), array('b'))
+    nan_result = (math.nan, math.nan, math.nan)
+    for lon_diff, (sin_u1, cos_u1), (sin_u2, cos_u2) in pairs:
+        result = _inverse_solve(lon_diff, sin_u1, cos_u1, sin_u2, cos_u2, ellipsoid_params)
+        distance, azimuth_fwd, azimuth_back = result or nan_result
+        solution.distance.append(distance)
+        solution.azimuth_fwd.append(azimuth_fwd)
+        solution.azimuth_back.append(azimuth_back)
+        solution.converged.append(result is not None)
+    return solution
+
+
+def vincenty_inverse_solution_batch(lon_initial, lat_initial, lon_end, lat_end, ellipsoid_name="WGS84"):
+    """ Batch version of the vincenty_inverse_solution, arguments are broadcast as in vincenty_direct_solution_batch.
+    Not converged (nearly antipodal) pairs do not raise error: their distance and azimuths are NaN
+    and converged flag is 0.
+    :param lon_initial: float or sequence of floats, longitude of the initial points in decimal degrees format
+    :param lat_initial: float or sequence of floats, latitude of the initial points in decimal degrees format
+    :param lon_end: float or sequence of floats, longitude of the end points in decimal degrees format
+    :param lat_end: float or sequence of floats, latitude of the end points in decimal degrees format
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: inverse_solution: distance, azimuth_fwd, azimuth_back (array.array('d')) and converged (array.array('b'))
+    """
+    ellipsoid_params = ellipsoids[ellipsoid_name]
+    f = ellipsoid_params.f
+    size, (lons1, lats1, lons2, lats2) = _broadcast(lon_initial, lat_initial, lon_end, lat_end)
+
+    pairs = ((_longitude_difference(lon1, lon2), _reduced_latitude_terms(lat1, f),
+              _reduced_latitude_terms(lat2, f))
+             for lon1, lat1, lon2, lat2 in zip(lons1, lats1, lons2, lats2))
+    return _inverse_solution_arrays(pairs, ellipsoid_params)
+
+
+def vincenty_inverse_matrix(lons_from, lats_from, lons_to, lats_to, ellipsoid_name="WGS84"):
+    """ Computes distance and azimuths for every pair of N 'from' points and M 'to' points,
+    e.g. fix to navaid table. Reduced latitudes are computed once per point, not once per pair.
+    :param lons_from: sequence of floats, longitudes of the N 'from' points in decimal degrees format
+    :param lats_from: sequence of floats, latitudes of the N 'from' points in decimal degrees format
+    :param lons_to: sequence of floats, longitudes of the M 'to' points in decimal degrees format
+    :param lats_to: sequence of floats, latitudes of the M 'to' points in decimal degrees format
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: inverse_solution: N x M matrices flattened in row-major order - value for i-th 'from' point
+             and j-th 'to' point is at index i * M + j. Not converged pairs as in vincenty_inverse_solution_batch.
+    """
+    if len(lons_from) != len(lats_from) or len(lons_to) != len(lats_to):
+        raise ValueError('Number of longitudes and latitudes must be the same.')
+    ellipsoid_params = ellipsoids[ellipsoid_name]
+    f = ellipsoid_params.f
+
+    terms_from = [_reduced_latitude_terms(lat, f) for lat in lats_from]
+    terms_to = [_reduced_latitude_terms(lat, f) for lat in lats_to]
+
+    pairs = ((_longitude_difference(lon_from, lon_to), term_from, term_to)
+             for lon_from, term_from in zip(lons_from, terms_from)
+             for lon_to, term_to in zip(lons_to, terms_to))
+    return _inverse_solution_arrays(pairs, ellipsoid_params)
+
+
+class FixedOriginDirectSolver:
+    """ Solves direct geodetic problem for the fixed initial point and fixed set of azimuths,
+    e.g. radials of the VOR. Terms of the Vincenty direct solution that depend only on the initial point
+    and azimuth (reduced latitude, sigma1, sin_alpha, u^2, A, B) are computed once per azimuth
+    and reused for all the distances - useful for range rings, DME arcs, radial fans.
+    Results are the same as the results of the vincenty_direct_solution.
+    """
+
+    def __init__(self, lon_initial, lat_initial, azimuths, ellipsoid_name="WGS84"):
+        """
+        :param lon_initial: float, longitude of the initial point in decimal degrees format
+        :param lat_initial: float, latitude of the initial point in decimal degrees format
+        :param azimuths: sequence of floats, azimuths from the initial point in decimal degrees format
+        :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+        """
+        self.lon_initial = lon_initial
+        self.lat_initial = lat_initial
+        self.azimuths = [float(azimuth) for azimuth in azimuths]
+        self.ellipsoid_name = ellipsoid_name
+        self._ellipsoid_params = ellipsoids[ellipsoid_name]
+        self._azimuth_terms = [_direct_azimuth_terms(lat_initial, azimuth, self._ellipsoid_params)
+                               for azimuth in self.azimuths]
+
+    def __len__(self):
+        return len(self.azimuths)
+
+    def solve_radial(self, azimuth_index, distances):
+        """ Computes end points along one radial.
+        :param azimuth_index: int, index of the azimuth in self.azimuths
+        :param distances: sequence of floats, distances from the initial point; meters
+        :return lon_end, lat_end: array.array('d'), array.array('d')
+        """
+        azimuth_terms = self._azimuth_terms[azimuth_index]
+        lon_end, lat_end = array('d'), array('d')
+        for distance in distances:
+            lon, lat = _direct_from_azimuth_terms(self.lon_initial, azimuth_terms, distance, self._ellipsoid_params)
+            lon_end.append(lon)
+            lat_end.append(lat)
+        return lon_end, lat_end
+
+    def solve_ring(self, distance):
+        """ Computes end points for all the azimuths at the same distance, e.g. range ring, DME arc.
+        :param distance: float, distance from the initial point; meters
+        :return lon_end, lat_end: array.array('d'), array.array('d'), in the order of self.azimuths
+        """
+        lon_end, lat_end = array('d'), array('d')
+        for azimuth_terms in self._azimuth_terms:
+            lon, lat = _direct_from_azimuth_terms(self.lon_initial, azimuth_terms, distance, self._ellipsoid_params)
+            lon_end.append(lon)
+            lat_end.append(lat)
+        return lon_end, lat_end
+
+    def solve(self, distances):
+        """ Computes end points for every azimuth and every distance.
+        :param distances: sequence of floats, distances from the initial point; meters
+        :return lon_end, lat_end: array.array('d'), array.array('d'), azimuth-major order - end point
+                for i-th azimuth and j-th distance is at index i * len(distances) + j
+        """
+        lon_end, lat_end = array('d'), array('d')
+        for azimuth_index in range(len(self._azimuth_terms)):
+            radial_lon, radial_lat = self.solve_radial(azimuth_index, distances)
+            lon_end.extend(radial_lon)
+            lat_end.extend(radial_lat)
+        return lon_end, lat_end
+
+
+# Coefficients of the 6th order series of the geodesic direct problem, for more information refer to:
+# C. F. F. Karney, Algorithms for geodesics, J. Geodesy 87, 43-55 (2013), https://doi.org/10.1007/s00190-012-0578-z
+SERIES_ORDER = 6
+
+_A1M1_COEFF = (1, 4, 64, 0, 256)
+_C1_COEFF = (-1, 6, -16, 32, -9, 64, -128, 2048, 9, -16, 768, 3, -5, 512, -7, 1280, -7, 2048)
+_C1P_COEFF = (205, -432, 768, 1536, 4005, -4736, 3840, 12288, -225, 116, 384, -7173, 2695, 7680, 3467, 7680,
+              38081, 61440)
+_A3_COEFF = (-3, 128, -2, -3, 64, -1, -3, -1, 16, 3, -1, -2, 8, 1, -1, 2, 1, 1)
+_C3_COEFF = (3, 128, 2, 5, 128, -1, 3, 3, 64, -1, 0, 1, 8, -1, 1, 4, 5, 256, 1, 3, 128, -3, -2, 3, 64, 1, -3, 2, 32,
+             7, 512, -10, 9, 384, 5, -9, 5, 192, 7, 512, -14, 7, 512, 21, 2560)
+
+_series_ellipsoid_coeffs = {}
+
+
+def _polyval(order, coeffs, start, x):
+    """ Evaluate polynomial of given order with coefficients coeffs[start:start + order + 1] using Horner method. """
+    y = coeffs[start] if order >= 0 else 0
+    for i in range(start + 1, start + order + 1):
+        y = y * x + coeffs[i]
+    return y
+
+
+def _sin_cos_series(sinp, sinx, cosx, coeffs):
+    """ Evaluate sum(coeffs[i] * sin(2 * i * x)) (sinp True) or sum(coeffs[i] * cos((2 * i + 1) * x)) (sinp False)
+    using Clenshaw summation.
+    """
+    k = len(coeffs)
+    n = k - (1 if sinp else 0)
+    ar = 2 * (cosx - sinx) * (cosx + sinx)
+    y1 = 0
+    if n & 1:
+        k -= 1
+        y0 = coeffs[k]
+    else:
+        y0 = 0
+    for _ in range(n // 2):
+        k -= 1
+        y1 = ar * y0 - y1 + coeffs[k]
+        k -= 1
+        y0 = ar * y1 - y0 + coeffs[k]
+    return 2 * sinx * cosx * y0 if sinp else cosx * (y0 - y1)
+
+
+def _series_coefficients(eps, coeff, order):
+    """ Coefficients C1[l] (C1p[l]) of the series, l = 1..order, index 0 not used. """
+    eps2 = eps * eps
+    c = [0.0] * (order + 1)
+    d = eps
+    o = 0
+    for i in range(1, order + 1):
+        m = (order - i) // 2
+        c[i] = d * _polyval(m, coeff, o, eps2) / coeff[o + m + 1]
+        o += m + 2
+        d *= eps
+    return c
+
+
+def _ellipsoid_series_coefficients(ellipsoid_name):
+    """ Return coefficients of the A3 and C3 series for the ellipsoid - polynomials in third flattening n,
+    computed once per ellipsoid.
+    """
+    if ellipsoid_name not in _series_ellipsoid_coeffs:
+        a, b, f = ellipsoids[ellipsoid_name]
+        n = f / (2 - f)
+
+        a3x = []
+        o = 0
+        for j in range(SERIES_ORDER - 1, -1, -1):
+            m = min(SERIES_ORDER - j - 1, j)
+            a3x.append(_polyval(m, _A3_COEFF, o, n) / _A3_COEFF[o + m + 1])
+            o += m + 2
+
+        c3x = []
+        o = 0
+        for i in range(1, SERIES_ORDER):
+            for j in range(SERIES_ORDER - 1, i - 1, -1):
+                m = min(SERIES_ORDER - j - 1, j)
+                c3x.append(_polyval(m, _C3_COEFF, o, n) / _C3_COEFF[o + m + 1])
+                o += m + 2
+
+        _series_ellipsoid_coeffs[ellipsoid_name] = a3x, c3x
+    return _series_ellipsoid_coeffs[ellipsoid_name]
+
+
+def karney_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
+    """ Computes the latitude and longitude of the second point based on latitude, longitude,
+    of the first point and distance and azimuth from first point to second point.
+    Uses fixed, 6th order series expansion by Charles F. F. Karney - there is no iteration, so cost of each call
+    is constant. Error for the WGS84 ellipsoid is below 15 nanometers for any distance (Karney, 2013).
+    For more information refer to: https://doi.org/10.1007/s00190-012-0578-z
+    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
+    :param distance: float, distance from first point to second point; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    """
+    a, _, f = ellipsoids[ellipsoid_name]
+    a3x, c3x = _ellipsoid_series_coefficients(ellipsoid_name)
+    f1 = 1 - f
+    ep2 = f * (2 - f) / (f1 * f1)
+    b = a * f1
+    tiny = math.sqrt(sys.float_info.min)
+
+    alpha1 = math.radians(azimuth_initial)
+    salp1, calp1 = math.sin(alpha1), math.cos(alpha1)
+
+    # beta1 - reduced latitude
+    lat1 = math.radians(lat_initial)
+    sbet1, cbet1 = f1 * math.sin(lat1), math.cos(lat1)
+    norm = math.hypot(sbet1, cbet1)
+    sbet1, cbet1 = sbet1 / norm, max(tiny, cbet1 / norm)
+
+    # alpha0 - azimuth of the geodesic at the equator
+    salp0 = salp1 * cbet1
+    calp0 = math.hypot(calp1, salp1 * sbet1)
+
+    # sigma1 - arc length from the equator to initial point, omega1 - longitude on the auxiliary sphere
+    ssig1 = sbet1
+    somg1 = salp0 * sbet1
+    csig1 = comg1 = cbet1 * calp1 if sbet1 != 0 or calp1 != 0 else 1
+    norm = math.hypot(ssig1, csig1)
+    ssig1, csig1 = ssig1 / norm, csig1 / norm
+
+    k2 = calp0 * calp0 * ep2
+    eps = k2 / (2 * (1 + math.sqrt(1 + k2)) + k2)
+
+    # Distance to arc length: tau12 -> sigma12
+    eps2 = eps * eps
+    a1m1 = (_polyval(2, _A1M1_COEFF, 0, eps2) * eps2 / _A1M1_COEFF[4] + eps) / (1 - eps)
+    c1a = _series_coefficients(eps, _C1_COEFF, SERIES_ORDER)
+    c1pa = _series_coefficients(eps, _C1P_COEFF, SERIES_ORDER)
+    b11 = _sin_cos_series(True, ssig1, csig1, c1a)
+    s, c = math.sin(b11), math.cos(b11)
+    stau1 = ssig1 * c + csig1 * s
+    ctau1 = csig1 * c - ssig1 * s
+
+    tau12 = distance / (b * (1 + a1m1))
+    s, c = math.sin(tau12), math.cos(tau12)
+    b12 = -_sin_cos_series(True, stau1 * c + ctau1 * s, ctau1 * c - stau1 * s, c1pa)
+    sig12 = tau12 - (b12 - b11)
+    ssig12, csig12 = math.sin(sig12), math.cos(sig12)
+
+    ssig2 = ssig1 * csig12 + csig1 * ssig12
+    csig2 = csig1 * csig12 - ssig1 * ssig12
+
+    # Latitude of the end point
+    sbet2 = calp0 * ssig2
+    cbet2 = math.hypot(salp0, calp0 * csig2)
+    if cbet2 == 0:
+        cbet2 = csig2 = tiny
+    lat2 = math.atan2(sbet2, f1 * cbet2)
+
+    # Longitude of the end point
+    somg2, comg2 = salp0 * ssig2, csig2
+    omg12 = math.atan2(somg2 * comg1 - comg2 * somg1, comg2 * comg1 + somg2 * somg1)
+    a3c = -f * salp0 * _polyval(SERIES_ORDER - 1, a3x, 0, eps)
+    c3a = [0.0] * SERIES_ORDER
+    mult = 1
+    o = 0
+    for i in range(1, SERIES_ORDER):
+        m = SERIES_ORDER - i - 1
+        mult *= eps
+        c3a[i] = mult * _polyval(m, c3x, o, eps)
+        o += m + 1
+    b31 = _sin_cos_series(True, ssig1, csig1, c3a)
+    lam12 = omg12 + a3c * (sig12 + (_sin_cos_series(True, ssig2, csig2, c3a) - b31))
+    lon2 = (math.radians(lon_initial) + lam12 + 3 * math.pi) % (2 * math.pi) - math.pi
+
+    return math.degrees(lon2), math.degrees(lat2)
+
+
+def spherical_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
+    """ Computes the latitude and longitude of the second point based on latitude, longitude,
+    of the first point and distance and azimuth from first point to second point.
+    Uses great circle on the sphere with mean radius of the ellipsoid (2a + b) / 3.
+    Maximum error is 0.6% of the distance.
+    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
+    :param distance: float, distance from first point to second point; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    """
+    a, b, _ = ellipsoids[ellipsoid_name]
+    lat1 = math.radians(lat_initial)
+    alpha1 = math.radians(azimuth_initial)
+    delta = distance / ((2 * a + b) / 3)  # Angular distance
+
+    sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
+    sin_delta, cos_delta = math.sin(delta), math.cos(delta)
+
+    sin_lat2 = sin_lat1 * cos_delta + cos_lat1 * sin_delta * math.cos(alpha1)
+    lat2 = math.asin(sin_lat2)
+    lamb = math.atan2(math.sin(alpha1) * sin_delta * cos_lat1, cos_delta - sin_lat1 * sin_lat2)
+    lon2 = (math.radians(lon_initial) + lamb + 3 * math.pi) % (2 * math.pi) - math.pi
+
+    return math.degrees(lon2), math.degrees(lat2)
+
+
+def mid_latitude_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84"):
+    """ Computes the latitude and longitude of the second point based on latitude, longitude,
+    of the first point and distance and azimuth from first point to second point.
+    Uses mid-latitude formulas: meridian and prime vertical radii of curvature and azimuth (corrected
+    for the convergence of meridians) at the mid-point of the line. Fast ellipsoidal approximation
+    for short lines, maximum error see direct_solver_max_error.
+    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
+    :param distance: float, distance from first point to second point; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    """
+    a, _, f = ellipsoids[ellipsoid_name]
+    e2 = f * (2 - f)
+    lat1 = math.radians(lat_initial)
+    alpha1 = math.radians(azimuth_initial)
+
+    # Radii of curvature: M - meridian, N - prime vertical
+    w = 1 - e2 * math.sin(lat1) ** 2
+    M, N = a * (1 - e2) / w ** 1.5, a / math.sqrt(w)
+
+    # First estimates of the mid-point latitude and azimuth, refined twice
+    lat_m = lat1 + distance * math.cos(alpha1) / (2 * M)
+    alpha_m = alpha1 + distance * math.sin(alpha1) * math.tan(lat1) / (2 * N)
+    d_lat, d_lon = 0.0, 0.0
+    for _ in range(2):
+        w = 1 - e2 * math.sin(lat_m) ** 2
+        M, N = a * (1 - e2) / w ** 1.5, a / math.sqrt(w)
+        d_lat = distance * math.cos(alpha_m) / M
+        d_lon = distance * math.sin(alpha_m) / (N * math.cos(lat_m))
+        lat_m = lat1 + d_lat / 2
+        alpha_m = alpha1 + d_lon * math.sin(lat_m) / 2
+
+    lat2 = lat1 + d_lat
+    if math.fabs(lat2) > math.pi / 2:
+        # Line passes over the pole: continue along opposite meridian
+        lat2 = math.copysign(math.pi, lat2) - lat2
+        d_lon += math.pi
+    lon2 = (math.radians(lon_initial) + d_lon + 3 * math.pi) % (2 * math.pi) - math.pi
+    return math.degrees(lon2), math.degrees(lat2)
+
+
+# Direct geodetic problem solvers
+DIRECT_SOLVER_SPHERICAL = 'DIRECT_SOLVER_SPHERICAL'  # Great circle, error up to 0.6% of distance
+DIRECT_SOLVER_MID_LATITUDE = 'DIRECT_SOLVER_MID_LATITUDE'  # Fast ellipsoidal approximation for short lines
+DIRECT_SOLVER_VINCENTY = 'DIRECT_SOLVER_VINCENTY'  # Iterative, accuracy ~0.5 mm
+DIRECT_SOLVER_KARNEY = 'DIRECT_SOLVER_KARNEY'  # Non-iterative, constant cost, accuracy ~15 nm
+
+# Solvers in order of increasing cost
+DIRECT_SOLVERS = {
+    DIRECT_SOLVER_SPHERICAL: spherical_direct_solution,
+    DIRECT_SOLVER_MID_LATITUDE: mid_latitude_direct_solution,
+    DIRECT_SOLVER_VINCENTY: vincenty_direct_solution,
+    DIRECT_SOLVER_KARNEY: karney_direct_solution,
+}
+
+# Maximum latitude (of any point of the line) for which mid-latitude solver is used
+MID_LATITUDE_SOLVER_MAX_LATITUDE = 89.0
+
+_default_direct_solver = DIRECT_SOLVER_VINCENTY
+
+
+def set_default_direct_solver(solver):
+    """ Set solver used by direct_solution when solver is not specified in call.
+    :param solver: str, one of the DIRECT_SOLVERS keys, e.g. DIRECT_SOLVER_KARNEY
+    """
+    global _default_direct_solver
+    if solver not in DIRECT_SOLVERS:
+        raise ValueError(f'Direct solver {solver} not supported.')
+    _default_direct_solver = solver
+
+
+def get_default_direct_solver():
+    """ Return solver used by direct_solution when solver is not specified in call. """
+    return _default_direct_solver
+
+
+def direct_solver_max_error(solver, distance, lat_initial=0.0):
+    """ Return maximum error of the end point computed by given solver.
+    :param solver: str, one of the DIRECT_SOLVERS keys
+    :param distance: float, distance from initial point to end point; meters
+    :param lat_initial: float, latitude of the initial point in decimal degrees format,
+                        used only by the DIRECT_SOLVER_MID_LATITUDE bound
+    :return: float, maximum error; meters
+    """
+    if solver == DIRECT_SOLVER_SPHERICAL:
+        return 0.006 * distance
+    elif solver == DIRECT_SOLVER_MID_LATITUDE:
+        # Error grows with cube of the distance and towards the poles, bound is valid for lines not passing
+        # near the pole
+        lat_max = math.fabs(lat_initial) + math.degrees(distance / 6335439.0)
+        if lat_max >= MID_LATITUDE_SOLVER_MAX_LATITUDE:
+            return math.inf
+        return 2e-15 * distance ** 3 / math.cos(math.radians(lat_max)) ** 2
+    elif solver == DIRECT_SOLVER_VINCENTY:
+        return 0.0005
+    elif solver == DIRECT_SOLVER_KARNEY:
+        return 15e-9
+    raise ValueError(f'Direct solver {solver} not supported.')
+
+
+def select_direct_solver(distance, tolerance, lat_initial=0.0):
+    """ Return the cheapest solver which maximum error does not exceed tolerance.
+    :param distance: float, distance from initial point to end point; meters
+    :param tolerance: float, maximum acceptable error; meters
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :return: str, one of the DIRECT_SOLVERS keys
+    """
+    for solver in DIRECT_SOLVERS:
+        if direct_solver_max_error(solver, distance, lat_initial) <= tolerance:
+            return solver
+    return DIRECT_SOLVER_KARNEY
+
+
+def direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name="WGS84", solver=None,
+                    tolerance=None):
+    """ Computes the latitude and longitude of the second point based on latitude, longitude,
+    of the first point and distance and azimuth from first point to second point using given solver.
+    :param lon_initial: float, longitude of the initial  point in decimal degrees format
+    :param lat_initial: float, latitude of the initial point in decimal degrees format
+    :param azimuth_initial, azimuth from the initial point to the end point in decimal degrees format
+    :param distance: float, distance from first point to second point; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :param solver: str, one of the DIRECT_SOLVERS keys, if not specified default solver is used
+                   (see set_default_direct_solver)
+    :param tolerance: float, maximum acceptable error in meters, if specified and solver is not specified
+                      the cheapest solver that meets tolerance is used (see select_direct_solver)
+    :return lon_end, lat_end: float, float longitude and longitude of the end point in decimal degrees format
+    """
+    if solver is None and tolerance is not None:
+        solver = select_direct_solver(distance, tolerance, lat_initial)
+    solver_func = DIRECT_SOLVERS.get(solver or _default_direct_solver)
+    if solver_func is None:
+        raise ValueError(f'Direct solver {solver} not supported.')
+    return solver_func(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name)
@@ -0,0 +1,258 @@
+"""
+geodesic_densification module provides functionality to convert geodesic shapes used in airspace and obstacle zone
+definitions (circles, arcs, sectors) and geodesic lines (boundary segments, airway legs) into vertices arrays,
+e.g. for polygons and lines in planar GIS tools.
+"""
+import math
+from array import array
+from collections import namedtuple
+
+from aviation_gis_tools.point_calculation import *
+
+# Arc directions
+ARC_CW = 'ARC_CW'  # Clockwise
+ARC_CCW = 'ARC_CCW'  # Counterclockwise
+
+vertices = namedtuple('Vertices', ['lon', 'lat'])
+
+
+def get_arc_vertex_count(radius, sweep_angle, vertex_count=None, max_deviation=None, min_vertex_count=2):
+    """ Return number of vertices of the arc, either given explicitly or derived from the maximum deviation
+    between chord and arc: radius * (1 - cos(step / 2)) <= max_deviation.
+    :param radius: float, radius of the arc; meters
+    :param sweep_angle: float, angle between first and last vertex of the arc in decimal degrees format
+    :param vertex_count: int, number of vertices
+    :param max_deviation: float, maximum distance between chord and arc; meters
+    :param min_vertex_count: int, minimum number of vertices
+    :return: int
+    """
+    if (vertex_count is None) == (max_deviation is None):
+        raise ValueError('Exactly one of vertex_count, max_deviation is required.')
+    if vertex_count is not None:
+        if vertex_count < min_vertex_count:
+            raise ValueError(f'At least {min_vertex_count} vertices required.')
+        return vertex_count
+    if max_deviation <= 0:
+        raise ValueError('Maximum deviation has to be positive number.')
+    if max_deviation >= radius:
+        return min_vertex_count
+    max_step = math.degrees(2 * math.acos(1 - max_deviation / radius))
+    return max(min_vertex_count, math.ceil(sweep_angle / max_step) + 1)
+
+
+def get_sweep_angle(azimuth_start, azimuth_end, direction):
+    """ Return angle from start azimuth to end azimuth in given direction, equal azimuths give full circle.
+    :param azimuth_start: float, decimal degrees
+    :param azimuth_end: float, decimal degrees
+    :param direction: str, ARC_CW or ARC_CCW
+    :return: float, angle in range (0, 360> in decimal degrees format
+    """
+    if direction == ARC_CW:
+        sweep_angle = (azimuth_end - azimuth_start) % 360
+    elif direction == ARC_CCW:
+        sweep_angle = (azimuth_start - azimuth_end) % 360
+    else:
+        raise ValueError(f'Arc direction {direction} not supported.')
+    return sweep_angle or 360.0
+
+
+def _arc_azimuths(azimuth_start, sweep_angle, direction, vertex_count):
+    """ Return vertex_count azimuths evenly distributed from start azimuth through sweep angle. """
+    step = sweep_angle / (vertex_count - 1)
+    if direction == ARC_CCW:
+        step = -step
+    return [(azimuth_start + i * step) % 360 for i in range(vertex_count)]
+
+
+def densify_circle(center: Point, radius, vertex_count=None, max_deviation=None, ellipsoid_name="WGS84"):
+    """ Convert circle into vertices, clockwise starting from the true north.
+    Note: ring is not closed - first vertex is not repeated at the end.
+    :param center: Point or PointView, center of the circle
+    :param radius: float, radius of the circle; meters
+    :param vertex_count: int, number of vertices
+    :param max_deviation: float, maximum distance between chord and circle; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: vertices: lon, lat (array.array('d'))
+    """
+    if radius <= 0:
+        raise ValueError('Circle radius has to be positive number.')
+    vertex_count = get_arc_vertex_count(radius, 360, vertex_count, max_deviation, min_vertex_count=3)
+    if max_deviation is not None:
+        vertex_count = max(3, vertex_count - 1)  # Full arc counts start vertex twice
+    azimuths = [i * 360 / vertex_count for i in range(vertex_count)]
+    return vertices(*vincenty_direct_solution_batch(center.lon, center.lat, azimuths, radius, ellipsoid_name))
+
+
+def densify_arc(center: Point, start: Point, end: Point, direction, vertex_count=None, max_deviation=None,
+                ellipsoid_name="WGS84"):
+    """ Convert arc from start point to end point around center into vertices.
+    If distances center - start and center - end differ (rounded coordinates in source data)
+    radius changes linearly along the arc. First and last vertex are exactly start and end point.
+    :param center: Point or PointView, center of the arc
+    :param start: Point or PointView, start point of the arc
+    :param end: Point or PointView, end point of the arc
+    :param direction: str, ARC_CW or ARC_CCW
+    :param vertex_count: int, number of vertices including start and end point
+    :param max_deviation: float, maximum distance between chord and arc; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: vertices: lon, lat (array.array('d'))
+    """
+    radius_start, azimuth_start, _ = vincenty_inverse_solution(center.lon, center.lat, start.lon, start.lat,
+                                                               ellipsoid_name)
+    radius_end, azimuth_end, _ = vincenty_inverse_solution(center.lon, center.lat, end.lon, end.lat,
+                                                           ellipsoid_name)
+    if radius_start <= 0 or radius_end <= 0:
+        raise ValueError('Arc start and end point must differ from the arc center.')
+
+    sweep_angle = get_sweep_angle(azimuth_start, azimuth_end, direction)
+    vertex_count = get_arc_vertex_count(max(radius_start, radius_end), sweep_angle, vertex_count, max_deviation)
+    azimuths = _arc_azimuths(azimuth_start, sweep_angle, direction, vertex_count)
+    radii = [radius_start + (radius_end - radius_start) * i / (vertex_count - 1) for i in range(vertex_count)]
+
+    lon, lat = vincenty_direct_solution_batch(center.lon, center.lat, azimuths, radii, ellipsoid_name)
+    lon[0], lat[0] = start.lon, start.lat
+    lon[-1], lat[-1] = end.lon, end.lat
+    return vertices(lon, lat)
+
+
+def densify_sector(center: Point, radius, azimuth_start, azimuth_end, direction=ARC_CW, inner_radius=0.0,
+                   vertex_count=None, max_deviation=None, ellipsoid_name="WGS84"):
+    """ Convert sector into vertices of the polygon: outer arc from start to end azimuth in given direction,
+    then inner arc back to start azimuth, or sector center if inner radius is 0.
+    Note: ring is not closed - first vertex is not repeated at the end.
+    :param center: Point or PointView, center of the sector
+    :param radius: float, outer radius; meters
+    :param azimuth_start: float, start azimuth of the sector in decimal degrees format
+    :param azimuth_end: float, end azimuth of the sector in decimal degrees format
+    :param direction: str, ARC_CW or ARC_CCW
+    :param inner_radius: float, inner radius; meters
+    :param vertex_count: int, number of vertices of the outer arc
+    :param max_deviation: float, maximum distance between chord and arc; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: vertices: lon, lat (array.array('d'))
+    """
+    if not 0 <= inner_radius < radius:
+        raise ValueError('Sector radius has to be greater than inner radius, inner radius can not be negative.')
+
+    sweep_angle = get_sweep_angle(azimuth_start, azimuth_end, direction)
+    vertex_count = get_arc_vertex_count(radius, sweep_angle, vertex_count, max_deviation)
+    azimuths = _arc_azimuths(azimuth_start, sweep_angle, direction, vertex_count)
+    radii = [radius] * vertex_count
+    if inner_radius > 0:
+        azimuths += azimuths[::-1]
+        radii += [inner_radius] * vertex_count
+
+    lon, lat = vincenty_direct_solution_batch(center.lon, center.lat, azimuths, radii, ellipsoid_name)
+    if inner_radius == 0:
+        lon.append(center.lon)
+        lat.append(center.lat)
+    return vertices(lon, lat)
+
+
+segment_vertices = namedtuple('SegmentVertices', ['lon', 'lat', 'offsets'])
+
+# Radius used to convert differences of coordinates into meters when lateral error is estimated
+_MEAN_RADIUS = 6371008.8
+# Maximum number of the vertex count doubling when vertex count is derived from the lateral error
+MAX_LATERAL_ERROR_ITERATIONS = 16
+
+
+def _lateral_errors(lons, lats, vertex_count):
+    """ Return maximum distance (meters) between geodesic 'half' points and mid-points of the straight lines
+    (in longitude, latitude plane) between vertices of each line.
+    :param lons: sequence of floats, longitudes of the 2 * vertex_count - 1 points of each line evenly distributed
+                 along the geodesic
+    :param lats: sequence of floats, latitudes of the points
+    :param vertex_count: int, vertex count of each line
+    :return: list of floats
+    """
+    points_per_line = 2 * vertex_count - 1
+    errors = []
+    for start in range(0, len(lons), points_per_line):
+        max_error = 0.0
+        for i in range(start, start + points_per_line - 2, 2):
+            d_lon = (lons[i + 2] - lons[i] + 180) % 360 - 180
+            mid_lon = lons[i] + d_lon / 2
+            mid_lat = (lats[i] + lats[i + 2]) / 2
+            error_lon = math.radians((lons[i + 1] - mid_lon + 180) % 360 - 180) * math.cos(math.radians(mid_lat))
+            error_lat = math.radians(lats[i + 1] - mid_lat)
+            max_error = max(max_error, _MEAN_RADIUS * math.hypot(error_lon, error_lat))
+        errors.append(max_error)
+    return errors
+
+
+def _points_along_lines(starts, azimuths, distances, vertex_counts, ellipsoid_name):
+    """ Return points evenly distributed along the geodesics, vertex_counts[i] points for i-th line. """
+    lons, lats, line_azimuths, line_distances = [], [], [], []
+    for start, azimuth, distance, vertex_count in zip(starts, azimuths, distances, vertex_counts):
+        lons += [start.lon] * vertex_count
+        lats += [start.lat] * vertex_count
+        line_azimuths += [azimuth] * vertex_count
+        line_distances += [distance * i / (vertex_count - 1) for i in range(vertex_count)]
+    return vincenty_direct_solution_batch(lons, lats, line_azimuths, line_distances, ellipsoid_name)
+
+
+def densify_geodesic_lines(starts, ends, spacing=None, vertex_count=None, max_lateral_error=None,
+                           ellipsoid_name="WGS84"):
+    """ Convert geodesic lines into vertices, so that straight lines between vertices (e.g. in planar GIS tools)
+    follow the geodesic. Exactly one of spacing, vertex_count, max_lateral_error is required.
+    :param starts: sequence of Points or PointViews, start points of the lines
+    :param ends: sequence of Points or PointViews, end points of the lines
+    :param spacing: float, maximum distance between vertices along the line; meters
+    :param vertex_count: int, number of vertices of each line, including start and end point
+    :param max_lateral_error: float, maximum distance between geodesic and straight line between vertices
+                              in longitude, latitude plane; meters
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: segment_vertices: lon, lat (array.array('d')) of the vertices of all the lines
+             and offsets (array.array('l')) - vertices of the i-th line are lon[offsets[i]:offsets[i + 1]]
+    """
+    if [spacing, vertex_count, max_lateral_error].count(None) != 2:
+        raise ValueError('Exactly one of spacing, vertex_count, max_lateral_error is required.')
+    if len(starts) != len(ends):
+        raise ValueError('Number of start points and end points must be the same.')
+
+    solution = vincenty_inverse_solution_batch([p.lon for p in starts], [p.lat for p in starts],
+                                               [p.lon for p in ends], [p.lat for p in ends], ellipsoid_name)
+    if not all(solution.converged):
+        raise ValueError(f'Geodesic not found (nearly antipodal points) for lines: '
+                         f'{[i for i, converged in enumerate(solution.converged) if not converged]}.')
+
+    if spacing is not None:
+        if spacing <= 0:
+            raise ValueError('Spacing has to be positive number.')
+        vertex_counts = [max(2, math.ceil(distance / spacing) + 1) for distance in solution.distance]
+    elif vertex_count is not None:
+        if vertex_count < 2:
+            raise ValueError('At least 2 vertices required.')
+        vertex_counts = [vertex_count] * len(starts)
+    else:
+        if max_lateral_error <= 0:
+            raise ValueError('Maximum lateral error has to be positive number.')
+        vertex_counts = [2] * len(starts)
+        pending = list(range(len(starts)))
+        for _ in range(MAX_LATERAL_ERROR_ITERATIONS):
+            if not pending:
+                break
+            # Geodesic vertices and 'half' points between them for all the pending lines at once
+            lons, lats = _points_along_lines([starts[i] for i in pending],
+                                             [solution.azimuth_fwd[i] for i in pending],
+                                             [solution.distance[i] for i in pending],
+                                             [2 * vertex_counts[i] - 1 for i in pending], ellipsoid_name)
+            lateral_errors = []
+            offset = 0
+            for i in pending:
+                points_count = 2 * vertex_counts[i] - 1
+                lateral_errors += _lateral_errors(lons[offset:offset + points_count],
+                                                  lats[offset:offset + points_count], vertex_counts[i])
+                offset += points_count
+            pending = [i for i, error in zip(pending, lateral_errors) if error > max_lateral_error]
+            for i in pending:
+                vertex_counts[i] = 2 * vertex_counts[i] - 1
+
+    lon, lat = _points_along_lines(starts, solution.azimuth_fwd, solution.distance, vertex_counts, ellipsoid_name)
+    offsets = array('l', [0])
+    for start, end, count in zip(starts, ends, vertex_counts):
+        lon[offsets[-1]], lat[offsets[-1]] = start.lon, start.lat
+        offsets.append(offsets[-1] + count)
+        lon[offsets[-1] - 1], lat[offsets[-1] - 1] = end.lon, end.lat
+    return segment_vertices(lon, lat, offsets)
@@ -1,35 +1,131 @@
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from aviation_gis_tools.coordinate import *
 from aviation_gis_tools.distance import *
 from aviation_gis_tools.bearing import *
 from aviation_gis_tools.ellipsoid_calc import *
 
 
+def get_point_definition_err(**kwargs):
+    """ Return errors of input data for point calculated from 'raw coordinates', polar coordinates, offset coordinates.
+    :param kwargs: arguments of Point.from_raw_coordinates, Point.from_polar_coordinates, Point.from_offset
+    :return: str: error message, empty if data valid
+    """
+    err = ''
+    for argname, argvalue in kwargs.items():
+        if argname == 'point_id':
+            if not argvalue.strip():
+                err = 'Point ident required. '
+        if argname == 'lon':
+            if argvalue.ang_type != AT_LONGITUDE:
+                err += f'Arg lon: Coordinate type longitude expected, type {argvalue.ang_type} passed. '
+        if argname == 'lat':
+            if argvalue.ang_type != AT_LATITUDE:
+                err += f'Arg lat: Coordinate type latitude expected, type {argvalue.ang_type} passed. '
+
+    err += ' '.join([argvalue.err_msg for argname, argvalue in kwargs.items()
+                     if argname in ['distance', 'azimuth', 'offset_distance', 'lon', 'lat'] and argvalue.err_msg])
+    return err
+
+
 def check_point_definition(func):
     """ Check input data for point calculated from 'raw coordinates', polar coordinates, offset coordinates"""
     def wrapper(*args, **kwargs):
-        err = ''
-        for argname, argvalue in kwargs.items():
-            if argname == 'point_id':
-                if not argvalue.strip():
-                    err = 'Point ident required. '
-            if argname == 'lon':
-                if argvalue.ang_type != AT_LONGITUDE:
-                    err += f'Arg lon: Coordinate type longitude expected, type {argvalue.ang_type} passed. '
-            if argname == 'lat':
-                if argvalue.ang_type != AT_LATITUDE:
-                    err += f'Arg lat: Coordinate type latitude expected, type {argvalue.ang_type} passed. '
-
-        err += ' '.join([argvalue.err_msg for argname, argvalue in kwargs.items()
-                         if argname in ['distance', 'azimuth', 'offset_distance', 'lon', 'lat'] and argvalue.err_msg])
+        err = get_point_definition_err(**kwargs)
         if err:
             raise ValueError(err)
         return func(*args, **kwargs)
     return wrapper
 
 
+# Templates of definitions of points, see Point.from_raw_coordinates, Point.from_polar_coordinates, Point.from_offset
+DEFINITION_RAW = '{0} {1}'
+DEFINITION_POLAR = 'Ref: {0.point_id} {0.definition}; Dist: {1} {2}; Azm: {3}'
+DEFINITION_OFFSET = 'Ref: {0.point_id} {0.definition}; Dist: {1} {2}; Azm: {3}; ' \
+                    'Offset side: {4}; Offset dist: {5} {6}'
+
+
+def render_definition(definition):
+    """ Render point definition stored as tuple (template, args), e.g. ('{0} {1}', ('E0150000', 'N770000')).
+    Definitions of calculated points refer to definitions of reference points, so they are rendered only when
+    requested instead of copying whole chain of reference definitions into every point.
+    :param definition: str, tuple(str, tuple) or None
+    :return: str: definition, None if not given
+    """
+    if definition is None or isinstance(definition, str):
+        return definition
+    template, args = definition
+    return template.format(*args)
+
+
+# Input of Point fast path constructors, checked once by validate_polar_values: distances in meters,
+# azimuth in decimal degrees, offset_side and offset_distance None for polar coordinates
+validated_polar = namedtuple('ValidatedPolar', ['point_id', 'distance', 'azimuth', 'offset_side', 'offset_distance'])
+# Result of validate_polar_values: records - list of validated_polar (None if row not valid),
+# errors - list of str, error message for each row, empty if row valid
+validated_polar_batch = namedtuple('ValidatedPolarBatch', ['records', 'errors'])
+
+
+def _get_positive_number(value):
+    """ Return value as float if it is finite positive number, None otherwise. """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if 0 < value < math.inf:
+        return value
+    return None
+
+
+def validate_polar_values(rows):
+    """ Validate definitions of points by polar coordinates or offset, given as numbers, at once.
+    Records of valid rows can be passed to Point.from_validated, which does not check them again.
+    :param rows: iterable of tuples: (point_id, distance, azimuth) - polar coordinates,
+                 (point_id, distance, azimuth, offset_side, offset_distance) - offset,
+                 distances in meters, azimuth in decimal degrees
+    :return: validated_polar_batch
+    """
+    result = validated_polar_batch([], [])
+    for row in rows:
+        point_id, distance, azimuth = row[:3]
+        offset_side, offset_distance = row[3:] if len(row) > 3 else (None, None)
+        err = ''
+        if not isinstance(point_id, str) or not point_id.strip():
+            err += 'Point ident required. '
+        distance = _get_positive_number(distance)
+        if distance is None:
+            err += 'Distance value error. '
+        try:
+            azimuth = float(azimuth)
+        except (TypeError, ValueError):
+            azimuth = math.nan
+        if not 0 <= azimuth <= 360:
+            err += 'Bearing value error. '
+        if len(row) > 3:
+            if offset_side not in ('LEFT', 'RIGHT'):
+                err += f'Offset side {offset_side} not supported. '
+            offset_distance = _get_positive_number(offset_distance)
+            if offset_distance is None:
+                err += 'Offset distance value error. '
+        result.errors.append(err)
+        result.records.append(None if err else validated_polar(point_id, distance, azimuth, offset_side,
+                                                               offset_distance))
+    return result
+
+
 class Point:
 
+    __slots__ = ('_point_id', '_lon', '_lat', '_definition')
+
     def __init__(self, point_id, lon, lat, definition=None):
+        """
+        :param point_id: str
+        :param lon: float, longitude in DD format
+        :param lat: float, latitude in DD format
+        :param definition: str or tuple(str, tuple): template and its arguments, rendered when requested
+        """
         self._point_id = point_id
         self._lon = lon
         self._lat = lat
@@ -40,6 +136,39 @@ class Point:
         lat_dms = Angle.convert_dd_to_dms(self._lat, AT_LATITUDE)
         return f'{lon_dms} {lat_dms}'
 
+    @property
+    def point_id(self):
+        return self._point_id
+
+    @property
+    def lon(self):
+        return self._lon
+
+    @property
+    def lat(self):
+        return self._lat
+
+    @property
+    def definition(self):
+        """ Return point definition, rendered at first access. """
+        if self._definition is not None and not isinstance(self._definition, str):
+            self._definition = render_definition(self._definition)
+        return self._definition
+
+    def geodesic_to(self, other: 'Point'):
+        """ Return distance (meters), forward azimuth and back azimuth (decimal degrees) from this point
+        to the other point.
+        :param other: Point or PointView
+        :raise ValueError: if inverse solution does not converge (nearly antipodal points)
+        """
+        return vincenty_inverse_solution(self._lon, self._lat, other.lon, other.lat)
+
+    def direct_solver(self, azimuths) -> FixedOriginDirectSolver:
+        """ Return direct geodetic problem solver with this point as origin and given azimuths (decimal degrees),
+        e.g. for range rings, radial fans.
+        """
+        return FixedOriginDirectSolver(self._lon, self._lat, azimuths)
+
     @staticmethod
     def get_offset_azimuth(azimuth, offset_side):
         """
@@ -64,60 +193,117 @@ class Point:
     @check_point_definition
     def from_raw_coordinates(cls, *, point_id: str, lon: Coordinate, lat: Coordinate) -> 'Point':
         """ Create Point from 'raw' coordinates, example: 'E0150000', 'N770000'. """
-        return cls(point_id, lon.ang_dd, lat.ang_dd, definition=f'{lon} {lat}')
+        return cls(point_id, lon.ang_dd, lat.ang_dd, definition=(DEFINITION_RAW, (lon.ang_src, lat.ang_src)))
+
+    @classmethod
+    def from_polar_dd(cls, *, ref_point: 'Point', point_id: str, distance: float, azimuth: float,
+                      tolerance: float = None) -> 'Point':
+        """ Create point based on polar coordinates given as numbers: distance from reference point (meters),
+        azimuth from reference point (decimal degrees).
+        Note: Input is not validated, validate it at once with validate_polar_values.
+        """
+        lon_dd, lat_dd = direct_solution(lon_initial=ref_point.lon,
+                                         lat_initial=ref_point.lat,
+                                         azimuth_initial=azimuth,
+                                         distance=distance,
+                                         tolerance=tolerance)
+        return cls(point_id, lon_dd, lat_dd, (DEFINITION_POLAR, (ref_point, distance, UOM_M, azimuth)))
+
+    @classmethod
+    def from_offset_dd(cls, *, ref_point: 'Point', point_id: str, distance: float, azimuth: float, offset_side: str,
+                       offset_distance: float, tolerance: float = None) -> 'Point':
+        """ Create point based on offset given as numbers: distance along azimuth (meters), azimuth (decimal degrees),
+        offset side: LEFT, RIGHT, distance from azimuth line (meters).
+        Note: Input is not validated, validate it at once with validate_polar_values.
+        """
+        inter_lon, inter_lat = direct_solution(lon_initial=ref_point.lon,
+                                               lat_initial=ref_point.lat,
+                                               azimuth_initial=azimuth,
+                                               distance=distance,
+                                               tolerance=tolerance)
+        lon_dd, lat_dd = direct_solution(lon_initial=inter_lon,
+                                         lat_initial=inter_lat,
+                                         azimuth_initial=Point.get_offset_azimuth(azimuth, offset_side),
+                                         distance=offset_distance,
+                                         tolerance=tolerance)
+        return cls(point_id, lon_dd, lat_dd, (DEFINITION_OFFSET, (ref_point, distance, UOM_M, azimuth, offset_side,
+                                                                  offset_distance, UOM_M)))
+
+    @classmethod
+    def from_validated(cls, ref_point: 'Point', record: validated_polar, tolerance: float = None) -> 'Point':
+        """ Create point from record returned by validate_polar_values, record is not checked again. """
+        if record.offset_side is None:
+            return cls.from_polar_dd(ref_point=ref_point, point_id=record.point_id, distance=record.distance,
+                                     azimuth=record.azimuth, tolerance=tolerance)
+        return cls.from_offset_dd(ref_point=ref_point, point_id=record.point_id, distance=record.distance,
+                                  azimuth=record.azimuth, offset_side=record.offset_side,
+                                  offset_distance=record.offset_distance, tolerance=tolerance)
 
     @classmethod
     @check_point_definition
-    def from_polar_coordinates(cls, *, ref_point: 'Point', point_id: str, distance: Distance, azimuth: Bearing) -> 'Point':
+    def from_polar_coordinates(cls, *, ref_point: 'Point', point_id: str, distance: Distance, azimuth: Bearing,
+                               tolerance: float = None) -> 'Point':
         """ Create point based on:
                 reference point longitude, latitude
                 distance from reference point to calculated point
                 azimuth from reference point to calculated point
+        If tolerance (meters) is given, the cheapest direct solver that meets it is used, see select_direct_solver.
         """
         try:
-            lon_dd, lat_dd = vincenty_direct_solution(lon_initial=ref_point._lon,
-                                                      lat_initial=ref_point._lat,
-                                                      azimuth_initial=azimuth.brng_dd,
-                                                      distance=distance.convert_distance_to_uom(UOM_M))
+            lon_dd, lat_dd = direct_solution(lon_initial=ref_point.lon,
+                                             lat_initial=ref_point.lat,
+                                             azimuth_initial=azimuth.brng_dd,
+                                             distance=distance.convert_distance_to_uom(UOM_M),
+                                             tolerance=tolerance)
         except TypeError:
             pass  # TODO: add handling error: TypeError: cannot unpack non-iterable NoneType object
         else:
-            definition = f'Ref: {ref_point._point_id} {ref_point._definition}; ' \
-                         f'Dist: {distance}; Azm: {azimuth}'
+            definition = (DEFINITION_POLAR, (ref_point, distance.src_dist, distance.src_uom, azimuth.brng_src))
             return cls(point_id, lon_dd, lat_dd, definition)
 
     @classmethod
     @check_point_definition
     def from_offset(cls, *, ref_point: 'Point', point_id: str, distance: Distance, azimuth: Bearing, offset_side: str,
-                    offset_distance: Distance) -> 'Point':
+                    offset_distance: Distance, tolerance: float = None) -> 'Point':
         """ Create point based on:
                 reference point longitude, latitude
                 'offset' side: LEFT, RIGHT
                 distance from reference point along azimuth
                 distance from azimuth line to calculated point
+        If tolerance (meters) is given, the cheapest direct solver that meets it is used, see select_direct_solver.
         """
         try:
             offset_azimuth = Point.get_offset_azimuth(azimuth.brng_dd, offset_side)
 
             # Calculate 'intermediate' point
-            inter_lon, inter_lat = vincenty_direct_solution(lon_initial=ref_point._lon,
-                                                            lat_initial=ref_point._lat,
-                                                            azimuth_initial=azimuth.brng_dd,
-                                                            distance=distance.convert_distance_to_uom(UOM_M))
-
-            lon_dd, lat_dd = vincenty_direct_solution(lon_initial=inter_lon,
-                                                      lat_initial=inter_lat,
-                                                      azimuth_initial=offset_azimuth,
-                                                      distance=offset_distance.convert_distance_to_uom(UOM_M))
+            inter_lon, inter_lat = direct_solution(lon_initial=ref_point.lon,
+                                                   lat_initial=ref_point.lat,
+                                                   azimuth_initial=azimuth.brng_dd,
+                                                   distance=distance.convert_distance_to_uom(UOM_M),
+                                                   tolerance=tolerance)
+
+            lon_dd, lat_dd = direct_solution(lon_initial=inter_lon,
+                                             lat_initial=inter_lat,
+                                             azimuth_initial=offset_azimuth,
+                                             distance=offset_distance.convert_distance_to_uom(UOM_M),
+                                             tolerance=tolerance)
         except TypeError:
             pass  # TODO: add handling error: TypeError: cannot unpack non-iterable NoneType object
         else:
-            definition = f'Ref: {ref_point._point_id} {ref_point._definition}; ' \
-                         f'Dist: {distance}; Azm: {azimuth}; ' \
-                         f'Offset side: {offset_side}; Offset dist: {offset_distance}'
+            definition = (DEFINITION_OFFSET, (ref_point, distance.src_dist, distance.src_uom, azimuth.brng_src,
+                                              offset_side, offset_distance.src_dist, offset_distance.src_uom))
             return cls(point_id, lon_dd, lat_dd, definition)
 
 
+# Executors of PointCalculation.calculate_many
+EXECUTOR_THREAD = 'EXECUTOR_THREAD'
+EXECUTOR_PROCESS = 'EXECUTOR_PROCESS'
+
+# Result of PointCalculation.calculate_polar, calculate_offset: longitude, latitude (None if not calculated),
+# error message (empty if point calculated)
+point_calculation_result = namedtuple('point_calculation_result', ['lon', 'lat', 'err'])
+
+
 class PointCalculation:
 
     def __init__(self, ref_id, ref_lon, ref_lat):
@@ -154,22 +340,106 @@ class PointCalculation:
                 err_msg += arg.err_msg
         return err_msg
 
+    def calculate_polar(self, distance, azimuth):
+        """ Calculate longitude, latitude base on:
+                reference point longitude, latitude
+                distance from reference point to calculated point
+                azimuth from reference point to calculated point
+        Instance state is not changed, so one reference point can be used by many threads at once.
+        :param distance: Distance
+        :param azimuth: Bearing
+        :return: point_calculation_result
+        """
+        err = self._ref_err + PointCalculation.check_location_definition(distance, azimuth)
+        if err:
+            return point_calculation_result(None, None, err)
+        lon, lat = direct_solution(lon_initial=self.ref_lon.ang_dd,
+                                   lat_initial=self.ref_lat.ang_dd,
+                                   azimuth_initial=azimuth.brng_dd,
+                                   distance=distance.convert_distance_to_uom(UOM_M))
+        return point_calculation_result(lon, lat, '')
+
+    def calculate_offset(self, distance, azimuth, offset_side, offset_distance):
+        """ Calculate longitude, latitude base on:
+                reference point longitude, latitude
+                'offset' side: LEFT, RIGHT
+                distance from reference point along azimuth
+                distance from azimuth line to calculated point
+        Instance state is not changed, so one reference point can be used by many threads at once.
+        :param distance: Distance
+        :param azimuth: Bearing
+        :param offset_side: str, 'LEFT' or 'RIGHT'
+        :param offset_distance: Distance
+        :return: point_calculation_result
+        """
+        err = self._ref_err + PointCalculation.check_location_definition(distance, azimuth, offset_distance)
+        if offset_side not in ('LEFT', 'RIGHT'):
+            err += "Offset side {} not supported!".format(offset_side)
+        if err:
+            return point_calculation_result(None, None, err)
+        offset_azimuth = PointCalculation.get_offset_azimuth(azimuth.brng_dd, offset_side)
+
+        # Calculate 'intermediate' point
+        inter_lon, inter_lat = direct_solution(lon_initial=self.ref_lon.ang_dd,
+                                               lat_initial=self.ref_lat.ang_dd,
+                                               azimuth_initial=azimuth.brng_dd,
+                                               distance=distance.convert_distance_to_uom(UOM_M))
+        lon, lat = direct_solution(lon_initial=inter_lon,
+                                   lat_initial=inter_lat,
+                                   azimuth_initial=offset_azimuth,
+                                   distance=offset_distance.convert_distance_to_uom(UOM_M))
+        return point_calculation_result(lon, lat, '')
+
+    def calculate(self, request):
+        """ Calculate point for request.
+        :param request: tuple: (distance, azimuth) - polar coordinates,
+                        (distance, azimuth, offset_side, offset_distance) - offset
+        :return: point_calculation_result
+        """
+        if len(request) == 2:
+            return self.calculate_polar(*request)
+        return self.calculate_offset(*request)
+
+    def calculate_many(self, requests, executor=EXECUTOR_THREAD, max_workers=None, chunk_size=256):
+        """ Calculate points for requests against this reference point, requests are processed in parallel
+        by thread pool or process pool. With thread pool the reference point is shared by all threads,
+        worker processes parse reference point once and get requests in chunks.
+        Note: Geodetic solvers are pure Python code, so threads do not run them in parallel (GIL),
+        process pool pays off for large batches of requests.
+        :param requests: iterable of tuples, see calculate
+        :param executor: str, EXECUTOR_THREAD or EXECUTOR_PROCESS
+        :param max_workers: int, number of workers, None - default of executor, 1 - requests are processed
+                            in current thread
+        :param chunk_size: int, number of requests sent to worker process at once
+        :return: list of point_calculation_result, in the same order as requests
+        """
+        if max_workers == 1:
+            return [self.calculate(request) for request in requests]
+        if executor == EXECUTOR_THREAD:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(self.calculate, requests))
+        if executor == EXECUTOR_PROCESS:
+            ref = (self.ref_id, self.ref_lon.ang_src, self.ref_lat.ang_src)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_calculation_worker,
+                                     initargs=(ref, get_default_direct_solver())) as pool:
+                return list(pool.map(_calculate_point, requests, chunksize=chunk_size))
+        raise ValueError(f'Executor {executor} not supported.')
+
     def point_by_polar_coordinates(self, distance, azimuth):
         """ Calculate longitude, latitude base on:
                 reference point longitude, latitude
                 distance from reference point to calculated point
                 azimuth from reference point to calculated point
+        Note: Error is stored in calc_err, use calculate_polar when reference point is shared by threads.
         :param distance: Distance
         :param azimuth: Bearing
         :return: tuple(float, float)
         """
-        self._calc_err = ""
-        self._calc_err = self._calc_err + PointCalculation.check_location_definition(distance, azimuth)
-        if not self._calc_err:
-            return vincenty_direct_solution(lon_initial=self.ref_lon.ang_dd,
-                                            lat_initial=self.ref_lat.ang_dd,
-                                            azimuth_initial=azimuth.brng_dd,
-                                            distance=distance.convert_distance_to_uom(UOM_M))
+        result = self.calculate_polar(distance, azimuth)
+        self._calc_err = result.err
+        if not result.err:
+            return result.lon, result.lat
 
     def info_by_polar_coordinates(self, distance, azimuth):
         """ Return 'info' string related to calculated point based on:
@@ -206,24 +476,14 @@ class PointCalculation:
         return offset_azimuth
 
     def point_by_offset(self, distance, azimuth, offset_side, offset_distance):
+        """ Calculate longitude, latitude by offset, see calculate_offset.
+        Note: Error is stored in calc_err, use calculate_offset when reference point is shared by threads.
+        :return: tuple(float, float)
         """
-        
-        """
-        self._calc_err = ""
-        self._calc_err = self._calc_err + PointCalculation.check_location_definition(distance, azimuth, offset_distance)
-        if not self._calc_err:
-            offset_azimuth = PointCalculation.get_offset_azimuth(azimuth.brng_dd, offset_side)
-
-            # Calculate 'intermediate' point
-            inter_lon, inter_lat = vincenty_direct_solution(lon_initial=self.ref_lon.ang_dd,
-                                                            lat_initial=self.ref_lat.ang_dd,
-                                                            azimuth_initial=azimuth.brng_dd,
-                                                            distance=distance.convert_distance_to_uom(UOM_M))
-
-            return vincenty_direct_solution(lon_initial=inter_lon,
-                                            lat_initial=inter_lat,
-                                            azimuth_initial=offset_azimuth,
-                                            distance=offset_distance.convert_distance_to_uom(UOM_M))
+        result = self.calculate_offset(distance, azimuth, offset_side, offset_distance)
+        self._calc_err = result.err
+        if not result.err:
+            return result.lon, result.lat
 
     def info_by_offset(self, distance, azimuth, offset_side, offset_distance):
         """ Return 'info' string related to calculated point based on:
@@ -242,3 +502,24 @@ class PointCalculation:
                "Distance: {1}, Azimuth: {2}, Offset side: {3}, Offset distance: {4}".format(self, distance, azimuth,
                                                                                             offset_side,
                                                                                             offset_distance)
+
+
+_worker_calculation = None
+
+
+def _init_calculation_worker(ref, direct_solver):
+    """ Create reference point used by worker process for all its tasks.
+    :param ref: tuple(str, str, str): reference point id, longitude, latitude
+    :param direct_solver: str, default direct solver of parent process
+    """
+    global _worker_calculation
+    set_default_direct_solver(direct_solver)
+    _worker_calculation = PointCalculation(*ref)
+
+
+def _calculate_point(request):
+    """ Calculate point in worker process.
+    :param request: tuple, see PointCalculation.calculate
+    :return: point_calculation_result
+    """
+    return _worker_calculation.calculate(request)
@@ -0,0 +1,346 @@
+"""
+Batch calculation of tables of point definitions: raw coordinates, polar coordinates from reference point,
+offset from reference point. References can be chained, points are calculated level by level
+of the reference graph, each level as one batch of direct geodetic problems.
+Graph of definitions can be kept and updated, e.g. after AIRAC amendment, then only points depending
+on changed definitions are recalculated.
+"""
+import math
+from collections import namedtuple
+
+from aviation_gis_tools.point_set import *
+
+# Point definition types
+PD_RAW = 'RAW'
+PD_POLAR = 'POLAR'
+PD_OFFSET = 'OFFSET'
+
+OFFSET_SIDES = ('LEFT', 'RIGHT')
+
+# Row of point definitions table, lon, lat - Coordinate (PD_RAW), ref_id - str, distance, offset_distance - Distance,
+# azimuth - Bearing, offset_side - str: LEFT, RIGHT (PD_POLAR, PD_OFFSET)
+point_definition = namedtuple('PointDefinition', ['point_id', 'def_type', 'lon', 'lat', 'ref_id', 'distance',
+                                                  'azimuth', 'offset_side', 'offset_distance'],
+                              defaults=(None,) * 7)
+
+# Result of calculation:
+# points - PointSet, points in order of rows, longitude and latitude nan if point not calculated
+# errors - list of str, error message for each row, empty if point calculated
+# levels - list of lists of row indexes, rows calculated in the same batch
+point_definitions_result = namedtuple('PointDefinitionsResult', ['points', 'errors', 'levels'])
+
+# Changes after PointGraph update: moved - list of moved_point (including points which cannot be calculated anymore,
+# longitude and latitude nan), recalculated - list of indexes of recalculated rows
+point_graph_diff = namedtuple('PointGraphDiff', ['moved', 'recalculated'])
+moved_point = namedtuple('MovedPoint', ['point_id', 'lon_old', 'lat_old', 'lon', 'lat'])
+
+
+def get_row_err(row):
+    """ Return errors of input data of point definitions table row, reference is not checked.
+    :param row: point_definition
+    :return: str: error message, empty if data valid
+    """
+    if not row.point_id or not row.point_id.strip():
+        return 'Point ident required. '
+    if row.def_type == PD_RAW:
+        if row.lon is None or row.lat is None:
+            return 'Coordinates required. '
+        return get_point_definition_err(lon=row.lon, lat=row.lat)
+    if row.def_type not in (PD_POLAR, PD_OFFSET):
+        return f'Point definition type {row.def_type} not supported. '
+    if not row.ref_id:
+        return 'Reference point ident required. '
+    if row.distance is None or row.azimuth is None:
+        return 'Distance and azimuth required. '
+    if row.def_type == PD_POLAR:
+        return get_point_definition_err(distance=row.distance, azimuth=row.azimuth)
+    if row.offset_side not in OFFSET_SIDES:
+        return f'Offset side {row.offset_side} not supported. '
+    if row.offset_distance is None:
+        return 'Offset distance required. '
+    return get_point_definition_err(distance=row.distance, azimuth=row.azimuth, offset_distance=row.offset_distance)
+
+
+def _get_cycle_errors(rows, ref_rows, unresolved):
+    """ Return errors of rows which are not calculated because of circular references.
+    Each row has at most one reference, so following references from any unresolved row leads to a cycle.
+    :param rows: list of point_definition
+    :param ref_rows: list of int, index of reference row for each row, None for rows without reference
+    :param unresolved: set of int, indexes of rows not calculated
+    :return: dict: row index -> error message
+    """
+    errors = {}
+    for start in sorted(unresolved):
+        path = []
+        position = {}
+        index = start
+        while index not in errors and index not in position:
+            position[index] = len(path)
+            path.append(index)
+            index = ref_rows[index]
+        if index in position:
+            cycle = path[position[index]:]
+            cycle_ids = ' -> '.join(rows[i].point_id for i in cycle + cycle[:1])
+            for i in cycle:
+                errors[i] = f'Circular reference: {cycle_ids}. '
+            path = path[:position[index]]
+        for i in path:
+            errors[i] = f'Reference point {rows[i].ref_id} error. '
+    return errors
+
+
+def _calculate_level(level, rows, ref_rows, points, ellipsoid_name):
+    """ Calculate points of one level of reference graph: all reference points are already calculated.
+    :param level: list of int, indexes of rows with PD_POLAR, PD_OFFSET definitions
+    :param rows: list of point_definition
+    :param ref_rows: list of int, index of reference row for each row
+    :param points: PointSet, calculated points are stored in place
+    :param ellipsoid_name: str
+    """
+    lon, lat = vincenty_direct_solution_batch([points.lon[ref_rows[i]] for i in level],
+                                              [points.lat[ref_rows[i]] for i in level],
+                                              [rows[i].azimuth.brng_dd for i in level],
+                                              [rows[i].distance.convert_distance_to_uom(UOM_M) for i in level],
+                                              ellipsoid_name)
+    offsets = [k for k, i in enumerate(level) if rows[i].def_type == PD_OFFSET]
+    if offsets:
+        offset_rows = [rows[level[k]] for k in offsets]
+        offset_lon, offset_lat = vincenty_direct_solution_batch(
+            [lon[k] for k in offsets],
+            [lat[k] for k in offsets],
+            [Point.get_offset_azimuth(row.azimuth.brng_dd, row.offset_side) for row in offset_rows],
+            [row.offset_distance.convert_distance_to_uom(UOM_M) for row in offset_rows],
+            ellipsoid_name)
+        for k, point_lon, point_lat in zip(offsets, offset_lon, offset_lat):
+            lon[k], lat[k] = point_lon, point_lat
+
+    for k, i in enumerate(level):
+        row = rows[i]
+        points.lon[i], points.lat[i] = lon[k], lat[k]
+        ref_point = PointView(points, ref_rows[i])
+        if row.def_type == PD_POLAR:
+            points.definitions[i] = (DEFINITION_POLAR, (ref_point, row.distance.src_dist, row.distance.src_uom,
+                                                        row.azimuth.brng_src))
+        else:
+            points.definitions[i] = (DEFINITION_OFFSET, (ref_point, row.distance.src_dist, row.distance.src_uom,
+                                                         row.azimuth.brng_src, row.offset_side,
+                                                         row.offset_distance.src_dist, row.offset_distance.src_uom))
+
+
+class PointGraph:
+    """ Persistent graph of point definitions. Definitions can be updated, added and removed,
+    only points depending on changed definitions are recalculated.
+    Rows with errors (invalid data, not unique ident, missing reference, circular reference,
+    reference point with error) are reported and skipped, the other points are calculated.
+    Points defined by polar coordinates and offset are calculated with Vincenty direct solution.
+    """
+
+    def __init__(self, rows=(), ellipsoid_name="WGS84"):
+        """
+        :param rows: iterable of point_definition, in any order, references can be chained
+        :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+        """
+        self.ellipsoid_name = ellipsoid_name
+        self.rows = []  # point_definition, None if point removed
+        self.errors = []  # Error message for each row, empty if point calculated
+        self.points = PointSet()  # Points in order of rows, longitude and latitude nan if point not calculated
+        self.levels = []  # Rows calculated in the same batch at last recalculation
+        self._row_by_id = {}
+        self._duplicates = {}  # Ident -> indexes of rows with the same ident as row in _row_by_id, in order of rows
+        self._ref_rows = []  # Index of reference row for each row, None if no reference
+        self._dependents = []  # Indexes of rows referring to each row
+        self._waiting = {}  # Ident of missing reference point -> indexes of rows referring to it
+        for row in rows:
+            self._append(row)
+        for i in range(len(self.rows)):
+            self._link(i)
+        self._recalculate(range(len(self.rows)))
+
+    def _append(self, row):
+        """ Append row, not linked to reference point yet.
+        :param row: point_definition
+        :return: int: index of row
+        """
+        i = len(self.rows)
+        self.rows.append(row)
+        self.errors.append('')
+        self.points.append(row.point_id or '', math.nan, math.nan)
+        self._ref_rows.append(None)
+        self._dependents.append(set())
+        if row.point_id and row.point_id.strip():
+            if row.point_id in self._row_by_id:
+                self._duplicates.setdefault(row.point_id, []).append(i)
+            else:
+                self._row_by_id[row.point_id] = i
+                # Removed point with the same ident can be kept in points
+                self.points.set_index(row.point_id, i)
+        return i
+
+    def _link(self, i):
+        """ Link row with its reference point, or register it as waiting for reference point. """
+        row = self.rows[i]
+        if row is None or row.def_type not in (PD_POLAR, PD_OFFSET) or not row.ref_id:
+            return
+        ref_row = self._row_by_id.get(row.ref_id)
+        if ref_row is None:
+            self._waiting.setdefault(row.ref_id, set()).add(i)
+        else:
+            self._ref_rows[i] = ref_row
+            self._dependents[ref_row].add(i)
+
+    def _unlink(self, i):
+        """ Unlink row from its reference point. """
+        ref_row = self._ref_rows[i]
+        if ref_row is not None:
+            self._dependents[ref_row].discard(i)
+            self._ref_rows[i] = None
+        elif self.rows[i] is not None and self.rows[i].ref_id in self._waiting:
+            self._waiting[self.rows[i].ref_id].discard(i)
+
+    def _get_own_err(self, i):
+        """ Return error of row, not including errors of reference points. """
+        row = self.rows[i]
+        if row is None:
+            return 'Point removed. '
+        err = get_row_err(row)
+        if not err and self._row_by_id.get(row.point_id) != i:
+            err = f'Point ident {row.point_id} not unique. '
+        if not err and row.def_type != PD_RAW and self._ref_rows[i] is None:
+            err = f'Reference point {row.ref_id} not found. '
+        return err
+
+    def _get_downstream(self, changed):
+        """ Return indexes of changed rows and all rows depending on them, directly or through chain of references.
+        :param changed: iterable of int
+        :return: set of int
+        """
+        affected = set(changed)
+        stack = list(affected)
+        while stack:
+            for j in self._dependents[stack.pop()]:
+                if j not in affected:
+                    affected.add(j)
+                    stack.append(j)
+        return affected
+
+    def _recalculate(self, affected):
+        """ Recalculate rows, all rows depending on them have to be included.
+        :param affected: iterable of int
+        """
+        affected = set(affected)
+        rows, errors, points = self.rows, self.errors, self.points
+        failed = []
+        for i in affected:
+            points.lon[i], points.lat[i], points.definitions[i] = math.nan, math.nan, None
+            errors[i] = self._get_own_err(i)
+            if errors[i]:
+                failed.append(i)
+        for i in affected:
+            ref_row = self._ref_rows[i]
+            if not errors[i] and ref_row is not None and ref_row not in affected and errors[ref_row]:
+                errors[i] = f'Reference point {rows[ref_row].point_id} error. '
+                failed.append(i)
+        while failed:
+            i = failed.pop()
+            for j in self._dependents[i]:
+                if not errors[j]:
+                    errors[j] = f'Reference point {rows[i].point_id} error. '
+                    failed.append(j)
+
+        # First level: raw coordinates and rows with reference points which are not recalculated
+        level = sorted(i for i in affected if not errors[i] and (rows[i].def_type == PD_RAW or
+                                                                 self._ref_rows[i] not in affected))
+        unresolved = {i for i in affected if not errors[i]}
+        self.levels = []
+        while level:
+            calculated = []
+            for i in level:
+                if rows[i].def_type == PD_RAW:
+                    points.lon[i], points.lat[i] = rows[i].lon.ang_dd, rows[i].lat.ang_dd
+                    points.definitions[i] = (DEFINITION_RAW, (rows[i].lon.ang_src, rows[i].lat.ang_src))
+                else:
+                    calculated.append(i)
+            if calculated:
+                _calculate_level(calculated, rows, self._ref_rows, points, self.ellipsoid_name)
+            self.levels.append(level)
+            unresolved.difference_update(level)
+            level = [j for i in level for j in sorted(self._dependents[i]) if not errors[j]]
+
+        for i, err in _get_cycle_errors(rows, self._ref_rows, unresolved).items():
+            errors[i] = err
+
+    def update(self, rows=(), removed_ids=()):
+        """ Update point definitions and recalculate points depending on them.
+        :param rows: iterable of point_definition, definitions of points with the same ident are replaced,
+                     the other are added
+        :param removed_ids: iterable of str, idents of points to remove
+        :return: point_graph_diff
+        :raise ValueError: if point to remove is not in graph
+        """
+        changed = []
+        for row in rows:
+            i = self._row_by_id.get(row.point_id)
+            if i is None:
+                i = self._append(row)
+                # Rows referring to added point
+                for j in self._waiting.pop(row.point_id, ()):
+                    self._link(j)
+                    changed.append(j)
+            else:
+                self._unlink(i)
+                self.rows[i] = row
+            self._link(i)
+            changed.append(i)
+
+        for point_id in removed_ids:
+            i = self._row_by_id.pop(point_id, None)
+            if i is None:
+                raise ValueError(f'Point {point_id} not in graph.')
+            self._unlink(i)
+            self.rows[i] = None
+            self.points.set_index(point_id, None)
+            changed.append(i)
+            # Rows referring to removed point wait until point with the same ident is added
+            for j in self._dependents[i]:
+                self._ref_rows[j] = None
+                self._waiting.setdefault(point_id, set()).add(j)
+                changed.append(j)
+            self._dependents[i] = set()
+            # First of rows with the same ident becomes unique, rows referring to removed point refer to it
+            duplicates = self._duplicates.get(point_id)
+            if duplicates:
+                j = duplicates.pop(0)
+                if not duplicates:
+                    del self._duplicates[point_id]
+                self._row_by_id[point_id] = j
+                self.points.set_index(point_id, j)
+                changed.append(j)
+                for k in self._waiting.pop(point_id, ()):
+                    self._link(k)
+                    changed.append(k)
+
+        affected = self._get_downstream(changed)
+        old_coordinates = {i: (self.points.lon[i], self.points.lat[i]) for i in affected}
+        self._recalculate(affected)
+        moved = []
+        for i in sorted(affected):
+            lon_old, lat_old = old_coordinates[i]
+            lon, lat = self.points.lon[i], self.points.lat[i]
+            if not (_same_coordinate(lon_old, lon) and _same_coordinate(lat_old, lat)):
+                moved.append(moved_point(self.points.ids[i], lon_old, lat_old, lon, lat))
+        return point_graph_diff(moved, sorted(affected))
+
+
+def _same_coordinate(value, other):
+    """ Check if coordinates are equal, nan (point not calculated) is equal to nan. """
+    return value == other or (math.isnan(value) and math.isnan(other))
+
+
+def calculate_point_definitions(rows, ellipsoid_name="WGS84"):
+    """ Calculate points from table of point definitions, see PointGraph.
+    :param rows: iterable of point_definition, in any order, references can be chained
+    :param ellipsoid_name: str, ellipsoid short name, e.g.: WGS84
+    :return: point_definitions_result
+    """
+    graph = PointGraph(rows, ellipsoid_name)
+    return point_definitions_result(graph.points, graph.errors, graph.levels)
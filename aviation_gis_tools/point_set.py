@@ -0,0 +1,192 @@
+"""
+Columnar (struct of arrays) container of points for workloads with millions of points.
+"""
+import sys
+from array import array
+
+from aviation_gis_tools.point_calculation import *
+
+
+class PointView:
+    """ Lightweight view of one point of PointSet, nothing is copied until to_point is called. """
+
+    __slots__ = ('_point_set', '_index')
+
+    def __init__(self, point_set, index):
+        """
+        :param point_set: PointSet
+        :param index: int, index of point in point_set
+        """
+        self._point_set = point_set
+        self._index = index
+
+    def __repr__(self):
+        return 'PointView({!r}, {!r}, {!r})'.format(self.point_id, self.lon, self.lat)
+
+    @property
+    def point_id(self):
+        return self._point_set.ids[self._index]
+
+    @property
+    def lon(self):
+        return self._point_set.lon[self._index]
+
+    @property
+    def lat(self):
+        return self._point_set.lat[self._index]
+
+    @property
+    def definition(self):
+        return self._point_set.get_definition(self._index)
+
+    def to_point(self):
+        """ Return point as standalone Point object.
+        :return: Point
+        """
+        return Point(self.point_id, self.lon, self.lat, _detach_definition(self._point_set.definitions[self._index]))
+
+
+def _detach_definition(definition):
+    """ Return definition with views of reference points replaced by standalone points, so definition
+    of exported point does not change when point set the views refer to is updated, e.g. PointGraph.
+    :param definition: str, tuple(str, tuple) or None
+    :return: str, tuple(str, tuple) or None
+    """
+    if definition is None or isinstance(definition, str):
+        return definition
+    template, args = definition
+    if not any(isinstance(arg, PointView) for arg in args):
+        return definition
+    return template, tuple(arg.to_point() if isinstance(arg, PointView) else arg for arg in args)
+
+
+class PointSet:
+    """ Points stored column by column: ids, longitudes and latitudes (DD format), definitions.
+    Longitudes and latitudes are array('d') of contiguous float64 values, they support buffer protocol,
+    so they can be used without copying, e.g. numpy.frombuffer(point_set.lon).
+    Ids are interned, definitions are stored as given to Point and rendered when requested.
+    """
+
+    __slots__ = ('ids', 'lon', 'lat', 'definitions', '_index_by_id')
+
+    def __init__(self):
+        self.ids = []
+        self.lon = array('d')
+        self.lat = array('d')
+        self.definitions = []
+        self._index_by_id = None  # Built at first lookup by id
+
+    @classmethod
+    def from_points(cls, points):
+        """ Create point set from points.
+        :param points: iterable of Point or PointView
+        :return: PointSet
+        """
+        point_set = cls()
+        point_set.extend(points)
+        return point_set
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield PointView(self, index)
+
+    def __getitem__(self, item):
+        """ Return view of point for index, new point set for slice (columns are copied). """
+        if isinstance(item, slice):
+            point_set = PointSet()
+            point_set.ids = self.ids[item]
+            point_set.lon = self.lon[item]
+            point_set.lat = self.lat[item]
+            point_set.definitions = [_detach_definition(definition) for definition in self.definitions[item]]
+            return point_set
+        if item < 0:
+            item += len(self.ids)
+        if not 0 <= item < len(self.ids):
+            raise IndexError('PointSet index out of range')
+        return PointView(self, item)
+
+    def append(self, point_id, lon, lat, definition=None):
+        """ Add point.
+        :param point_id: str
+        :param lon: float, longitude in DD format
+        :param lat: float, latitude in DD format
+        :param definition: str or tuple(str, tuple), see Point
+        """
+        point_id = sys.intern(point_id)
+        if self._index_by_id is not None:
+            self._index_by_id.setdefault(point_id, len(self.ids))
+        self.ids.append(point_id)
+        self.lon.append(lon)
+        self.lat.append(lat)
+        self.definitions.append(definition)
+
+    def extend(self, points):
+        """ Add points.
+        :param points: iterable of Point or PointView
+        """
+        for point in points:
+            if isinstance(point, PointView):
+                definition = _detach_definition(point._point_set.definitions[point._index])
+            else:
+                definition = point._definition
+            self.append(point.point_id, point.lon, point.lat, definition)
+
+    def _get_index_by_id(self):
+        """ Return dict: point id -> index of first point with the id, built at first call. """
+        if self._index_by_id is None:
+            self._index_by_id = {}
+            for index, existing_id in enumerate(self.ids):
+                self._index_by_id.setdefault(existing_id, index)
+        return self._index_by_id
+
+    def index(self, point_id):
+        """ Return index of first point with given id, unless changed by set_index.
+        :param point_id: str
+        :return: int
+        :raise ValueError: if there is no such point
+        """
+        try:
+            return self._get_index_by_id()[point_id]
+        except KeyError:
+            raise ValueError(f'Point {point_id} not in point set.') from None
+
+    def set_index(self, point_id, index):
+        """ Set index of point returned by lookup by id, e.g. when point is replaced by later point with the same id.
+        :param point_id: str
+        :param index: int, None - point is not found by id
+        """
+        if index is None:
+            self._get_index_by_id().pop(point_id, None)
+        else:
+            self._get_index_by_id()[point_id] = index
+
+    def get(self, point_id):
+        """ Return view of point with given id, None if there is no such point.
+        :param point_id: str
+        :return: PointView
+        """
+        try:
+            return PointView(self, self.index(point_id))
+        except ValueError:
+            return None
+
+    def get_definition(self, index):
+        """ Return definition of point, rendered at first access.
+        :param index: int
+        :return: str
+        """
+        definition = self.definitions[index]
+        if definition is not None and not isinstance(definition, str):
+            definition = render_definition(definition)
+            self.definitions[index] = definition
+        return definition
+
+    def to_points(self):
+        """ Return list of standalone Point objects.
+        :return: list of Point
+        """
+        return [Point(point_id, lon, lat, _detach_definition(definition))
+                for point_id, lon, lat, definition in zip(self.ids, self.lon, self.lat, self.definitions)]
@@ -34,6 +34,23 @@ class AngleTests(unittest.TestCase):
         self.assertEqual('45-57-32.3S',
                          Angle.convert_dd_to_dms(-45.9589599661111000, AT_LATITUDE, dms_format=AF_DMSH_HYPHEN_SEP, prec=1))
 
+    def test_convert_dd_to_dms_compacted(self):
+        self.assertEqual('1455732.26E',
+                         Angle.convert_dd_to_dms(145.9589599661111000, AT_LONGITUDE, dms_format=AF_DMSH_COMPACTED, prec=2))
+        self.assertEqual('S455732',
+                         Angle.convert_dd_to_dms(-45.9589599661111000, AT_LATITUDE, dms_format=AF_HDMS_COMPACTED, prec=0))
+
+    def test_format_many(self):
+        values = [145.9589599661111000, -145.9589599661111000, 0, -0.5]
+        self.assertEqual([Angle.convert_dd_to_dms(v, AT_LONGITUDE, dms_format=AF_HDMS_HYPHEN_SEP) for v in values],
+                         Angle.format_many(values, AT_LONGITUDE, dms_format=AF_HDMS_HYPHEN_SEP))
+        self.assertEqual('455732.26N;003000.00S',
+                         Angle.format_many([45.9589599661111000, -0.5], AT_LATITUDE, AF_DMSH_COMPACTED, prec=2, sep=';'))
+        # Rounded seconds carry into minutes and degrees
+        self.assertEqual(['60 00 00.000N', '10 00 00.000S'],
+                         Angle.format_many([59.99999999999, -9.9999999999], AT_LATITUDE, AF_DMSH_SPACE_SEP))
+        self.assertEqual('60 00 00.000N', Angle.convert_dd_to_dms(59.99999999999, AT_LATITUDE, AF_DMSH_SPACE_SEP))
+
     def test_normalize_angle(self):
         self.assertEqual('32 44 56.77N', Angle.normalize_angle(' 32 44 56.77N'))
         self.assertEqual('32 44 56.77N', Angle.normalize_angle('32 44 56.77N       '))
@@ -57,3 +74,61 @@ class AngleTests(unittest.TestCase):
         self.assertEqual(None, Angle.dmh_parts_to_dd((100, 5, 'A')))
         self.assertEqual(10.5853833333333333, Angle.dmh_parts_to_dd((10, 35.123, 'N')))
         self.assertEqual(-100.5853833333333333, Angle.dmh_parts_to_dd((100, 35.123, 'W')))
+
+
+class AngleCacheTests(unittest.TestCase):
+
+    def test_get_or_parse_lru(self):
+        cache = AngleCache(maxsize=2)
+        parsed = []
+
+        def parse(ang):
+            parsed.append(ang)
+            return ang
+
+        self.assertEqual('N10', cache.get_or_parse(' n10 ', AT_LATITUDE, parse))
+        cache.get_or_parse('E20', AT_LONGITUDE, parse)
+        cache.get_or_parse(' n10 ', AT_LATITUDE, parse)  # Hit, E20 is the least recently used now
+        cache.get_or_parse('S30', AT_LATITUDE, parse)  # E20 evicted
+        cache.get_or_parse('E20', AT_LONGITUDE, parse)
+        self.assertEqual(['N10', 'E20', 'S30', 'E20'], parsed)
+        self.assertEqual(cache_info(hits=1, misses=4, maxsize=2, currsize=2), cache.info())
+
+        cache.configure(1)
+        self.assertEqual(1, cache.info().currsize)
+        cache.clear()
+        self.assertEqual(cache_info(hits=0, misses=0, maxsize=1, currsize=0), cache.info())
+
+    def test_get_or_parse_disabled(self):
+        cache = AngleCache()
+        cache.get_or_parse('N10', AT_LATITUDE, lambda ang: ang)
+        self.assertEqual(cache_info(hits=0, misses=0, maxsize=0, currsize=0), cache.info())
+
+    def test_get_or_parse_threads(self):
+        cache = AngleCache(maxsize=50)
+        values = ['N{:02d}'.format(i % 100) for i in range(2000)]
+
+        def worker():
+            for value in values:
+                self.assertEqual(value, cache.get_or_parse(value, AT_LATITUDE, lambda ang: ang))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertEqual(8000, info.hits + info.misses)
+        self.assertEqual(50, info.currsize)
+
+    def test_enable_angle_cache(self):
+        enable_angle_cache(maxsize=10)
+        try:
+            from aviation_gis_tools.coordinate import Coordinate
+            for _ in range(3):
+                self.assertAlmostEqual(45.5, Coordinate('0453000E', AT_LONGITUDE).ang_dd)
+            info = angle_cache.info()
+            self.assertEqual((2, 1), (info.hits, info.misses))
+        finally:
+            disable_angle_cache()
+        self.assertEqual(cache_info(hits=0, misses=0, maxsize=0, currsize=0), angle_cache.info())
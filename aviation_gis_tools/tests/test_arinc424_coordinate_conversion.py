@@ -1,4 +1,6 @@
+import math
 import unittest
+from aviation_gis_tools.angle import PARSE_OK, PARSE_ERR_REQUIRED, PARSE_ERR_FORMAT, PARSE_ERR_RANGE
 from aviation_gis_tools.arinc424_coordinate_conversion import *
 
 
@@ -50,3 +52,35 @@ class DistToLonLatTests(unittest.TestCase):
         self.assertEqual('5060W', Arinc424CoordinatesConversion.coord_to_arinc424(lat='50S', lon='060W'))
         self.assertEqual('5060S', Arinc424CoordinatesConversion.coord_to_arinc424(lat='50S', lon='060E'))
         self.assertEqual('50S60', Arinc424CoordinatesConversion.coord_to_arinc424(lat='50S', lon='160E'))
+
+    def test_arinc424_to_coordinates_invalid(self):
+        self.assertEqual('08500W 5700N', Arinc424CoordinatesConversion.arinc424_to_coordinates('5785N'))
+        self.assertEqual('18000E 9000S', Arinc424CoordinatesConversion.arinc424_to_coordinates('90S80'))
+        for code in ['50N81', '9160N', '', '50X60', '5060NN']:
+            self.assertIsNone(Arinc424CoordinatesConversion.arinc424_to_coordinates(code))
+
+    def test_coords_to_arinc424_many(self):
+        coord_pairs = [('160W', '50N'), ('060E', '50S'), ('181E', '50N'), ('160W', ''), ('16W', '50N')]
+        result = Arinc424CoordinatesConversion.coords_to_arinc424_many(coord_pairs)
+        self.assertEqual(['50N60', '5060S', None, None, None], result.codes)
+        self.assertEqual([PARSE_OK, PARSE_OK, PARSE_ERR_RANGE, PARSE_ERR_REQUIRED, PARSE_ERR_FORMAT],
+                         list(result.err_code))
+
+    def test_arinc424_to_coordinates_many(self):
+        result = Arinc424CoordinatesConversion.arinc424_to_coordinates_many(['50N60', '5060S', '50N90', None, 'ABCDE'])
+        self.assertEqual(['16000W 5000N', '06000E 5000S', None, None, None], result.coordinates)
+        self.assertEqual([-160, 60], list(result.lon[:2]))
+        self.assertEqual([50, -50], list(result.lat[:2]))
+        self.assertTrue(math.isnan(result.lon[2]))
+        self.assertEqual([PARSE_OK, PARSE_OK, PARSE_ERR_RANGE, PARSE_ERR_REQUIRED, PARSE_ERR_FORMAT],
+                         list(result.err_code))
+        self.assertEqual('Longitude or latitude out of range.', Arinc424CoordinatesConversion.get_err_msg(PARSE_ERR_RANGE))
+
+    def test_round_trip(self):
+        coord_pairs = [('{:03d}{}'.format(lon, lon_hem), '{:02d}{}'.format(lat, lat_hem))
+                       for lon in range(181) for lat in range(91) for lon_hem in 'EW' for lat_hem in 'NS']
+        codes = Arinc424CoordinatesConversion.coords_to_arinc424_many(coord_pairs)
+        self.assertEqual({PARSE_OK}, set(codes.err_code))
+        coordinates = Arinc424CoordinatesConversion.arinc424_to_coordinates_many(codes.codes)
+        self.assertEqual(['{}00{} {}00{}'.format(lon[:3], lon[3], lat[:2], lat[2]) for lon, lat in coord_pairs],
+                         coordinates.coordinates)
@@ -0,0 +1,80 @@
+import io
+import math
+import unittest
+from aviation_gis_tools.arinc424_records import *
+
+
+def make_record(fields):
+    """ Return 132 columns record with fields placed at given columns (numbered from 1). """
+    line = [' '] * 132
+    for column, value in fields.items():
+        line[column - 1:column - 1 + len(value)] = value
+    return ''.join(line)
+
+
+ENROUTE_WAYPOINT = make_record({1: 'SEUR', 5: 'EA', 7: 'ENRT', 14: 'ABEMI', 20: 'LS', 22: '0', 27: 'W',
+                                33: 'N47265700E008330900', 99: 'ABEMI', 129: '2301'})
+ENROUTE_WAYPOINT_CONTINUATION = make_record({1: 'SEUR', 5: 'EA', 7: 'ENRT', 14: 'ABEMI', 20: 'LS', 22: '2'})
+VHF_NAVAID = make_record({1: 'SEUR', 5: 'D', 14: 'KLO', 20: 'LS', 22: '0', 23: '11440', 28: 'VDHW',
+                          33: 'N47272806E008321405', 94: 'KLOTEN', 129: '2301'})
+NDB_NAVAID = make_record({1: 'SEUR', 5: 'DB', 7: 'LSZH', 14: 'ZH', 20: 'LS', 22: '0', 23: '03610',
+                          33: 'S47270000W008330000', 94: 'ZURICH', 129: '2301'})
+AIRPORT = make_record({1: 'SEUR', 5: 'P', 7: 'LSZH', 11: 'LS', 13: 'A', 14: 'ZRH', 22: '0',
+                       33: 'N47274800E008323900', 94: 'ZURICH', 129: '2301'})
+TERMINAL_WAYPOINT = make_record({1: 'SEUR', 5: 'P', 7: 'LSZH', 11: 'LS', 13: 'C', 14: 'ZH551', 20: 'LS', 22: '0',
+                                 33: 'N47600000E008330900', 99: 'ZH551', 129: '2301'})
+AIRWAY = make_record({1: 'SEUR', 5: 'ER', 14: 'UL613', 22: '0'})
+HEADER = 'HDR01ARINC424 FILE'
+
+
+class Arinc424RecordsTests(unittest.TestCase):
+
+    def get_file(self):
+        return io.StringIO('\n'.join([HEADER, ENROUTE_WAYPOINT, ENROUTE_WAYPOINT_CONTINUATION, VHF_NAVAID,
+                                      NDB_NAVAID, AIRWAY, AIRPORT, TERMINAL_WAYPOINT]) + '\n')
+
+    def test_get_record_type(self):
+        self.assertEqual(RT_ENROUTE_WAYPOINT, get_record_type(ENROUTE_WAYPOINT))
+        self.assertEqual(RT_VHF_NAVAID, get_record_type(VHF_NAVAID))
+        self.assertEqual(RT_NDB_NAVAID, get_record_type(NDB_NAVAID))
+        self.assertEqual(RT_AIRPORT, get_record_type(AIRPORT))
+        self.assertEqual(RT_TERMINAL_WAYPOINT, get_record_type(TERMINAL_WAYPOINT))
+        self.assertIsNone(get_record_type(AIRWAY))
+        self.assertIsNone(get_record_type(HEADER))
+
+    def test_read_records(self):
+        records = list(read_records(self.get_file()))
+        self.assertEqual([RT_ENROUTE_WAYPOINT, RT_VHF_NAVAID, RT_NDB_NAVAID, RT_AIRPORT, RT_TERMINAL_WAYPOINT],
+                         [r.record_type for r in records])
+        self.assertEqual(['ABEMI', 'KLO', 'ZH', 'LSZH', 'ZH551'], [r.ident for r in records])
+        self.assertEqual(['ABEMI', 'KLOTEN', 'ZURICH', 'ZURICH', 'ZH551'], [r.name for r in records])
+        self.assertEqual('11440', records[1].get_field('frequency'))
+        self.assertEqual('2301', records[0].get_field('cycle'))
+
+        self.assertAlmostEqual(47.449166666666666, records[0].lat)
+        self.assertAlmostEqual(8.5525, records[0].lon)
+        self.assertAlmostEqual(-47.45, records[2].lat)
+        self.assertAlmostEqual(-8.55, records[2].lon)
+        self.assertIsNone(records[4].lat)  # 60 minutes
+
+        waypoints = list(read_records(self.get_file(), record_types=[RT_ENROUTE_WAYPOINT], primary_only=False))
+        self.assertEqual(2, len(waypoints))
+
+    def test_read_columns(self):
+        columns = read_columns(self.get_file(), fields=('ident', 'frequency'))
+        self.assertEqual(['ABEMI', 'KLO', 'ZH', 'LSZH', 'ZH551'], columns.fields['ident'])
+        self.assertEqual(['', '11440', '03610', '', ''], columns.fields['frequency'])
+        self.assertEqual([r.lon for r in read_records(self.get_file())][:4], list(columns.lon[:4]))
+        self.assertTrue(math.isnan(columns.lat[4]))
+        self.assertEqual(5, len(columns.record_type))
+
+
+class Arinc424CoordinateTests(unittest.TestCase):
+
+    def test_convert_arinc424_to_dd(self):
+        self.assertEqual(Coordinate.convert_compacted_to_dd('472657.00N', AT_LATITUDE),
+                         Coordinate.convert_arinc424_to_dd('N47265700', AT_LATITUDE))
+        self.assertEqual(Coordinate.convert_compacted_to_dd('0083309.57W', AT_LONGITUDE),
+                         Coordinate.convert_arinc424_to_dd('W008330957', AT_LONGITUDE))
+        for lon in ['E18000001', 'N008330900', 'E00833090', '          ', 'E0083309A0', 'E008600000']:
+            self.assertIsNone(Coordinate.convert_arinc424_to_dd(lon, AT_LONGITUDE))
@@ -88,4 +88,31 @@ class BearingTests(unittest.TestCase):
         self.assertEqual('From bearing is required.', b.err_msg)
 
         b = Bearing('12366.445', "To bearing")
-        self.assertEqual('To bearing value error or format not supported.', b.err_msg)
\ No newline at end of file
+        self.assertEqual('To bearing value error or format not supported.', b.err_msg)
+
+    def test_parse_many(self):
+        bearings = ['1234601.445', '04530,000', ' ', '3610000.000', '12333.55.1']
+        parsed = Bearing.parse_many(bearings)
+
+        self.assertEqual([PARSE_OK, PARSE_OK, PARSE_ERR_REQUIRED, PARSE_ERR_FORMAT, PARSE_ERR_FORMAT],
+                         list(parsed.err_code))
+        self.assertEqual([1, 2, 0, 0, 0], list(parsed.fmt))
+        self.assertAlmostEqual(123.76706805555555, parsed.dd[0])
+        self.assertAlmostEqual(45.5, parsed.dd[1])
+        self.assertEqual('Azimuth is required.', Bearing.get_err_msg(parsed.err_code[2], 'Azimuth'))
+        self.assertEqual('Bearing value error or format not supported.', Bearing.get_err_msg(parsed.err_code[3]))
+
+    def test_convert_brng_to_dd(self):
+        bearings = [
+            ('0000000', 0),
+            ('3000000', 300),
+            ('3593000.5', 359.50013888888889),
+            ('35930', 359.5),
+            ('36000.0', 360),
+            ('04530.000', 45.5)
+        ]
+        for brng, brng_dd in bearings:
+            self.assertAlmostEqual(brng_dd, Bearing.convert_brng_to_dd(brng))
+
+        for brng in ['3600001', '36030', '3700000', '045300', '0453000E']:
+            self.assertIsNone(Bearing.convert_brng_to_dd(brng))
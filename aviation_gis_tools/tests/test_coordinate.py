@@ -139,3 +139,56 @@ class CoordinateTests(unittest.TestCase):
             c = Coordinate(lat_src, AT_LATITUDE)
             self.assertAlmostEqual(lon_dd, c.ang_dd)
             self.assertEqual("", c.err_msg)
+
+    def test_convert_compacted_to_dd_zero(self):
+        self.assertEqual(0, Coordinate.convert_compacted_to_dd('0000000E', AT_LONGITUDE))
+        self.assertEqual(0, Coordinate.convert_compacted_to_dd('N000000.00', AT_LATITUDE))
+
+    def test_parse_many(self):
+        longitudes = ['1800000E', ' e0453000,000 ', '', None, '1800000.1E', 'E0456000.000', '02533.41E', 'W00100.000']
+        parsed = Coordinate.parse_many(longitudes, AT_LONGITUDE)
+
+        self.assertEqual([PARSE_OK, PARSE_OK, PARSE_ERR_REQUIRED, PARSE_ERR_REQUIRED, PARSE_ERR_RANGE,
+                          PARSE_ERR_FORMAT, PARSE_OK, PARSE_OK], list(parsed.err_code))
+        self.assertEqual([1, 2, 0, 0, 1, 0, 3, 4], list(parsed.fmt))
+        self.assertEqual('HDM_COMPACTED', COORDINATE_FORMATS[parsed.fmt[7] - 1])
+        for i, dd in [(0, 180), (1, 45.5), (6, 25.5568333333333333), (7, -1.0)]:
+            self.assertAlmostEqual(dd, parsed.dd[i])
+        self.assertTrue(math.isnan(parsed.dd[2]))
+
+        self.assertEqual("", Coordinate.get_err_msg(parsed.err_code[0], AT_LONGITUDE))
+        self.assertEqual("Longitude is required!", Coordinate.get_err_msg(parsed.err_code[2], AT_LONGITUDE))
+        self.assertEqual("Fix longitude error or not supported format!",
+                         Coordinate.get_err_msg(parsed.err_code[4], AT_LONGITUDE, "Fix longitude"))
+
+    def test_get_compacted_format_candidate(self):
+        longitudes = [
+            ('1800000E', 'DMSH_COMPACTED'),
+            ('W1800000.0', 'HDMS_COMPACTED'),
+            ('02533.41E', 'DMH_COMPACTED'),
+            ('E17701', 'HDM_COMPACTED'),
+            ('12020.55', None),
+            ('W01002545.000', None),
+            ('', None)
+        ]
+        for lon, lon_format in longitudes:
+            self.assertEqual(lon_format, Coordinate.get_compacted_format_candidate(lon, AT_LONGITUDE))
+
+        latitudes = [
+            ('900000N', 'DMSH_COMPACTED'),
+            ('S453000.000', 'HDMS_COMPACTED'),
+            ('2533.41S', 'DMH_COMPACTED'),
+            ('N7701', 'HDM_COMPACTED'),
+            ('S0453000.000', None)
+        ]
+        for lat, lat_format in latitudes:
+            self.assertEqual(lat_format, Coordinate.get_compacted_format_candidate(lat, AT_LATITUDE))
+
+    def test_format_many_round_trip(self):
+        latitudes = [45.9589599661111, -0.5, -89.99999999, 0.0]
+        for dms_format in [AF_DMSH_COMPACTED, AF_HDMS_COMPACTED]:
+            formatted = Angle.format_many(latitudes, AT_LATITUDE, dms_format, prec=2)
+            parsed = Coordinate.parse_many(formatted, AT_LATITUDE)
+            self.assertEqual([PARSE_OK] * 4, list(parsed.err_code))
+            for lat_src, lat_dd in zip(latitudes, parsed.dd):
+                self.assertAlmostEqual(lat_src, lat_dd, places=5)
@@ -1,4 +1,11 @@
+import io
+import math
+import os
+import random
+import re
+import tempfile
 import unittest
+from aviation_gis_tools.coordinate import *
 from aviation_gis_tools.coordinate_extraction import *
 
 
@@ -166,3 +173,344 @@ class CoordinatePairExtractionTests(unittest.TestCase):
             coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, DMSH_SEP, key)
             extracted_coordinates = coord_extractor.extract_coordinates(value)
             self.assertEqual(coordinates, extracted_coordinates)
+
+    def test_extract_coordinates_iter(self):
+        plain_text = """ 51 28 24.111 N 030 01 08 E  51 29 43 N 030 01 26 E
+                51 29 01 N 030 06 12.7889 E   51 29 13.4556 N 030 12 02.445 E
+                51 23 25.988 N 030 20 34 E   51 22 20 N 0
+30 17 35 E """ * 20
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, DMSH_SEP, COORD_PAIR_SEP_SPACE)
+        coordinates = coord_extractor.extract_coordinates(plain_text)
+        self.assertEqual(120, len(coordinates))
+        self.assertEqual(('51 22 20 N', '030 17 35 E'), coordinates[-1])
+
+        # Chunk boundaries fall inside pairs, including boundaries inside seconds decimal part
+        for chunk_size, margin in [(1, None), (7, None), (64, 64), (1000, 256), (10 ** 6, None)]:
+            iter_coordinates = coord_extractor.extract_coordinates_iter(io.StringIO(plain_text), chunk_size, margin)
+            self.assertEqual(coordinates, list(iter_coordinates))
+
+    def test_extract_coordinates_hdms_sep_integer_seconds(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, HDMS_SEP, COORD_PAIR_SEP_SLASH)
+        self.assertEqual([('E030 01 08 ', 'N51 28 24.111 ')],
+                         coord_extractor.extract_coordinates('x E030 01 08 /N51 28 24.111 x'))
+
+    def test_max_pair_length(self):
+        longest = {
+            DMSH_COMP: ('0300108.123456789012E', '512824.123456789012N'),
+            HDMS_COMP: ('E0300108.123456789012', 'N512824.123456789012'),
+            DMSH_SEP: ('030 01 08.123456789012 -E', '51 28 24.123456789012 -N'),
+            HDMS_SEP: ('E030 01 08.123456789012 -', 'N51 28 24.123456789012 -'),
+        }
+        for coord_format, (lon, lat) in longest.items():
+            for coord_sequence, pair in [(SEQUENCE_LON_LAT, (lon, lat)), (SEQUENCE_LAT_LON, (lat, lon))]:
+                coord_extractor = CoordinatePairExtraction(coord_sequence, coord_format, COORD_PAIR_SEP_SLASH)
+                match = coord_extractor.coordinates_pair_regex.match('/'.join(pair))
+                self.assertEqual(coord_extractor.get_max_pair_length(), match.end())
+                # Seconds decimal places are limited
+                too_long = '/'.join(pair).replace('123456789012', '1234567890123')
+                self.assertEqual([], coord_extractor.extract_coordinates(too_long))
+
+    def test_long_seconds_decimals_not_split(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE)
+        self.assertEqual([], coord_extractor.extract_coordinates('0133738.2100000000000E 745632.55N'))
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, HDMS_COMP, COORD_PAIR_SEP_NONE)
+        self.assertEqual([], coord_extractor.extract_coordinates('E0133738.21N745632.5500000000000'))
+        self.assertEqual([], coord_extractor.extract_coordinates('E0133738.21N7456321'))
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, DMSH_SEP, COORD_PAIR_SEP_SPACE)
+        self.assertEqual([('74 56 32.55 N', '013 37 38.21 E')],
+                         coord_extractor.extract_coordinates('74 56 32.55 N 1013 37 38.21 E '
+                                                             '74 56 32.55 N 013 37 38.21 E'))
+        self.assertEqual([('74 56 32.55 N', '013 37 38.21 E')],
+                         coord_extractor.extract_coordinates('Point.74 56 32.55 N 013 37 38.21 E'))
+
+    def test_long_seconds_decimals_not_split_streaming(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE)
+        plain_text = 'x 0133738.2100000000000E 745632.55N 0133738.21E 745632.55N\n' * 20
+        expected = coord_extractor.extract_coordinates(plain_text)
+        self.assertEqual([('0133738.21E', '745632.55N')] * 20, expected)
+        self.assertEqual(expected, [m.pair for m in coord_extractor.extract_coordinates_spans(plain_text)])
+        for chunk_size in (1, 7, 13, 64):
+            self.assertEqual(expected, list(coord_extractor.extract_coordinates_iter(io.StringIO(plain_text),
+                                                                                     chunk_size)))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'coordinates.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(plain_text)
+            for chunk_size in (1, 7, 13, 64):
+                self.assertEqual(expected, [m.pair for m in coord_extractor.extract_coordinates_from_path(path,
+                                                                                                          chunk_size)])
+
+    def test_max_length_pair_followed_by_number_streaming(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, HDMS_COMP, COORD_PAIR_SEP_SPACE)
+        pair_text = 'E0133738.' + '1' * SEC_DECIMALS_MAX + ' N745632.' + '2' * SEC_DECIMALS_MAX
+        self.assertEqual(coord_extractor.get_max_pair_length(), len(pair_text))
+        for suffix, expected_count in [('.5xxxxxx', 0), ('5xxxxxxx', 0), ('.xxxxxxx', 1)]:
+            plain_text = 'xx' + pair_text + suffix
+            expected = coord_extractor.extract_coordinates(plain_text)
+            self.assertEqual(expected_count, len(expected))
+            for chunk_size in (1, 3, 5, 9, 15, 45):
+                self.assertEqual(expected, list(coord_extractor.extract_coordinates_iter(io.StringIO(plain_text),
+                                                                                         chunk_size)))
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'coordinates.txt')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(plain_text)
+                for chunk_size in (1, 3, 5, 9, 15, 45):
+                    for margin in (None, coord_extractor.get_min_margin()):
+                        matches = coord_extractor.extract_coordinates_from_path(path, chunk_size, margin)
+                        self.assertEqual(expected, [m.pair for m in matches])
+
+        with self.assertRaises(ValueError):
+            list(coord_extractor.extract_coordinates_iter(io.StringIO(pair_text), 1, len(pair_text)))
+        with self.assertRaises(ValueError):
+            list(coord_extractor.extract_coordinates_from_path(__file__, 1, len(pair_text)))
+
+    def test_extract_coordinates_iter_empty(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_NONE)
+        self.assertEqual([], list(coord_extractor.extract_coordinates_iter(io.StringIO(''))))
+
+    def test_extract_coordinates_from_path_non_ascii_letters(self):
+        plain_text = 'N74 56 32.55  E013 37 38 é café N74°56′32.55″  E013°37′38″ Zürich N74 56 32.55ż E013 37 38 ł'
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, HDMS_SEP, COORD_PAIR_SEP_SPACE)
+        expected = coord_extractor.extract_coordinates(plain_text)
+        self.assertEqual([('N74 56 32.55 ', 'E013 37 38 '), ('N74°56′32.55″ ', 'E013°37′38″ ')], expected)
+        self.assertTrue(all(re.fullmatch(r'\W', char) for char in MULTIBYTE_NON_WORD))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'coordinates.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(plain_text)
+            self.assertEqual(expected, [m.pair for m in coord_extractor.extract_coordinates_from_path(path)])
+
+    def test_extract_coordinates_from_path(self):
+        plain_text = """ 51°28'24.111"N 030°01'08"E  51 29 43 N 030 01 26 E
+51 29 01 N 030 06 12.7889 E\n\n\n   51 29 13.4556 N 030 12 02.4
+45 E """ * 10
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, DMSH_SEP, COORD_PAIR_SEP_SPACE)
+        coordinates = coord_extractor.extract_coordinates(plain_text)
+        self.assertEqual(40, len(coordinates))
+        self.assertEqual(('51°28\'24.111"N', '030°01\'08"E'), coordinates[0])
+
+        raw_bytes = plain_text.encode('utf-8')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'aip.txt')
+            with open(path, 'wb') as f:
+                f.write(raw_bytes)
+            for chunk_size, margin in [(1, None), (13, None), (1000, 256), (10 ** 6, None)]:
+                matches = list(coord_extractor.extract_coordinates_from_path(path, chunk_size, margin))
+                self.assertEqual(coordinates, [m.pair for m in matches])
+                for m in matches:
+                    normalized = raw_bytes[m.start:m.end].decode('utf-8').replace('\n', '')
+                    self.assertEqual(' '.join(m.pair), normalized)
+
+            empty_path = os.path.join(tmp_dir, 'empty.txt')
+            open(empty_path, 'wb').close()
+            self.assertEqual([], list(coord_extractor.extract_coordinates_from_path(empty_path)))
+
+    def test_extract_coordinates_from_files(self):
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i in range(6):
+                path = os.path.join(tmp_dir, 'aip_{}.txt'.format(i))
+                with open(path, 'w') as f:
+                    f.write('0300108E 512824.111N\n0300126E 5129\n43N ' * i)
+                paths.append(path)
+            paths.append(os.path.join(tmp_dir, 'missing.txt'))
+
+            for max_workers in [1, 2]:
+                results = list(coord_extractor.extract_coordinates_from_files(paths, max_workers=max_workers))
+                self.assertEqual(paths, [r.path for r in results])
+                for i, result in enumerate(results[:-1]):
+                    self.assertEqual([('0300108E', '512824.111N'), ('0300126E', '512943N')] * i,
+                                     result.coordinate_pairs)
+                    self.assertEqual(os.path.getsize(paths[i]), result.size)
+                    self.assertEqual('', result.err_msg)
+                self.assertEqual([], results[-1].coordinate_pairs)
+                self.assertNotEqual('', results[-1].err_msg)
+
+    def test_extract_coordinates_dd(self):
+        plain_text = "AIP 0300108E 512824.111N  0300126E 5129\n43N 1806000E 512943N 0300126E 910000N"
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE)
+        extracted = coord_extractor.extract_coordinates_dd(plain_text)
+        pairs = coord_extractor.extract_coordinates(plain_text)
+
+        self.assertEqual(4, len(extracted.lon))
+        self.assertEqual([0, 0, EXTRACTED_LON_INVALID, EXTRACTED_LAT_INVALID], list(extracted.invalid))
+        self.assertEqual([4, 26, 44, 61], list(extracted.offset))
+        for i, (lon, lat) in enumerate(pairs[:2]):
+            self.assertEqual(Coordinate(lon, AT_LONGITUDE).ang_dd, extracted.lon[i])
+            self.assertEqual(Coordinate(lat, AT_LATITUDE).ang_dd, extracted.lat[i])
+        self.assertTrue(math.isnan(extracted.lon[2]))
+        self.assertEqual(51.49527777777778, extracted.lat[2])
+        self.assertTrue(math.isnan(extracted.lat[3]))
+
+    def test_extract_coordinates_dd_sep(self):
+        plain_text = """ N51 28 24.111 W030 01 08.5 S51°29'43" E030°01'26" """
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LAT_LON, HDMS_SEP, COORD_PAIR_SEP_NONE)
+        extracted = coord_extractor.extract_coordinates_dd(plain_text)
+        self.assertEqual([1, 28], list(extracted.offset))
+        self.assertEqual([0, 0], list(extracted.invalid))
+        self.assertEqual([-30.019027777777776, 30.023888888888887], list(extracted.lon))
+        self.assertEqual([51.47336416666667, -51.49527777777778], list(extracted.lat))
+
+    def test_extract_coordinates_dd_same_pairs(self):
+        rnd = random.Random(2)
+
+        def random_number(min_length, max_length):
+            return ''.join(rnd.choice('0123456789') for _ in range(rnd.randint(min_length, max_length)))
+
+        def random_coordinate(hemispheres, hemisphere_first, compacted):
+            # Parts of random length, seconds with random number of decimal places
+            parts = [random_number(1, 3), random_number(1, 2), random_number(1, 2)]
+            if rnd.random() < 0.5:
+                parts[2] += '.' + random_number(1, 14)
+            if compacted:
+                coordinate = ''.join(parts)
+            else:
+                coordinate = ''.join(part + rnd.choice([' ', '°', "'", '"', '-']) for part in parts)
+            hemisphere = rnd.choice(hemispheres)
+            return hemisphere + coordinate if hemisphere_first else coordinate + hemisphere
+
+        texts = []
+        for _ in range(200):
+            hemisphere_first, compacted = rnd.random() < 0.5, rnd.random() < 0.5
+            pairs = [random_coordinate(first, hemisphere_first, compacted) + ' ' +
+                     random_coordinate(second, hemisphere_first, compacted)
+                     for first, second in [rnd.choice([('EW', 'NS'), ('NS', 'EW')]) for _ in range(5)]]
+            texts.append(' '.join(pairs))
+        texts.append('013 37 38.21 E 74 5 32.55 N')
+        for coord_format in (DMSH_COMP, HDMS_COMP, DMSH_SEP, HDMS_SEP):
+            for coord_sequence in (SEQUENCE_LON_LAT, SEQUENCE_LAT_LON):
+                coord_extractor = CoordinatePairExtraction(coord_sequence, coord_format, COORD_PAIR_SEP_SPACE)
+                for plain_text in texts:
+                    spans = coord_extractor.extract_coordinates_spans(plain_text)
+                    extracted = coord_extractor.extract_coordinates_dd(plain_text)
+                    self.assertEqual([m.start for m in spans], list(extracted.offset), plain_text)
+                    for m, lon, lat in zip(spans, extracted.lon, extracted.lat):
+                        lon_src, lat_src = m.pair if coord_sequence == SEQUENCE_LON_LAT else reversed(m.pair)
+                        for src, ang_type, dd in [(lon_src, AT_LONGITUDE, lon), (lat_src, AT_LATITUDE, lat)]:
+                            expected = Coordinate(src, ang_type).ang_dd
+                            if expected is not None and not math.isnan(dd):
+                                self.assertAlmostEqual(expected, dd, places=9, msg=src)
+
+    def test_extract_coordinates_spans(self):
+        plain_text = "AIP 0300108E 512824.111N  0300126E 5129\n43N"
+        coord_extractor = CoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE)
+        self.assertEqual([coord_pair_match(4, 24, ('0300108E', '512824.111N')),
+                          coord_pair_match(26, 43, ('0300126E', '512943N'))],
+                         coord_extractor.extract_coordinates_spans(plain_text))
+
+
+class IncrementalCoordinatePairExtractionTests(unittest.TestCase):
+
+    def test_apply_edit(self):
+        plain_text = "Boundary 0300108E 512824.111N - 0300126E 5129\n43N then along border\n" * 50
+        extractor = IncrementalCoordinatePairExtraction(SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_SPACE, plain_text)
+        self.assertEqual(100, len(extractor.matches))
+
+        edits = [
+            (9, 0, 'x'),  # Breaks pair
+            (9, 1, ''),  # Restores pair
+            (44, 1, ''),  # Joins seconds of latitude into 7 digits - pair no longer valid
+            (44, 0, '9'),
+            (3000, 60, ''),  # Removes pairs
+            (0, 0, '0300108E 512824.111N\n'),  # Inserts pair
+            (21, 1, ' '),  # Replaces new line
+            (len(plain_text) - 100, 0, '0300108E 5128\n\n24.111N'),
+        ]
+        for offset, removed_length, inserted_text in edits:
+            old_matches = extractor.matches
+            removed, added = extractor.apply_edit(offset, removed_length, inserted_text)
+            self.assertEqual(extractor.extract_coordinates_spans(extractor.plain_text), extractor.matches)
+            self.assertTrue(all(m in old_matches for m in removed))
+            self.assertTrue(all(m in extractor.matches for m in added))
+            self.assertLess(len(added), 5)
+
+        with self.assertRaises(ValueError):
+            extractor.apply_edit(len(extractor.plain_text), 1, '')
+
+    def test_apply_edit_next_to_pair(self):
+        extractor = IncrementalCoordinatePairExtraction(SEQUENCE_LAT_LON, DMSH_COMP, COORD_PAIR_SEP_SPACE,
+                                                        '5745632N 0133738E')
+        self.assertEqual([], extractor.matches)
+        extractor.apply_edit(0, 1, '')
+        self.assertEqual([coord_pair_match(0, 16, ('745632N', '0133738E'))], extractor.matches)
+        extractor.apply_edit(0, 0, '5')
+        self.assertEqual([], extractor.matches)
+        extractor.apply_edit(0, 1, 'x')
+        self.assertEqual([coord_pair_match(1, 17, ('745632N', '0133738E'))], extractor.matches)
+        extractor.apply_edit(0, 1, '5')
+        self.assertEqual([], extractor.matches)
+
+        extractor = IncrementalCoordinatePairExtraction(SEQUENCE_LAT_LON, HDMS_COMP, COORD_PAIR_SEP_SPACE,
+                                                        'N745632 E01337385')
+        self.assertEqual([], extractor.matches)
+        extractor.apply_edit(16, 1, '')
+        self.assertEqual([coord_pair_match(0, 16, ('N745632', 'E0133738'))], extractor.matches)
+        extractor.apply_edit(16, 0, '5')
+        self.assertEqual([], extractor.matches)
+
+        # Pair of maximum length, digit after it is read by lookahead
+        pair_text = 'N745632.' + '2' * SEC_DECIMALS_MAX + ' E0133738.' + '1' * SEC_DECIMALS_MAX
+        extractor.set_text(pair_text + '.5')
+        self.assertEqual([], extractor.matches)
+        extractor.apply_edit(len(pair_text) + 1, 1, '')
+        self.assertEqual(extractor.extract_coordinates_spans(pair_text + '.'), extractor.matches)
+        self.assertEqual(1, len(extractor.matches))
+
+    def test_apply_edit_random(self):
+        rnd = random.Random(3)
+        pieces = ['745632N 0133738E', '745632.55N 0133738.21E', '1', '.', '5', ' ', '\n', 'x', 'N', 'E']
+        for coord_sequence, coord_format in [(SEQUENCE_LAT_LON, DMSH_COMP), (SEQUENCE_LON_LAT, HDMS_SEP),
+                                             (SEQUENCE_LAT_LON, DMSH_SEP)]:
+            text = ''.join(rnd.choice(pieces) for _ in range(200))
+            extractor = IncrementalCoordinatePairExtraction(coord_sequence, coord_format, COORD_PAIR_SEP_SPACE, text)
+            for _ in range(300):
+                offset = rnd.randint(0, len(extractor.plain_text))
+                removed_length = rnd.randint(0, min(3, len(extractor.plain_text) - offset))
+                inserted_text = ''.join(rnd.choice(pieces) for _ in range(rnd.randint(0, 2)))
+                extractor.apply_edit(offset, removed_length, inserted_text)
+                self.assertEqual(extractor.extract_coordinates_spans(extractor.plain_text), extractor.matches)
+
+
+class MultiFormatCoordinatePairExtractionTests(unittest.TestCase):
+
+    def test_extract_coordinates(self):
+        plain_text = """ 0300108E512824.111N  51 29 43 N 030 01 26 E
+            N745632.55/E0133738.21   0300126E512943N 5129
+01N-0300612.7889E """
+        extractor = MultiFormatCoordinatePairExtraction()
+        tagged_pairs = extractor.extract_coordinates(plain_text)
+
+        expected = [
+            ((SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_NONE), ('0300108E', '512824.111N')),
+            ((SEQUENCE_LAT_LON, DMSH_SEP, COORD_PAIR_SEP_SPACE), ('51 29 43 N', '030 01 26 E')),
+            ((SEQUENCE_LAT_LON, HDMS_COMP, COORD_PAIR_SEP_SLASH), ('N745632.55', 'E0133738.21')),
+            ((SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_NONE), ('0300126E', '512943N')),
+            ((SEQUENCE_LAT_LON, DMSH_COMP, COORD_PAIR_SEP_HYPHEN), ('512901N', '0300612.7889E')),
+        ]
+        self.assertEqual(expected, [(tuple(p.settings), p.pair) for p in tagged_pairs])
+
+        # Each pair is the same as extracted by single settings extractor
+        for settings, pair in tagged_pairs:
+            self.assertIn(pair, CoordinatePairExtraction(*settings).extract_coordinates(plain_text))
+
+        dominant_settings, count = extractor.get_dominant_settings()
+        self.assertEqual((SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_NONE), tuple(dominant_settings))
+        self.assertEqual(2, count)
+        self.assertEqual([('0300108E', '512824.111N'), ('0300126E', '512943N')],
+                         extractor.get_dominant_extractor().extract_coordinates(plain_text))
+
+    def test_regex_cache(self):
+        settings = [(SEQUENCE_LAT_LON, DMSH_SEP, COORD_PAIR_SEP_SPACE), (SEQUENCE_LON_LAT, DMSH_COMP, COORD_PAIR_SEP_NONE)]
+        extractor1 = MultiFormatCoordinatePairExtraction(settings)
+        extractor2 = MultiFormatCoordinatePairExtraction(settings)
+        self.assertIs(extractor1.coordinates_pair_regex, extractor2.coordinates_pair_regex)
+        self.assertIsNone(extractor1.get_dominant_settings())
+        self.assertIsNone(extractor1.get_dominant_extractor())
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            MultiFormatCoordinatePairExtraction([])
+        with self.assertRaises(ValueError):
+            MultiFormatCoordinatePairExtraction([(SEQUENCE_LAT_LON, 'DMS', COORD_PAIR_SEP_SPACE)])
@@ -53,3 +53,153 @@ class AngleTests(unittest.TestCase):
         ellipsoid_name = 'WGS84'
         self.assertEqual((139.58969185673908, -33.8212028224309),
                          vincenty_direct_solution(lon_initial, lat_initial, azimuth_initial, distance, ellipsoid_name))
+
+    def test_vincenty_direct_solution_batch(self):
+        lons = [0.0, 0.0, 0.0, 137.5]
+        lats = [0.0, 0.0, 0.0, -32.5]
+        azimuths = [0.0, 90.0, 180.0, 127.5]
+        distances = [10000.0, 10000.0, 1000.0, 243855.411]
+
+        lon_end, lat_end = vincenty_direct_solution_batch(lons, lats, azimuths, distances)
+        for i in range(len(lons)):
+            self.assertEqual(vincenty_direct_solution(lons[i], lats[i], azimuths[i], distances[i]),
+                             (lon_end[i], lat_end[i]))
+
+    def test_vincenty_direct_solution_batch_broadcast(self):
+        lon_end, lat_end = vincenty_direct_solution_batch(137.5, -32.5, [0.0, 127.5], 243855.411)
+        self.assertEqual(2, len(lon_end))
+        self.assertEqual((139.58969185673908, -33.8212028224309), (lon_end[1], lat_end[1]))
+
+        with self.assertRaises(ValueError):
+            vincenty_direct_solution_batch([0.0, 1.0], 0.0, [0.0, 90.0, 180.0], 1000.0)
+
+    def test_vincenty_inverse_solution(self):
+        # Flinders Peak - Buninyong, example from Vincenty's paper
+        lon1, lat1 = 144 + 25 / 60 + 29.52440 / 3600, -(37 + 57 / 60 + 3.72030 / 3600)
+        lon2, lat2 = 143 + 55 / 60 + 35.38390 / 3600, -(37 + 39 / 60 + 10.15610 / 3600)
+        distance, azimuth_fwd, azimuth_back = vincenty_inverse_solution(lon1, lat1, lon2, lat2)
+        self.assertAlmostEqual(54972.271, distance, places=2)
+        self.assertAlmostEqual(306 + 52 / 60 + 5.37 / 3600, azimuth_fwd, places=5)
+        self.assertAlmostEqual(127 + 10 / 60 + 25.07 / 3600, azimuth_back, places=5)
+
+        self.assertEqual((0.0, 0.0, 0.0), vincenty_inverse_solution(lon1, lat1, lon1, lat1))
+
+    def test_vincenty_inverse_solution_direct_round_trip(self):
+        lon_end, lat_end = vincenty_direct_solution(137.5, -32.5, 127.5, 243855.411)
+        distance, azimuth_fwd, _ = vincenty_inverse_solution(137.5, -32.5, lon_end, lat_end)
+        self.assertAlmostEqual(243855.411, distance, places=4)
+        self.assertAlmostEqual(127.5, azimuth_fwd, places=9)
+
+    def test_vincenty_inverse_solution_antimeridian(self):
+        # Longitude difference is normalized, points on both sides of antimeridian are close
+        distance, azimuth_fwd, azimuth_back = vincenty_inverse_solution(-179.9, 0.0, 179.9, 0.0)
+        self.assertAlmostEqual(22263.898, distance, places=3)
+        self.assertEqual((270.0, 90.0), (azimuth_fwd, azimuth_back))
+        for value, expected in zip(vincenty_inverse_solution(0.0, 0.5, 359.7, -0.5),
+                                   vincenty_inverse_solution(0.0, 0.5, -0.3, -0.5)):
+            self.assertAlmostEqual(expected, value, places=6)
+
+        expected = vincenty_inverse_solution(170.0, -20.0, -175.0, -25.0)
+        self.assertAlmostEqual(1638442.983, expected[0], places=3)
+        solution = vincenty_inverse_solution_batch([170.0], [-20.0], [-175.0], [-25.0])
+        self.assertEqual(expected, (solution.distance[0], solution.azimuth_fwd[0], solution.azimuth_back[0]))
+        solution = vincenty_inverse_matrix([170.0], [-20.0], [-175.0], [-25.0])
+        self.assertEqual(expected, (solution.distance[0], solution.azimuth_fwd[0], solution.azimuth_back[0]))
+
+    def test_vincenty_inverse_solution_antipodal(self):
+        with self.assertRaises(ValueError):
+            vincenty_inverse_solution(0.0, 0.5, 179.7, -0.5)
+
+        solution = vincenty_inverse_solution_batch([0.0, 0.0], [0.5, 0.0], [179.7, 1.0], [-0.5, 0.0])
+        self.assertEqual([0, 1], list(solution.converged))
+        self.assertTrue(math.isnan(solution.distance[0]))
+        self.assertAlmostEqual(111319.491, solution.distance[1], places=3)
+
+    def test_vincenty_inverse_matrix(self):
+        lons_from, lats_from = [0.0, 10.0], [0.0, 50.0]
+        lons_to, lats_to = [1.0, 20.0, 30.0], [1.0, 55.0, -10.0]
+        solution = vincenty_inverse_matrix(lons_from, lats_from, lons_to, lats_to)
+        self.assertEqual(6, len(solution.distance))
+        for i in range(2):
+            for j in range(3):
+                expected = vincenty_inverse_solution(lons_from[i], lats_from[i], lons_to[j], lats_to[j])
+                self.assertEqual(expected, (solution.distance[i * 3 + j], solution.azimuth_fwd[i * 3 + j],
+                                            solution.azimuth_back[i * 3 + j]))
+
+    def test_fixed_origin_direct_solver(self):
+        azimuths = [0.0, 90.0, 127.5, 270.0]
+        distances = [1000.0, 10000.0, 243855.411]
+        solver = FixedOriginDirectSolver(137.5, -32.5, azimuths)
+
+        lon_end, lat_end = solver.solve(distances)
+        self.assertEqual(12, len(lon_end))
+        for i, azimuth in enumerate(azimuths):
+            for j, distance in enumerate(distances):
+                self.assertEqual(vincenty_direct_solution(137.5, -32.5, azimuth, distance),
+                                 (lon_end[i * 3 + j], lat_end[i * 3 + j]))
+
+        ring_lon, ring_lat = solver.solve_ring(243855.411)
+        self.assertEqual((139.58969185673908, -33.8212028224309), (ring_lon[2], ring_lat[2]))
+
+        radial_lon, radial_lat = solver.solve_radial(2, distances)
+        self.assertEqual(list(lon_end[6:9]), list(radial_lon))
+
+    def test_karney_direct_solution(self):
+        cases = [
+            (0.0, 0.0, 0.0, 10000.0),
+            (0.0, 0.0, 90.0, 10000.0),
+            (137.5, -32.5, 127.5, 243855.411),
+            (-75.0, 40.0, 45.0, 5000000.0),
+            (170.0, -10.0, 270.0, 15000000.0),
+        ]
+        for case in cases:
+            lon_end, lat_end = karney_direct_solution(*case)
+            # Karney end point is on the geodesic given by distance and azimuth from initial point
+            distance, azimuth_fwd, _ = vincenty_inverse_solution(case[0], case[1], lon_end, lat_end)
+            self.assertAlmostEqual(case[3], distance, places=3)
+            self.assertAlmostEqual(case[2] % 360, azimuth_fwd, places=9)
+
+        for vincenty, karney in zip(vincenty_direct_solution(137.5, -32.5, 127.5, 243855.411),
+                                    karney_direct_solution(137.5, -32.5, 127.5, 243855.411)):
+            self.assertAlmostEqual(vincenty, karney, places=10)
+
+    def test_direct_solution_solver_selection(self):
+        args = (137.5, -32.5, 127.5, 243855.411)
+        self.assertEqual(vincenty_direct_solution(*args), direct_solution(*args))
+        self.assertEqual(karney_direct_solution(*args), direct_solution(*args, solver=DIRECT_SOLVER_KARNEY))
+
+        set_default_direct_solver(DIRECT_SOLVER_KARNEY)
+        try:
+            self.assertEqual(DIRECT_SOLVER_KARNEY, get_default_direct_solver())
+            self.assertEqual(karney_direct_solution(*args), direct_solution(*args))
+        finally:
+            set_default_direct_solver(DIRECT_SOLVER_VINCENTY)
+
+        with self.assertRaises(ValueError):
+            set_default_direct_solver('DIRECT_SOLVER_UNKNOWN')
+
+    def test_select_direct_solver(self):
+        self.assertEqual(DIRECT_SOLVER_SPHERICAL, select_direct_solver(100000.0, 1000.0))
+        self.assertEqual(DIRECT_SOLVER_MID_LATITUDE, select_direct_solver(10000.0, 1.0))
+        self.assertEqual(DIRECT_SOLVER_VINCENTY, select_direct_solver(10000.0, 0.001))
+        self.assertEqual(DIRECT_SOLVER_VINCENTY, select_direct_solver(10000.0, 1.0, lat_initial=88.95))
+        self.assertEqual(DIRECT_SOLVER_KARNEY, select_direct_solver(10000.0, 1e-6))
+
+    def test_direct_solution_tolerance(self):
+        args = (17.0, 52.0, 127.5, 25000.0)
+        lon_ref, lat_ref = vincenty_direct_solution(*args)
+        for tolerance in [1000.0, 10.0, 0.01, 1e-6]:
+            lon_end, lat_end = direct_solution(*args, tolerance=tolerance)
+            distance, _, _ = vincenty_inverse_solution(lon_ref, lat_ref, lon_end, lat_end)
+            self.assertLessEqual(distance, tolerance)
+
+        self.assertEqual(spherical_direct_solution(*args), direct_solution(*args, tolerance=1000.0))
+        self.assertEqual(mid_latitude_direct_solution(*args), direct_solution(*args, tolerance=10.0))
+
+    def test_mid_latitude_direct_solution_over_pole(self):
+        for args in [(0.0, 90.0, 0.0, 1000.0), (10.0, 89.995, 0.0, 1000.0), (10.0, -89.995, 180.0, 1000.0)]:
+            lon_end, lat_end = mid_latitude_direct_solution(*args)
+            self.assertLessEqual(math.fabs(lat_end), 90.0)
+            distance, _, _ = vincenty_inverse_solution(*vincenty_direct_solution(*args), lon_end, lat_end)
+            self.assertLess(distance, 0.001)
+        self.assertEqual(DIRECT_SOLVER_VINCENTY, select_direct_solver(1000.0, 1.0, lat_initial=90.0))
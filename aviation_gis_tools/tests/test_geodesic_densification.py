@@ -0,0 +1,123 @@
+import unittest
+from aviation_gis_tools.geodesic_densification import *
+from aviation_gis_tools.geodesic_densification import _lateral_errors, _points_along_lines
+from aviation_gis_tools.point_set import PointSet
+
+
+def azimuth_difference(azimuth1, azimuth2):
+    return (azimuth1 - azimuth2 + 180) % 360 - 180
+
+
+class GeodesicDensificationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.center = Point('ARP', 17.0, 52.0)
+
+    def test_get_arc_vertex_count(self):
+        self.assertEqual(10, get_arc_vertex_count(1000.0, 90, vertex_count=10))
+        # Step 2 * acos(1 - 1 / 10000) = 1.62 degrees
+        self.assertEqual(57, get_arc_vertex_count(10000.0, 90, max_deviation=1.0))
+        self.assertEqual(2, get_arc_vertex_count(10.0, 90, max_deviation=100.0))
+
+        with self.assertRaises(ValueError):
+            get_arc_vertex_count(1000.0, 90)
+        with self.assertRaises(ValueError):
+            get_arc_vertex_count(1000.0, 90, vertex_count=10, max_deviation=1.0)
+        with self.assertRaises(ValueError):
+            get_arc_vertex_count(1000.0, 90, vertex_count=1)
+
+    def test_get_sweep_angle(self):
+        self.assertEqual(90, get_sweep_angle(350, 80, ARC_CW))
+        self.assertEqual(270, get_sweep_angle(350, 80, ARC_CCW))
+        self.assertEqual(360, get_sweep_angle(45, 45, ARC_CW))
+        with self.assertRaises(ValueError):
+            get_sweep_angle(0, 90, 'ARC_UNKNOWN')
+
+    def test_densify_circle(self):
+        circle = densify_circle(self.center, 5000.0, vertex_count=36)
+        self.assertEqual(36, len(circle.lon))
+        for i in range(36):
+            distance, azimuth, _ = vincenty_inverse_solution(17.0, 52.0, circle.lon[i], circle.lat[i])
+            self.assertAlmostEqual(5000.0, distance, places=4)
+            self.assertAlmostEqual(0.0, azimuth_difference(i * 10.0, azimuth), places=6)
+
+        circle = densify_circle(self.center, 5000.0, max_deviation=1.0)
+        # Step 2 * acos(1 - 1 / 5000) = 2.29 degrees
+        self.assertEqual(158, len(circle.lon))
+
+    def test_densify_arc(self):
+        start = Point('A', *vincenty_direct_solution(17.0, 52.0, 350.0, 10000.0))
+        end = Point('B', *vincenty_direct_solution(17.0, 52.0, 80.0, 10000.0))
+
+        arc = densify_arc(self.center, start, end, ARC_CW, vertex_count=10)
+        self.assertEqual(10, len(arc.lon))
+        self.assertEqual((start._lon, start._lat), (arc.lon[0], arc.lat[0]))
+        self.assertEqual((end._lon, end._lat), (arc.lon[-1], arc.lat[-1]))
+        _, azimuth, _ = vincenty_inverse_solution(17.0, 52.0, arc.lon[1], arc.lat[1])
+        self.assertAlmostEqual(0.0, azimuth_difference(0.0, azimuth), places=6)
+
+        arc = densify_arc(self.center, start, end, ARC_CCW, vertex_count=28)
+        _, azimuth, _ = vincenty_inverse_solution(17.0, 52.0, arc.lon[1], arc.lat[1])
+        self.assertAlmostEqual(0.0, azimuth_difference(340.0, azimuth), places=6)
+
+    def test_densify_sector(self):
+        sector = densify_sector(self.center, 10000.0, 0.0, 90.0, vertex_count=4)
+        self.assertEqual(5, len(sector.lon))
+        self.assertEqual((17.0, 52.0), (sector.lon[-1], sector.lat[-1]))
+
+        sector = densify_sector(self.center, 10000.0, 0.0, 90.0, inner_radius=5000.0, vertex_count=4)
+        self.assertEqual(8, len(sector.lon))
+        distance, azimuth, _ = vincenty_inverse_solution(17.0, 52.0, sector.lon[4], sector.lat[4])
+        self.assertAlmostEqual(5000.0, distance, places=4)
+        self.assertAlmostEqual(90.0, azimuth, places=6)
+
+        with self.assertRaises(ValueError):
+            densify_sector(self.center, 1000.0, 0.0, 90.0, inner_radius=2000.0, vertex_count=4)
+
+    def test_densify_geodesic_lines(self):
+        starts = [Point('A', 17.0, 52.0), Point('C', -10.0, 60.0)]
+        ends = [Point('B', 18.0, 52.0), Point('D', 30.0, 65.0)]
+
+        lines = densify_geodesic_lines(starts, ends, vertex_count=5)
+        self.assertEqual([0, 5, 10], list(lines.offsets))
+        self.assertEqual((18.0, 52.0), (lines.lon[4], lines.lat[4]))
+        self.assertEqual((-10.0, 60.0), (lines.lon[5], lines.lat[5]))
+        distance, _, _ = vincenty_inverse_solution(17.0, 52.0, lines.lon[2], lines.lat[2])
+        self.assertAlmostEqual(distance, vincenty_inverse_solution(18.0, 52.0, lines.lon[2], lines.lat[2])[0],
+                               places=4)
+
+        lines = densify_geodesic_lines(starts, ends, spacing=10000.0)
+        # 68.7 km and 2 096 km
+        self.assertEqual([0, 8, 219], list(lines.offsets))
+
+    def test_densify_point_views(self):
+        start = Point('A', *vincenty_direct_solution(17.0, 52.0, 350.0, 10000.0))
+        end = Point('B', *vincenty_direct_solution(17.0, 52.0, 80.0, 10000.0))
+        center_view, start_view, end_view = PointSet.from_points([self.center, start, end])
+
+        self.assertEqual(list(densify_circle(self.center, 5000.0, vertex_count=36).lon),
+                         list(densify_circle(center_view, 5000.0, vertex_count=36).lon))
+        self.assertEqual(list(densify_arc(self.center, start, end, ARC_CW, vertex_count=10).lat),
+                         list(densify_arc(center_view, start_view, end_view, ARC_CW, vertex_count=10).lat))
+        self.assertEqual(list(densify_sector(self.center, 10000.0, 0.0, 90.0, vertex_count=4).lon),
+                         list(densify_sector(center_view, 10000.0, 0.0, 90.0, vertex_count=4).lon))
+        self.assertEqual(list(densify_geodesic_lines([start], [end], vertex_count=5).lon),
+                         list(densify_geodesic_lines([start_view], [end_view], vertex_count=5).lon))
+
+    def test_densify_geodesic_lines_max_lateral_error(self):
+        starts = [Point('A', 17.0, 52.0), Point('C', -10.0, 60.0)]
+        ends = [Point('B', 17.1, 52.0), Point('D', 30.0, 65.0)]
+        lines = densify_geodesic_lines(starts, ends, max_lateral_error=100.0)
+        self.assertEqual(2, lines.offsets[1])
+        vertex_count = lines.offsets[2] - lines.offsets[1]
+        self.assertGreater(vertex_count, 2)
+
+        # Vertex count is the smallest of 2, 3, 5, 9, ... that meets lateral error
+        azimuth_distance = vincenty_inverse_solution(-10.0, 60.0, 30.0, 65.0)
+        for count, is_valid in [(vertex_count, True), ((vertex_count + 1) // 2, False)]:
+            lons, lats = _points_along_lines(starts[1:], [azimuth_distance[1]], [azimuth_distance[0]],
+                                             [2 * count - 1], 'WGS84')
+            self.assertEqual(is_valid, _lateral_errors(lons, lats, count)[0] <= 100.0)
+
+        with self.assertRaises(ValueError):
+            densify_geodesic_lines(starts, ends, spacing=1000.0, vertex_count=3)
@@ -1,5 +1,6 @@
 import unittest
 from aviation_gis_tools.point_calculation import *
+from aviation_gis_tools.point_set import PointSet
 
 
 class PointTests(unittest.TestCase):
@@ -34,3 +35,99 @@ class PointTests(unittest.TestCase):
                                  "format!{0} latitude error or not supported format!".format(p.ref_id), p.ref_err)
             self.assertIsNone(p.ref_lon.ang_dd)
             self.assertIsNone(p.ref_lat.ang_dd)
+
+    def test_point_geodesic_to(self):
+        ref_point = Point('REF', 137.5, -32.5)
+        point = Point.from_polar_coordinates(ref_point=ref_point, point_id='P1',
+                                             distance=Distance('243855.411'), azimuth=Bearing('1273000'))
+        distance, azimuth_fwd, azimuth_back = ref_point.geodesic_to(point)
+        self.assertAlmostEqual(243855.411, distance, places=4)
+        self.assertAlmostEqual(127.5, azimuth_fwd, places=9)
+        self.assertAlmostEqual(distance, point.geodesic_to(ref_point)[0], places=6)
+
+        point_view = PointSet.from_points([point])[0]
+        self.assertEqual((distance, azimuth_fwd, azimuth_back), ref_point.geodesic_to(point_view))
+
+    def test_point_from_polar_coordinates_tolerance(self):
+        ref_point = Point('REF', 17.0, 52.0)
+        exact = Point.from_polar_coordinates(ref_point=ref_point, point_id='P1',
+                                             distance=Distance('25', UOM_KM), azimuth=Bearing('1273000'))
+        approx = Point.from_polar_coordinates(ref_point=ref_point, point_id='P1',
+                                              distance=Distance('25', UOM_KM), azimuth=Bearing('1273000'),
+                                              tolerance=10.0)
+        self.assertLessEqual(exact.geodesic_to(approx)[0], 10.0)
+        self.assertNotEqual((exact._lon, exact._lat), (approx._lon, approx._lat))
+
+    def test_point_lazy_definition(self):
+        ref_point = Point.from_raw_coordinates(point_id='REF', lon=Coordinate('E0170000', AT_LONGITUDE),
+                                               lat=Coordinate('N520000', AT_LATITUDE))
+        point = Point.from_polar_coordinates(ref_point=ref_point, point_id='P1',
+                                             distance=Distance('25', UOM_KM), azimuth=Bearing('0900000'))
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual('Ref: REF E0170000 N520000; Dist: 25 km; Azm: 0900000', point.definition)
+        offset_point = Point.from_offset(ref_point=point, point_id='P2', distance=Distance('1', UOM_KM),
+                                         azimuth=Bearing('0900000'), offset_side='LEFT',
+                                         offset_distance=Distance('500'))
+        self.assertEqual('Ref: P1 Ref: REF E0170000 N520000; Dist: 25 km; Azm: 0900000; Dist: 1 km; Azm: 0900000; '
+                         'Offset side: LEFT; Offset dist: 500 m', offset_point.definition)
+
+    def test_calculate_polar_and_offset(self):
+        ref = PointCalculation('REF', 'E0170000', 'N520000')
+        result = ref.calculate_polar(Distance('25', UOM_KM), Bearing('0900000'))
+        self.assertEqual('', result.err)
+        self.assertEqual((result.lon, result.lat), ref.point_by_polar_coordinates(Distance('25', UOM_KM),
+                                                                                  Bearing('0900000')))
+        result = ref.calculate_offset(Distance('25', UOM_KM), Bearing('0900000'), 'LEFT', Distance('1', UOM_KM))
+        self.assertEqual((result.lon, result.lat), ref.point_by_offset(Distance('25', UOM_KM), Bearing('0900000'),
+                                                                       'LEFT', Distance('1', UOM_KM)))
+        self.assertGreater(result.lat, 52)
+
+        result = ref.calculate_polar(Distance('-25', UOM_KM), Bearing('0900000'))
+        self.assertEqual((None, None), (result.lon, result.lat))
+        self.assertTrue(result.err)
+        self.assertEqual('', ref.calc_err)
+        self.assertEqual('Offset side UP not supported!',
+                         ref.calculate_offset(Distance('25'), Bearing('0900000'), 'UP', Distance('1')).err)
+        self.assertTrue(PointCalculation('REF', 'E0170000', 'N920000').calculate_polar(Distance('25'),
+                                                                                       Bearing('0900000')).err)
+
+    def test_calculate_many(self):
+        ref = PointCalculation('REF', 'E0170000', 'N520000')
+        requests = [(Distance(str(i), UOM_KM), Bearing('{:03d}0000'.format(i * 7))) for i in range(1, 40)]
+        requests += [(Distance('5', UOM_KM), Bearing('0900000'), 'RIGHT', Distance('1', UOM_KM)),
+                     (Distance('x'), Bearing('0900000'))]
+        expected = [ref.calculate(request) for request in requests]
+        self.assertTrue(expected[-1].err)
+        self.assertEqual(expected, ref.calculate_many(requests))
+        self.assertEqual(expected, ref.calculate_many(requests, max_workers=1))
+        self.assertEqual(expected, ref.calculate_many(requests, executor=EXECUTOR_PROCESS, max_workers=2,
+                                                      chunk_size=8))
+        with self.assertRaises(ValueError):
+            ref.calculate_many(requests, executor='EXECUTOR_GPU')
+
+    def test_validate_polar_values(self):
+        rows = [('P1', 25000, 90), ('P2', '1000.5', 45.5, 'LEFT', 500.0), ('', 10, 10), ('P4', 0, 10),
+                ('P5', 10, 361), ('P6', 10, 'x'), ('P7', 10, 10, 'UP', 10), ('P8', 10, 10, 'RIGHT', -1),
+                ('P9', float('nan'), 10)]
+        result = validate_polar_values(rows)
+        self.assertEqual(validated_polar('P1', 25000.0, 90.0, None, None), result.records[0])
+        self.assertEqual(validated_polar('P2', 1000.5, 45.5, 'LEFT', 500.0), result.records[1])
+        self.assertEqual(['', '', 'Point ident required. ', 'Distance value error. ', 'Bearing value error. ',
+                          'Bearing value error. ', 'Offset side UP not supported. ', 'Offset distance value error. ',
+                          'Distance value error. '], result.errors)
+        self.assertEqual([None] * 7, result.records[2:])
+
+    def test_point_from_validated(self):
+        ref_point = Point('REF', 17.0, 52.0, 'E0170000 N520000')
+        records = validate_polar_values([('P1', 25000, 90), ('P2', 25000, 90, 'LEFT', 1000)]).records
+        polar = Point.from_validated(ref_point, records[0])
+        expected = Point.from_polar_coordinates(ref_point=ref_point, point_id='P1', distance=Distance('25000'),
+                                                azimuth=Bearing('0900000'))
+        self.assertEqual((expected.lon, expected.lat), (polar.lon, polar.lat))
+        self.assertEqual('Ref: REF E0170000 N520000; Dist: 25000.0 m; Azm: 90.0', polar.definition)
+
+        offset = Point.from_validated(ref_point, records[1])
+        expected = Point.from_offset(ref_point=ref_point, point_id='P2', distance=Distance('25000'),
+                                     azimuth=Bearing('0900000'), offset_side='LEFT', offset_distance=Distance('1000'))
+        self.assertEqual((expected.lon, expected.lat), (offset.lon, offset.lat))
+        self.assertEqual('P2', offset.point_id)
@@ -0,0 +1,175 @@
+import math
+import unittest
+from aviation_gis_tools.point_definitions import *
+
+
+def raw(point_id, lon, lat):
+    return point_definition(point_id, PD_RAW, lon=Coordinate(lon, AT_LONGITUDE), lat=Coordinate(lat, AT_LATITUDE))
+
+
+def polar(point_id, ref_id, distance, azimuth):
+    return point_definition(point_id, PD_POLAR, ref_id=ref_id, distance=Distance(distance, UOM_KM),
+                            azimuth=Bearing(azimuth))
+
+
+def offset(point_id, ref_id, distance, azimuth, offset_side, offset_distance):
+    return point_definition(point_id, PD_OFFSET, ref_id=ref_id, distance=Distance(distance, UOM_KM),
+                            azimuth=Bearing(azimuth), offset_side=offset_side,
+                            offset_distance=Distance(offset_distance, UOM_KM))
+
+
+class PointDefinitionsTests(unittest.TestCase):
+
+    def test_chained_references_in_any_order(self):
+        rows = [offset('C', 'B', '5', '0900000', 'LEFT', '2'),
+                polar('B', 'A', '10', '0450000'),
+                raw('A', 'E0170000', 'N520000'),
+                polar('D', 'B', '3', '1800000')]
+        result = calculate_point_definitions(rows)
+        self.assertEqual(['', '', '', ''], result.errors)
+        self.assertEqual([[2], [1], [0, 3]], result.levels)
+
+        ref_point = Point.from_raw_coordinates(point_id='A', lon=rows[2].lon, lat=rows[2].lat)
+        b = Point.from_polar_coordinates(ref_point=ref_point, point_id='B', distance=rows[1].distance,
+                                         azimuth=rows[1].azimuth)
+        c = Point.from_offset(ref_point=b, point_id='C', distance=rows[0].distance, azimuth=rows[0].azimuth,
+                              offset_side='LEFT', offset_distance=rows[0].offset_distance)
+        for point, i in [(ref_point, 2), (b, 1), (c, 0)]:
+            view = result.points[i]
+            self.assertEqual(point.point_id, view.point_id)
+            self.assertAlmostEqual(point.lon, view.lon, places=12)
+            self.assertAlmostEqual(point.lat, view.lat, places=12)
+            self.assertEqual(point.definition, view.definition)
+
+    def test_row_errors(self):
+        rows = [raw('A', 'E0170000', 'N520000'),
+                raw('A', 'E0180000', 'N520000'),
+                raw('', 'E0170000', 'N520000'),
+                raw('E', 'N0170000', 'N520000'),
+                polar('F', 'X', '10', '0450000'),
+                polar('G', 'F', '10', '0450000'),
+                offset('H', 'A', '10', '0450000', 'UP', '1'),
+                polar('I', 'A', '-10', '0450000'),
+                point_definition('J', 'CIRCLE')]
+        result = calculate_point_definitions(rows)
+        self.assertEqual('', result.errors[0])
+        self.assertEqual('Point ident A not unique. ', result.errors[1])
+        self.assertEqual('Point ident required. ', result.errors[2])
+        self.assertTrue(result.errors[3])
+        self.assertEqual('Reference point X not found. ', result.errors[4])
+        self.assertEqual('Reference point F error. ', result.errors[5])
+        self.assertEqual('Offset side UP not supported. ', result.errors[6])
+        self.assertTrue(result.errors[7])
+        self.assertEqual('Point definition type CIRCLE not supported. ', result.errors[8])
+        self.assertEqual(len(rows), len(result.points))
+        self.assertTrue(all(math.isnan(lon) for lon in result.points.lon[1:]))
+
+    def test_circular_references(self):
+        rows = [raw('A', 'E0170000', 'N520000'),
+                polar('B', 'C', '10', '0450000'),
+                polar('C', 'D', '10', '0450000'),
+                polar('D', 'B', '10', '0450000'),
+                polar('E', 'D', '10', '0450000'),
+                polar('F', 'F', '10', '0450000'),
+                polar('G', 'A', '10', '0450000')]
+        result = calculate_point_definitions(rows)
+        cycle_err = 'Circular reference: B -> C -> D -> B. '
+        self.assertEqual(['', cycle_err, cycle_err, cycle_err, 'Reference point D error. ',
+                          'Circular reference: F -> F. ', ''], result.errors)
+        self.assertEqual([[0], [6]], result.levels)
+
+
+class PointGraphTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [raw('NAV', 'E0170000', 'N520000'),
+                     polar('A', 'NAV', '10', '0450000'),
+                     offset('B', 'A', '5', '0900000', 'LEFT', '2'),
+                     polar('C', 'B', '3', '1800000'),
+                     raw('ARP', 'E0180000', 'N530000'),
+                     polar('D', 'ARP', '7', '2700000')]
+        self.graph = PointGraph(self.rows)
+
+    def test_update_recalculates_downstream_only(self):
+        diff = self.graph.update([raw('NAV', 'E0170100', 'N520000')])
+        self.assertEqual([0, 1, 2, 3], diff.recalculated)
+        self.assertEqual(['NAV', 'A', 'B', 'C'], [point.point_id for point in diff.moved])
+        self.assertAlmostEqual(17.0, diff.moved[0].lon_old)
+        self.assertAlmostEqual(17 + 1 / 60, diff.moved[0].lon)
+
+        expected = calculate_point_definitions([raw('NAV', 'E0170100', 'N520000')] + self.rows[1:])
+        self.assertEqual(list(expected.points.lon), list(self.graph.points.lon))
+        self.assertEqual(list(expected.points.lat), list(self.graph.points.lat))
+        self.assertEqual(expected.points[3].definition, self.graph.points[3].definition)
+
+    def test_update_without_movement(self):
+        diff = self.graph.update([polar('D', 'ARP', '7', '2700000')])
+        self.assertEqual([5], diff.recalculated)
+        self.assertEqual([], diff.moved)
+
+    def test_update_reference_and_add_points(self):
+        diff = self.graph.update([polar('B', 'ARP', '5', '0900000'), polar('E', 'F', '1', '0000000')])
+        self.assertEqual([2, 3, 6], diff.recalculated)
+        self.assertEqual('Reference point F not found. ', self.graph.errors[6])
+        self.assertEqual(['B', 'C'], [point.point_id for point in diff.moved])
+
+        diff = self.graph.update([raw('F', 'E0190000', 'N540000')])
+        self.assertEqual([6, 7], diff.recalculated)
+        self.assertEqual(['', ''], self.graph.errors[6:])
+        self.assertEqual(['E', 'F'], [point.point_id for point in diff.moved])
+
+    def test_remove_and_cycles(self):
+        diff = self.graph.update(removed_ids=['A'])
+        self.assertEqual([1, 2, 3], diff.recalculated)
+        self.assertEqual(['Point removed. ', 'Reference point A not found. ', 'Reference point B error. '],
+                         self.graph.errors[1:4])
+        self.assertTrue(all(math.isnan(point.lon) for point in diff.moved))
+
+        self.graph.update([polar('A', 'C', '10', '0450000')])
+        self.assertEqual('Circular reference: B -> A -> C -> B. ', self.graph.errors[2])
+
+        self.graph.update([polar('A', 'NAV', '10', '0450000')])
+        self.assertEqual(['', 'Point removed. ', '', '', '', '', ''], self.graph.errors)
+        with self.assertRaises(ValueError):
+            self.graph.update(removed_ids=['X'])
+
+    def test_exported_points_keep_definitions(self):
+        point = self.graph.points[1].to_point()
+        points = self.graph.points.to_points()
+        point_set = self.graph.points[:4]
+        expected = self.graph.points[3].definition
+        self.graph.update([raw('NAV', 'E0170100', 'N520000')])
+        self.assertNotEqual(expected, self.graph.points[3].definition)
+        self.assertEqual('Ref: NAV E0170000 N520000; Dist: 10 km; Azm: 0450000', point.definition)
+        self.assertEqual(expected, points[3].definition)
+        self.assertEqual(expected, point_set[3].definition)
+
+    def test_remove_point_with_not_unique_ident(self):
+        graph = PointGraph([raw('NAV', 'E0170000', 'N520000'), polar('A', 'NAV', '10', '0450000'),
+                            raw('NAV', 'E0180000', 'N530000')])
+        self.assertEqual('Point ident NAV not unique. ', graph.errors[2])
+        diff = graph.update(removed_ids=['NAV'])
+        self.assertEqual([0, 1, 2], diff.recalculated)
+        self.assertEqual(['Point removed. ', '', ''], graph.errors)
+        self.assertEqual('Ref: NAV E0180000 N530000; Dist: 10 km; Azm: 0450000', graph.points[1].definition)
+
+        graph.update(removed_ids=['NAV'])
+        self.assertEqual(['Point removed. ', 'Reference point NAV not found. ', 'Point removed. '], graph.errors)
+
+    def test_remove_and_add_point_with_the_same_ident(self):
+        self.graph.update(removed_ids=['A'])
+        self.assertIsNone(self.graph.points.get('A'))
+        self.graph.update([polar('A', 'NAV', '10', '0450000')])
+        self.assertEqual(6, self.graph.points.index('A'))
+        point = self.graph.points.get('A')
+        self.assertEqual(self.graph.points.lon[6], point.lon)
+        self.assertFalse(math.isnan(point.lat))
+
+        graph = PointGraph([raw('NAV', 'E0170000', 'N520000'), raw('NAV', 'E0180000', 'N530000')])
+        self.assertEqual(0, graph.points.index('NAV'))
+        graph.update(removed_ids=['NAV'])
+        self.assertEqual(1, graph.points.index('NAV'))
+
+
+if __name__ == '__main__':
+    unittest.main()
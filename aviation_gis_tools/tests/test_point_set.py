@@ -0,0 +1,66 @@
+import unittest
+from aviation_gis_tools.point_set import *
+
+
+class PointSetTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ref_point = Point('REF', 17.0, 52.0, 'E0170000 N520000')
+        self.points = [self.ref_point] + [
+            Point.from_polar_coordinates(ref_point=self.ref_point, point_id=f'P{i}',
+                                         distance=Distance(str(i), UOM_KM), azimuth=Bearing(f'{i * 10:03d}0000'))
+            for i in range(1, 6)]
+        self.point_set = PointSet.from_points(self.points)
+
+    def test_columns(self):
+        self.assertEqual(6, len(self.point_set))
+        self.assertEqual(['REF', 'P1', 'P2', 'P3', 'P4', 'P5'], self.point_set.ids)
+        self.assertEqual([p.lon for p in self.points], list(self.point_set.lon))
+        self.assertEqual([p.lat for p in self.points], list(self.point_set.lat))
+        self.assertEqual(8 * 6, memoryview(self.point_set.lon).nbytes)
+
+    def test_views(self):
+        view = self.point_set[1]
+        self.assertEqual(('P1', self.points[1].lon, self.points[1].lat), (view.point_id, view.lon, view.lat))
+        self.assertEqual('Ref: REF E0170000 N520000; Dist: 1 km; Azm: 0100000', view.definition)
+        self.assertEqual('P5', self.point_set[-1].point_id)
+        self.assertEqual(['REF', 'P1', 'P2', 'P3', 'P4', 'P5'], [view.point_id for view in self.point_set])
+        with self.assertRaises(IndexError):
+            self.point_set[6]
+
+    def test_view_as_reference_point(self):
+        point = Point.from_polar_coordinates(ref_point=self.point_set[0], point_id='P6',
+                                             distance=Distance('1', UOM_KM), azimuth=Bearing('0100000'))
+        self.assertEqual((self.points[1].lon, self.points[1].lat), (point.lon, point.lat))
+        self.assertEqual('Ref: REF E0170000 N520000; Dist: 1 km; Azm: 0100000', point.definition)
+
+    def test_slicing(self):
+        subset = self.point_set[1:6:2]
+        self.assertIsInstance(subset, PointSet)
+        self.assertEqual(['P1', 'P3', 'P5'], subset.ids)
+        self.assertEqual(self.points[3].lat, subset.lat[1])
+        self.assertEqual(2, subset.index('P5'))
+
+    def test_lookup_by_id(self):
+        self.assertEqual(3, self.point_set.index('P3'))
+        self.assertIsNone(self.point_set.get('P9'))
+        self.point_set.append('P9', 1.0, 2.0)
+        self.assertEqual((1.0, 2.0), (self.point_set.get('P9').lon, self.point_set.get('P9').lat))
+        with self.assertRaises(ValueError):
+            self.point_set.index('P10')
+
+        self.point_set.append('P3', 3.0, 4.0)
+        self.assertEqual(3, self.point_set.index('P3'))
+        self.point_set.set_index('P3', len(self.point_set) - 1)
+        self.assertEqual((3.0, 4.0), (self.point_set.get('P3').lon, self.point_set.get('P3').lat))
+        self.point_set.set_index('P3', None)
+        self.assertIsNone(self.point_set.get('P3'))
+
+    def test_to_points(self):
+        points = PointSet.from_points(self.point_set).to_points()
+        self.assertEqual([p.point_id for p in self.points], [p.point_id for p in points])
+        self.assertEqual([p.definition for p in self.points], [p.definition for p in points])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Throughput of the compacted coordinate and bearing parsing: format dispatching parser
+(Coordinate.convert_compacted_to_dd, Bearing.convert_brng_to_dd) compared with the previous implementation
+that tried every regular expression and matched each of them twice (match, then search).
+Usage: python -m benchmarks.bench_angle_parsing
+"""
+import random
+import timeit
+
+from aviation_gis_tools.bearing import *
+from aviation_gis_tools.coordinate import *
+
+
+def legacy_convert_compacted_to_dd(ang, ang_type):
+    """ Coordinate.convert_compacted_to_dd before format dispatching. """
+    dd = None
+    for coord_type, pattern in COORDINATE_COMPACTED[ang_type].items():
+        if pattern.match(ang):
+            if coord_type in ['DMSH_COMPACTED', 'HDMS_COMPACTED']:
+                dmsh_parts = pattern.search(ang)
+                dd = Coordinate.dmsh_parts_to_dd((int(dmsh_parts.group('deg')), int(dmsh_parts.group('min')),
+                                                  float(dmsh_parts.group('sec')), dmsh_parts.group('hem')))
+            elif coord_type in ['DMH_COMPACTED', 'HDM_COMPACTED']:
+                dmh_parts = pattern.search(ang)
+                dd = Coordinate.dmh_parts_to_dd((int(dmh_parts.group('deg')), float(dmh_parts.group('min')),
+                                                 dmh_parts.group('hem')))
+    if dd is not None and Coordinate.is_coordinate_within_range(dd, ang_type):
+        return dd
+
+
+def legacy_convert_brng_to_dd(brng_src):
+    """ Bearing.convert_brng_to_dd before format dispatching. """
+    for brng_format, pattern in BEARING_COMPACTED.items():
+        if pattern.match(brng_src):
+            parts = pattern.search(brng_src)
+            dd = int(parts.group('deg')) + float(parts.group('min')) / 60
+            if brng_format == 'DMS_COMPACTED':
+                dd += float(parts.group('sec')) / 3600
+            if Bearing.is_within_range(dd):
+                return dd
+
+
+def sample_coordinates(count, seed=0):
+    """ Return AIP-like mix of longitudes and latitudes: mostly DMSH with seconds decimals, some HDMS, DMH
+    and invalid values. """
+    rnd = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        ang_type = rnd.choice([AT_LONGITUDE, AT_LATITUDE])
+        deg_width, deg_max = (3, 179) if ang_type == AT_LONGITUDE else (2, 89)
+        hem = rnd.choice('EW' if ang_type == AT_LONGITUDE else 'NS')
+        d, m, s = rnd.randint(0, deg_max), rnd.randint(0, 59), rnd.uniform(0, 59.99)
+        kind = rnd.random()
+        if kind < 0.5:
+            ang = f'{d:0{deg_width}d}{m:02d}{s:05.2f}{hem}'
+        elif kind < 0.75:
+            ang = f'{hem}{d:0{deg_width}d}{m:02d}{int(s):02d}'
+        elif kind < 0.95:
+            ang = f'{d:0{deg_width}d}{m + s / 60:05.2f}{hem}'
+        else:
+            ang = f'{d:0{deg_width}d} {m:02d} {s:05.2f}{hem}'  # Not supported
+        samples.append((ang, ang_type))
+    return samples
+
+
+def sample_bearings(count, seed=0):
+    rnd = random.Random(seed)
+    return [f'{rnd.randint(0, 359):03d}{rnd.randint(0, 59):02d}{rnd.uniform(0, 59.9):04.1f}' if rnd.random() < 0.7
+            else f'{rnd.randint(0, 359):03d}{rnd.uniform(0, 59.9):04.1f}' for _ in range(count)]
+
+
+def main(count=100000, repeat=3):
+    coordinates = sample_coordinates(count)
+    bearings = sample_bearings(count)
+
+    for ang, ang_type in coordinates:
+        assert legacy_convert_compacted_to_dd(ang, ang_type) == Coordinate.convert_compacted_to_dd(ang, ang_type)
+
+    cases = [
+        ('coordinates before', lambda: [legacy_convert_compacted_to_dd(a, t) for a, t in coordinates]),
+        ('coordinates after', lambda: [Coordinate.convert_compacted_to_dd(a, t) for a, t in coordinates]),
+        ('bearings before', lambda: [legacy_convert_brng_to_dd(b) for b in bearings]),
+        ('bearings after', lambda: [Bearing.convert_brng_to_dd(b) for b in bearings]),
+    ]
+    for label, func in cases:
+        elapsed = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f'{label:20} {count / elapsed:12,.0f} values/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Throughput of coordinate pair extraction on adversarial text (long digit and separator runs, as in OCR output)
+for growing text sizes. Throughput has to stay flat: coordinate patterns have only bounded quantifiers,
+so every match attempt takes constant time. Patterns with unbounded seconds decimal places are measured for
+comparison.
+Usage: python -m benchmarks.bench_coordinate_extraction
+"""
+import re
+import timeit
+
+from aviation_gis_tools.coordinate_extraction import *
+
+LEGACY_COORD_PAIR_PATTERNS = {
+    DMSH_COMP: (r'\d{7}\.\d+[EW]|\d{7}[EW]', r'\d{6}\.\d+[NS]|\d{6}[NS]'),
+    HDMS_COMP: (r'[EW]\d{7}\.\d+|[EW]\d{7}', r'[NS]\d{6}\.\d+|[NS]\d{6}'),
+    DMSH_SEP: (r'\d{1,3}\W\d{1,2}\W\d{1,2}\.\d+\W{1,2}[EW]|\d{1,3}\W\d{1,2}\W\d{1,2}\W{1,2}[EW]',
+               r'\d{1,2}\W\d{2}\W\d{1,2}\.\d+\W{1,2}[NS]|\d{1,2}\W\d{1,2}\W\d{1,2}\W{1,2}[NS]'),
+    HDMS_SEP: (r'[EW]\d{1,3}\W\d{1,2}\W\d{1,2}\.\d+\W{1,2}|[EW]\d{1,3}\W\d{1,2}\W\d{1,2}\{1,2}W',
+               r'[NS]\d{1,2}\W\d{2}\W\d{1,2}\.\d+\W{1,2}|[NS]\d{1,2}\W\d{1,2}\W\d{1,2}\W{1,2}')
+}
+
+ADVERSARIAL_SAMPLES = {
+    'digit run': '1',
+    'long decimals': '12 34 56.' + '7' * 1000 + ' ',
+    'separator run': '1 1 1 ',
+    'dotted numbers': '12.34.56.78 ',
+    'hemisphere noise': '0300108.' + '1' * 50 + 'X',
+    'separated noise': 'N51 28 24.' + '4' * 30 + '-- ',
+}
+
+
+def legacy_regex(coord_format, coord_sep):
+    lon_pattern, lat_pattern = LEGACY_COORD_PAIR_PATTERNS[coord_format]
+    return re.compile('(?P<lat>' + lat_pattern + ')' + re.escape(coord_sep) + '(?P<lon>' + lon_pattern + ')')
+
+
+def main(sizes=(100000, 1000000, 4000000), repeat=3):
+    for coord_format in (DMSH_COMP, HDMS_COMP, DMSH_SEP, HDMS_SEP):
+        regexes = [
+            ('before', legacy_regex(coord_format, COORD_PAIR_SEP_SPACE)),
+            ('after', CoordinatePairExtraction(SEQUENCE_LAT_LON, coord_format,
+                                               COORD_PAIR_SEP_SPACE).coordinates_pair_regex),
+        ]
+        print(coord_format)
+        for label, sample in ADVERSARIAL_SAMPLES.items():
+            for regex_label, regex in regexes:
+                throughput = []
+                for size in sizes:
+                    text = (sample * (size // len(sample) + 1))[:size]
+                    elapsed = min(timeit.repeat(lambda: regex.findall(text), number=1, repeat=repeat))
+                    throughput.append(f'{size / elapsed / 1e6:8.1f}')
+                print(f'  {label:18} {regex_label:7} MB/s for sizes {sizes}: {" ".join(throughput)}')
+
+
+if __name__ == '__main__':
+    main()